@@ -0,0 +1,5 @@
+from flask import Blueprint
+
+batch_bp = Blueprint("batch", __name__)
+
+from . import routes
@@ -0,0 +1,44 @@
+from flask import current_app, jsonify, request
+from jose.exceptions import JWTError
+from . import batch_bp
+from app.extensions import batch_dispatcher
+from app.utils.batch import parse_batch
+from app.utils.util import decode_token, get_bearer_token
+
+
+# -----------------------------
+# POST: run several API calls in one request
+# -----------------------------
+@batch_bp.post("", strict_slashes=False)
+def run_batch():
+    data = request.get_json(silent=True)
+    try:
+        subs = parse_batch(data, batch_dispatcher.max_requests)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    # Sub-requests carry the batch's Authorization header; verifying it
+    # once here leaves them a token cache hit instead of a JWT decode
+    headers = {}
+    if "Cookie" in request.headers:
+        headers["Cookie"] = request.headers["Cookie"]
+    token = get_bearer_token()
+    if token:
+        headers["Authorization"] = request.headers["Authorization"]
+        try:
+            decode_token(token)
+        except JWTError:
+            pass  # each sub-request reports its own 401/403
+
+    responses, set_cookies = batch_dispatcher.run(
+        current_app._get_current_object(),
+        subs,
+        headers,
+        {"REMOTE_ADDR": request.remote_addr},
+        parallel=data.get("parallel") is True,
+    )
+    # Cookies set by sub-requests (e.g. the read-your-writes pin) reach the client
+    response = jsonify({"responses": responses})
+    for cookie in set_cookies:
+        response.headers.add("Set-Cookie", cookie)
+    return response, 200
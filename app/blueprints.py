@@ -0,0 +1,43 @@
+import os
+from importlib import import_module
+from app.utils.compression import asset_url
+
+SWAGGER_URL = '/api/docs' #Sets the endpoint for our documentation
+# Grabs the host from our swagger file; the content hash lets it be cached long-term
+API_URL = asset_url(os.path.join(os.path.dirname(__file__), "static"), "swagger.yaml")
+
+# -----------------------------
+# Blueprint manifest
+# -----------------------------
+# (package, blueprint attribute, url_prefix), registered in this order by
+# create_app. Packages are imported on registration, not when app is
+# imported, so scripts and CLI commands that only need the models skip
+# every route and schema module.
+BLUEPRINTS = [
+    ("app.customers", "customers_bp", "/customers"),
+    ("app.mechanics", "mechanics_bp", "/mechanics"),
+    ("app.service_tickets", "service_tickets_bp", "/service_tickets"),
+    ("app.service_ticket_mechanics", "service_ticket_mechanics_bp", "/service_ticket_mechanics"),
+    ("app.vehicles", "vehicles_bp", "/vehicles"),
+    ("app.inventory", "inventory_bp", "/inventory"),
+    ("app.diagnostics", "diagnostics_bp", "/diagnostics"),
+    ("app.jobs", "jobs_bp", "/jobs"),
+    ("app.batch", "batch_bp", "/batch"),
+]
+
+
+def register_blueprints(app):
+    for package, attribute, url_prefix in BLUEPRINTS:
+        app.register_blueprint(getattr(import_module(package), attribute), url_prefix=url_prefix)
+
+    from flask_swagger_ui import get_swaggerui_blueprint
+
+    swagger_bp = get_swaggerui_blueprint(
+        SWAGGER_URL,
+        API_URL,
+        config={
+            'app_name': "MechanicAPI"
+        }
+    )
+    app.register_blueprint(swagger_bp, url_prefix=SWAGGER_URL)
+
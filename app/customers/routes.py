@@ -1,11 +1,25 @@
 from flask import request, jsonify
 from . import customers_bp
-from app.models import Customer
-from .schemas import customer_schema, customers_schema, login_schema
-from app.extensions import db, limiter, cache
+from app.models import Customer, Vehicle
+from app.extensions import db, limiter, password_hasher
 from app.utils.util import encode_token, token_required
-from werkzeug.security import generate_password_hash, check_password_hash
+from app.utils.caching import versioned_cache, versioned_json_response, register_version_scope
+from app.utils.replicas import replica_reads
+from app.service_tickets.loaders import (
+    customer_ticket_page,
+    customer_ticket_scopes,
+    customer_tickets_scope,
+)
 from marshmallow import ValidationError
+from app.utils.lazy import lazy_import
+
+# GET /customers/my-tickets page sizes
+MY_TICKETS_PAGE_SIZE = 50
+MY_TICKETS_MAX_PAGE_SIZE = 200
+
+customer_schema, customers_schema, login_schema = lazy_import(
+    "app.customers.schemas", "customer_schema", "customers_schema", "login_schema"
+)
 
 
 # -----------------------------
@@ -14,15 +28,13 @@ from marshmallow import ValidationError
 @customers_bp.get("/")
 @limiter.limit("5 per minute")
 def get_customers():
-    cached = cache.get("all_customers")
-    if cached:
-        return jsonify(cached)
-
-    customers = Customer.query.all()
-    data = customers_schema.dump(customers)
-
-    cache.set("all_customers", data, timeout=60)
-    return jsonify(data)
+    # Customers dump their vehicle ids, so either table invalidates
+    return versioned_json_response(
+        "customers:all",
+        [Customer.__tablename__, Vehicle.__tablename__],
+        lambda: customers_schema.dump(Customer.query.all()),
+        timeout=60
+    )
 
 
 # -----------------------------
@@ -37,10 +49,7 @@ def create_customer():
         return jsonify({"error": "No input data provided"}), 400
 
     if "password" in data:
-        data["password"] = generate_password_hash(
-            data["password"],
-            method="pbkdf2:sha256"
-        )
+        data["password"] = password_hasher.hash(data["password"])
 
     try:
         new_customer = customer_schema.load(data, session=db.session)
@@ -50,7 +59,6 @@ def create_customer():
     db.session.add(new_customer)
     db.session.commit()
 
-    cache.delete("all_customers")
     return jsonify(customer_schema.dump(new_customer)), 201
 
 
@@ -75,7 +83,6 @@ def update_customer(customer_id, id):
             setattr(customer, field, data[field])
 
     db.session.commit()
-    cache.delete("all_customers")
 
     return jsonify(customer_schema.dump(customer))
 
@@ -99,7 +106,6 @@ def delete_customer(customer_id, id):
 
     db.session.delete(customer)
     db.session.commit()
-    cache.delete("all_customers")
 
     return jsonify({"message": "Customer deleted"})
 
@@ -117,12 +123,16 @@ def login():
 
     customer = Customer.query.filter_by(email=data["email"]).first()
 
-    if not customer or not check_password_hash(
+    if not customer or not password_hasher.verify(
         customer.password,
         data["password"]
     ):
         return jsonify({"error": "Invalid credentials"}), 401
 
+    if password_hasher.needs_rehash(customer.password):
+        customer.password = password_hasher.hash(data["password"])
+        db.session.commit()
+
     token = encode_token(customer.id)
     return jsonify({
         "token": token,
@@ -134,21 +144,39 @@ def login():
 # GET CURRENT CUSTOMER'S TICKETS
 # -----------------------------
 @customers_bp.get("/my-tickets")
+@replica_reads
 @token_required
 def my_tickets(customer_id):
-    customer = Customer.query.get_or_404(customer_id)
-
-    tickets = [
-        ticket
-        for vehicle in customer.vehicles
-        for ticket in vehicle.service_tickets
-    ]
-
-    return jsonify([
-        {
-            "id": t.id,
-            "description": t.description,
-            "status": t.status
-        }
-        for t in tickets
-    ])
+    statuses = sorted({s.strip() for s in request.args.get("status", "").split(",") if s.strip()})
+    try:
+        after = request.args.get("cursor")
+        after = int(after) if after else None
+        limit = int(request.args.get("limit", MY_TICKETS_PAGE_SIZE))
+    except ValueError:
+        return jsonify({"error": "cursor and limit must be integers"}), 400
+    if not 1 <= limit <= MY_TICKETS_MAX_PAGE_SIZE:
+        return jsonify({"error": f"limit must be between 1 and {MY_TICKETS_MAX_PAGE_SIZE}"}), 400
+
+    # One query per page, cached until this customer's tickets or
+    # vehicles change (other customers' writes leave it alone)
+    tickets, next_cursor = versioned_cache(
+        f"my_tickets:{customer_id}:{','.join(statuses)}:{after}:{limit}",
+        [customer_tickets_scope(customer_id)],
+        lambda: customer_ticket_page(customer_id, statuses, after, limit)
+    )
+
+    # Only an empty first page needs to tell a deleted customer apart
+    if not tickets and after is None and db.session.get(Customer, customer_id) is None:
+        return jsonify({"message": "Customer not found"}), 404
+
+    response = jsonify(tickets)
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = str(next_cursor)
+    return response
+
+
+@customers_bp.record_once
+def _track_customer_ticket_versions(state):
+    # Bumps customer_tickets_scope(id) whenever a flush touches that
+    # customer's tickets or vehicles
+    register_version_scope(customer_ticket_scopes)
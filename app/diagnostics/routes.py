@@ -0,0 +1,14 @@
+from flask import jsonify, current_app
+from . import diagnostics_bp
+from app.extensions import db
+from app.utils.pool import pool_status
+from app.utils.util import mechanic_token_required
+
+
+# -----------------------------
+# GET connection pool metrics
+# -----------------------------
+@diagnostics_bp.get("/pool")
+@mechanic_token_required
+def get_pool_status(current_mechanic_id):
+    return jsonify(pool_status(current_app, db))
@@ -3,13 +3,33 @@ from flask_marshmallow import Marshmallow
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 from flask_caching import Cache
+from app.utils.passwords import PasswordHasher
+from app.utils.profiler import SQLProfiler
+from app.utils.jobs import JobRunner
+from app.utils.compression import Compressor
+from app.utils.batch import BatchDispatcher, in_batch
+from app.utils.replicas import RoutingSession
+from app.utils.ratelimit import SQLiteStorage  # noqa: F401 (registers sqlite:// limiter storage)
 
-db = SQLAlchemy()
+# Reads in replica_reads views go to the "replica" bind when configured
+db = SQLAlchemy(session_options={"class_": RoutingSession})
 ma = Marshmallow()
 
 limiter = Limiter(
     key_func=get_remote_address,
-    default_limits=["200 per day", "50 per hour"]  # optional global protection
+    default_limits=["200 per day", "50 per hour"],  # optional global protection
+    # A POST /batch counts once; its sub-requests only hit per-route limits
+    default_limits_exempt_when=in_batch
 )
 
 cache = Cache(config={"CACHE_TYPE": "SimpleCache"})
+
+password_hasher = PasswordHasher()
+
+sql_profiler = SQLProfiler()
+
+job_runner = JobRunner()
+
+compressor = Compressor()
+
+batch_dispatcher = BatchDispatcher()
@@ -1,20 +1,59 @@
-from flask import request, jsonify
+from flask import request, jsonify, current_app
 from . import inventory_bp
 from app.models import Inventory
-from .schemas import InventorySchema
+from .search import search_inventory, MIN_QUERY_LENGTH, DEFAULT_LIMIT, MAX_LIMIT
 from app.extensions import db
 from app.utils.util import mechanic_token_required  # optional auth
+from app.utils.caching import versioned_json_response
+from app.utils.lazy import lazy_import
+from app.utils.replicas import replica_reads
 
-inventory_schema = InventorySchema()
-inventories_schema = InventorySchema(many=True)
+inventory_schema, inventory_projection = lazy_import(
+    "app.inventory.schemas", "inventory_schema", "inventory_projection"
+)
+iter_ndjson_rows, iter_csv_rows, import_rows = lazy_import(
+    "app.inventory.importer", "iter_ndjson_rows", "iter_csv_rows", "import_rows"
+)
 
 # -----------------------------
 # GET all inventory
 # -----------------------------
 @inventory_bp.get("/")
+@replica_reads
 def get_inventory():
-    items = Inventory.query.all()
-    return jsonify(inventories_schema.dump(items))
+    return versioned_json_response(
+        "inventory:all",
+        [Inventory.__tablename__],
+        inventory_projection.all
+    )
+
+# -----------------------------
+# SEARCH inventory by name (prefix or substring) and price range
+# -----------------------------
+@inventory_bp.get("/search")
+def search_items():
+    q = request.args.get("q", "").strip()
+    if len(q) < MIN_QUERY_LENGTH:
+        return jsonify({"error": f"q must be at least {MIN_QUERY_LENGTH} characters"}), 400
+
+    mode = request.args.get("mode", "substring")
+    if mode not in ("prefix", "substring"):
+        return jsonify({"error": "mode must be prefix or substring"}), 400
+
+    limit = request.args.get("limit", DEFAULT_LIMIT, type=int)
+    min_price = request.args.get("min_price", type=float)
+    max_price = request.args.get("max_price", type=float)
+    if not 1 <= limit <= MAX_LIMIT:
+        return jsonify({"error": f"limit must be between 1 and {MAX_LIMIT}"}), 400
+
+    results = search_inventory(
+        q,
+        mode=mode,
+        min_price=min_price,
+        max_price=max_price,
+        limit=limit
+    )
+    return jsonify(results)
 
 # -----------------------------
 # GET single inventory item
@@ -49,6 +88,30 @@ def create_item(current_mechanic_id):
     }), 201
 
 
+# -----------------------------
+# BULK import inventory (NDJSON or CSV, upsert on name)
+# -----------------------------
+@inventory_bp.post("/bulk")
+@mechanic_token_required
+def bulk_import(current_mechanic_id):
+    if request.mimetype == "text/csv":
+        rows = iter_csv_rows(request.stream)
+    elif request.mimetype in ("application/x-ndjson", "application/jsonl"):
+        rows = iter_ndjson_rows(request.stream)
+    else:
+        return jsonify({"error": "Content-Type must be application/x-ndjson or text/csv"}), 415
+
+    batch_size = request.args.get(
+        "batch_size", current_app.config["INVENTORY_IMPORT_BATCH_SIZE"], type=int
+    )
+    if batch_size < 1:
+        return jsonify({"error": "batch_size must be positive"}), 400
+
+    report = import_rows(rows, batch_size=batch_size)
+    report["imported_by_mechanic_id"] = current_mechanic_id
+    return jsonify(report), 200
+
+
 # -----------------------------
 # UPDATE inventory item
 # -----------------------------
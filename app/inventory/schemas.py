@@ -1,8 +1,14 @@
 from marshmallow_sqlalchemy import SQLAlchemyAutoSchema
 from app.models import Inventory  # your Inventory model
+from app.utils.projection import Projection
 
 class InventorySchema(SQLAlchemyAutoSchema):
     class Meta:
         model = Inventory
         load_instance = True
         include_fk = True  # include foreign keys if there are any
+
+
+inventory_schema = InventorySchema()
+inventories_schema = InventorySchema(many=True)
+inventory_projection = Projection(InventorySchema)
@@ -0,0 +1,118 @@
+from sqlalchemy import DDL, event
+from app.extensions import db
+from app.models import Inventory
+
+# Trigram matching needs at least one full trigram
+MIN_QUERY_LENGTH = 3
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+
+FTS_TABLE = "inventory_fts"
+MYSQL_FULLTEXT_INDEX = "ix_inventory_name_fulltext"
+
+
+# -----------------------------
+# Index DDL
+# -----------------------------
+# SQLite: an external-content FTS5 table over inventory.name with the
+# trigram tokenizer (case-insensitive substring matching), kept in sync by
+# triggers so ORM writes and executemany bulk imports are both indexed.
+SQLITE_DDL = [
+    f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5("
+    f"name, content='inventory', content_rowid='id', tokenize='trigram')",
+    f"CREATE TRIGGER {FTS_TABLE}_ai AFTER INSERT ON inventory BEGIN "
+    f"INSERT INTO {FTS_TABLE}(rowid, name) VALUES (new.id, new.name); END",
+    f"CREATE TRIGGER {FTS_TABLE}_ad AFTER DELETE ON inventory BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, name) VALUES ('delete', old.id, old.name); END",
+    f"CREATE TRIGGER {FTS_TABLE}_au AFTER UPDATE OF name ON inventory BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, name) VALUES ('delete', old.id, old.name); "
+    f"INSERT INTO {FTS_TABLE}(rowid, name) VALUES (new.id, new.name); END",
+]
+
+# MySQL: InnoDB maintains FULLTEXT indexes itself; the ngram parser makes
+# phrase searches match substrings
+MYSQL_DDL = [
+    f"CREATE FULLTEXT INDEX {MYSQL_FULLTEXT_INDEX} ON inventory (name) WITH PARSER ngram",
+]
+
+for statement in SQLITE_DDL:
+    event.listen(Inventory.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+for statement in MYSQL_DDL:
+    event.listen(Inventory.__table__, "after_create", DDL(statement).execute_if(dialect="mysql"))
+event.listen(
+    Inventory.__table__, "before_drop",
+    DDL(f"DROP TABLE IF EXISTS {FTS_TABLE}").execute_if(dialect="sqlite")
+)
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    """
+    Alembic autogenerate filter: the search index objects are created by
+    hand-written migrations and are not part of the model metadata.
+    """
+    if type_ == "table" and name.startswith(FTS_TABLE):
+        return False
+    if type_ == "index" and name == MYSQL_FULLTEXT_INDEX:
+        return False
+    return True
+
+
+# -----------------------------
+# Search
+# -----------------------------
+def _like_escape(text):
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def search_statement(q, mode="substring", min_price=None, max_price=None, limit=DEFAULT_LIMIT):
+    """
+    SELECT for up to limit parts whose name contains q (mode="substring")
+    or starts with it (mode="prefix"), case-insensitively, optionally
+    within a price range, in id order. Candidates come from the dialect's
+    full-text index; the LIKE re-check keeps results exact.
+    """
+    phrase = '"' + q.replace('"', '""') + '"'
+    pattern = _like_escape(q) + "%"
+    if mode == "substring":
+        pattern = "%" + pattern
+
+    statement = (
+        db.select(Inventory.id, Inventory.name, Inventory.price)
+        .where(Inventory.name.ilike(pattern, escape="\\"))
+        .limit(limit)
+    )
+    dialect = db.engine.dialect.name
+    if dialect == "sqlite":
+        # Driving the join from the FTS table lets it return matches in
+        # rowid order, so LIMIT stops the scan after the first hits
+        fts = db.table(FTS_TABLE, db.column("rowid"))
+        statement = (
+            statement.select_from(fts)
+            .join(Inventory, Inventory.id == fts.c.rowid)
+            .where(db.text(f"{FTS_TABLE} MATCH :phrase").bindparams(phrase=phrase))
+            .order_by(fts.c.rowid)
+        )
+    elif dialect == "mysql":
+        statement = (
+            statement
+            .where(
+                db.text("MATCH (inventory.name) AGAINST (:phrase IN BOOLEAN MODE)")
+                .bindparams(phrase=phrase)
+            )
+            .order_by(Inventory.id)
+        )
+    else:
+        statement = statement.order_by(Inventory.id)
+
+    if min_price is not None:
+        statement = statement.where(Inventory.price >= min_price)
+    if max_price is not None:
+        statement = statement.where(Inventory.price <= max_price)
+    return statement
+
+
+def search_inventory(q, **filters):
+    return [
+        {"id": id, "name": name, "price": price}
+        for id, name, price in db.session.execute(search_statement(q, **filters))
+    ]
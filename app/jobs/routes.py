@@ -0,0 +1,73 @@
+import os
+from flask import request, jsonify, send_file, url_for
+from . import jobs_bp
+from app.extensions import db, job_runner
+from app.models import Job
+from app.utils.jobs import accepted_response
+from app.utils.util import mechanic_token_required
+from app.utils.lazy import lazy_import
+
+job_schema = lazy_import("app.jobs.schemas", "job_schema")
+
+
+def _own_job_or_404(job_id, mechanic_id):
+    job = db.session.get(Job, job_id)
+    if job is None or job.created_by_mechanic_id != mechanic_id:
+        return None
+    return job
+
+
+# -----------------------------
+# START a job
+# -----------------------------
+@jobs_bp.post("/")
+@mechanic_token_required
+def create_job(current_mechanic_id):
+    data = request.get_json(silent=True) or {}
+    job_type = data.get("type")
+    params = data.get("params", {})
+
+    if job_type not in job_runner.tasks:
+        return jsonify({"error": f"type must be one of: {', '.join(sorted(job_runner.tasks))}"}), 400
+    if not isinstance(params, dict):
+        return jsonify({"error": "params must be an object"}), 400
+
+    job = job_runner.submit(job_type, params, current_mechanic_id)
+    return accepted_response(job)
+
+
+# -----------------------------
+# GET job status / progress
+# -----------------------------
+@jobs_bp.get("/<job_id>")
+@mechanic_token_required
+def get_job(current_mechanic_id, job_id):
+    job = _own_job_or_404(job_id, current_mechanic_id)
+    if job is None:
+        return jsonify({"message": "Job not found"}), 404
+
+    data = job_schema.dump(job)
+    if job.status == "succeeded":
+        data["result_url"] = url_for("jobs.get_job_result", job_id=job.id)
+    return jsonify(data), 200
+
+
+# -----------------------------
+# GET job result
+# -----------------------------
+@jobs_bp.get("/<job_id>/result")
+@mechanic_token_required
+def get_job_result(current_mechanic_id, job_id):
+    job = _own_job_or_404(job_id, current_mechanic_id)
+    if job is None:
+        return jsonify({"message": "Job not found"}), 404
+    if job.status != "succeeded":
+        return jsonify({"message": f"Job is {job.status}", "status": job.status}), 409
+
+    path = job_runner.result_path(job)
+    return send_file(
+        path,
+        mimetype=job.result_mimetype,
+        as_attachment=job.result_mimetype != "application/json",
+        download_name=f"{job.type}-{os.path.basename(path)}"
+    )
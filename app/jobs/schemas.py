@@ -0,0 +1,13 @@
+from app.extensions import ma
+from app.models import Job
+
+
+class JobSchema(ma.SQLAlchemyAutoSchema):
+    class Meta:
+        model = Job
+        load_instance = True
+        # Server host and pid; internal only
+        exclude = ("runner",)
+
+
+job_schema = JobSchema()
@@ -0,0 +1,52 @@
+# app/jobs/tasks.py
+# Job types available to POST /jobs/ and to endpoints that offload work
+from flask import current_app
+from app.extensions import db, job_runner
+from app.mechanics.leaderboard import rebuild_leaderboard
+from app.mechanics.hours import rebuild_hours_rollup
+from app.service_tickets.costs import cost_report
+from app.service_tickets.export import (
+    EXPORT_FORMATS,
+    parse_export_filters,
+    export_statement,
+    iter_partitions,
+)
+from app.utils.jobs import FileResult
+
+
+@job_runner.task("ticket_export")
+def export_tickets(params, ctx):
+    """
+    CSV/NDJSON ticket export (same params as GET /service_tickets/export).
+    """
+    encode, mimetype = EXPORT_FORMATS[params.get("format", "csv")]
+    batch_size = current_app.config["SERVICE_TICKET_EXPORT_BATCH_SIZE"]
+    statement = export_statement(**parse_export_filters(params))
+    total = db.session.scalar(db.select(db.func.count()).select_from(statement.subquery()))
+
+    def partitions():
+        done = 0
+        for rows in iter_partitions(statement, batch_size):
+            yield rows
+            done += len(rows)
+            ctx.progress(done, total)
+
+    return FileResult(encode(partitions()), mimetype)
+
+
+@job_runner.task("ticket_costs")
+def ticket_cost_rollup(params, ctx):
+    """
+    Cost breakdowns for params["ticket_ids"] (same as POST /service_tickets/costs).
+    """
+    return cost_report(params.get("ticket_ids") or [], progress=ctx.progress)
+
+
+@job_runner.task("rebuild_leaderboard")
+def rebuild_mechanic_leaderboard(params, ctx):
+    return {"mechanics": rebuild_leaderboard()}
+
+
+@job_runner.task("rebuild_hours_rollup")
+def rebuild_mechanic_hours_rollup(params, ctx):
+    return {"rows": rebuild_hours_rollup()}
@@ -0,0 +1,212 @@
+# app/mechanics/hours.py
+from collections import defaultdict
+from datetime import timedelta
+from flask import current_app
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from app.extensions import db
+from app.models import MechanicHoursRollup, ServiceTicketMechanic
+
+# Rollup grains; weeks start on Monday
+PERIODS = ("day", "week", "month")
+
+
+def hours_rollup_enabled():
+    return current_app.config.get("MECHANIC_HOURS_ROLLUP_ENABLED", False)
+
+
+def period_start(period, day):
+    if period == "week":
+        return day - timedelta(days=day.weekday())
+    if period == "month":
+        return day.replace(day=1)
+    return day
+
+
+def period_end(period, start):
+    """
+    First day after the period beginning on start.
+    """
+    if period == "week":
+        return start + timedelta(days=7)
+    if period == "month":
+        return (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return start + timedelta(days=1)
+
+
+def _row(start, mechanic_id, hours, links):
+    return {
+        "mechanic_id": mechanic_id,
+        "period_start": start.isoformat(),
+        "hours": round(hours, 2),
+        "links": links,
+    }
+
+
+# -----------------------------
+# READS
+# -----------------------------
+def _daily_hours(start=None, end=None, mechanic_id=None):
+    """
+    (mechanic_id, worked_on, hours, links) per mechanic per day from
+    service_ticket_mechanics, for links with hours recorded and worked_on
+    in [start, end).
+    """
+    links = ServiceTicketMechanic
+    statement = (
+        db.select(
+            links.mechanic_id,
+            links.worked_on,
+            func.sum(links.hours_worked),
+            func.count(links.id),
+        )
+        .where(links.hours_worked.is_not(None))
+        .group_by(links.mechanic_id, links.worked_on)
+    )
+    if start:
+        statement = statement.where(links.worked_on >= start)
+    if end:
+        statement = statement.where(links.worked_on < end)
+    if mechanic_id:
+        statement = statement.where(links.mechanic_id == mechanic_id)
+    return db.session.execute(statement).all()
+
+
+def _bucket(period, daily):
+    totals = defaultdict(lambda: [0.0, 0])
+    for mechanic_id, worked_on, hours, links in daily:
+        total = totals[(period_start(period, worked_on), mechanic_id)]
+        total[0] += hours
+        total[1] += links
+    return totals
+
+
+def computed_hours(period, start=None, end=None, mechanic_id=None):
+    """
+    Hours per mechanic per period for periods overlapping [start, end]
+    (inclusive dates), aggregated from the link table.
+    """
+    first = period_start(period, start) if start else None
+    stop = period_end(period, period_start(period, end)) if end else None
+    totals = _bucket(period, _daily_hours(first, stop, mechanic_id))
+    return [
+        _row(bucket_start, m_id, hours, links)
+        for (bucket_start, m_id), (hours, links) in sorted(totals.items())
+    ]
+
+
+def rollup_hours(period, start=None, end=None, mechanic_id=None):
+    """
+    Same rows as computed_hours, read from mechanic_hours_rollup: one row
+    per mechanic per period in range.
+    """
+    rollup = MechanicHoursRollup
+    statement = (
+        db.select(rollup.period_start, rollup.mechanic_id, rollup.hours, rollup.links)
+        .where(rollup.period == period, rollup.links > 0)
+        .order_by(rollup.period_start, rollup.mechanic_id)
+    )
+    if start:
+        statement = statement.where(rollup.period_start >= period_start(period, start))
+    if end:
+        statement = statement.where(rollup.period_start <= period_start(period, end))
+    if mechanic_id:
+        statement = statement.where(rollup.mechanic_id == mechanic_id)
+    return [_row(*row) for row in db.session.execute(statement)]
+
+
+# -----------------------------
+# WRITES
+# -----------------------------
+def _seed(period, start, mechanic_id):
+    # No row yet: build it from the link table, which already includes
+    # this change once written. A connection savepoint, as in the
+    # leaderboard, so this can run from a flush hook.
+    totals = _bucket(period, _daily_hours(start, period_end(period, start), mechanic_id))
+    hours, links = totals.get((start, mechanic_id), (0.0, 0))
+    with db.session.connection().begin_nested():
+        db.session.execute(db.insert(MechanicHoursRollup).values(
+            period=period, period_start=start, mechanic_id=mechanic_id, hours=hours, links=links
+        ))
+
+
+def adjust_hours(entries):
+    """
+    Apply (mechanic_id, worked_on, +/-hours, +/-links) changes to every
+    rollup grain in the current transaction. Call after the link rows
+    have been written; links written through the unit of work are
+    applied by app.mechanics.links. A no-op when the rollup is disabled.
+    """
+    if not hours_rollup_enabled():
+        return
+
+    deltas = defaultdict(lambda: [0.0, 0])
+    for mechanic_id, worked_on, hours, links in entries:
+        for period in PERIODS:
+            delta = deltas[(period, period_start(period, worked_on), mechanic_id)]
+            delta[0] += hours
+            delta[1] += links
+
+    rollup = MechanicHoursRollup
+    for (period, start, mechanic_id), (hours, links) in deltas.items():
+        if not (hours or links):
+            continue
+
+        update = (
+            db.update(rollup)
+            .where(
+                rollup.period == period,
+                rollup.period_start == start,
+                rollup.mechanic_id == mechanic_id,
+            )
+            .values(hours=rollup.hours + hours, links=rollup.links + links)
+        )
+        if db.session.execute(update).rowcount:
+            continue
+        try:
+            _seed(period, start, mechanic_id)
+        except IntegrityError:
+            # Seeded concurrently by another request; add to its row
+            db.session.execute(update)
+
+
+def removed_link_hours(ticket_id, mechanic_ids):
+    """
+    adjust_hours entries undoing the ticket's links to mechanic_ids. Read
+    before the links are deleted.
+    """
+    if not hours_rollup_enabled() or not mechanic_ids:
+        return []
+    links = ServiceTicketMechanic
+    rows = db.session.execute(
+        db.select(links.mechanic_id, links.worked_on, links.hours_worked)
+        .where(links.ticket_id == ticket_id)
+        .where(links.mechanic_id.in_(mechanic_ids))
+        .where(links.hours_worked.is_not(None))
+    )
+    return [(m_id, worked_on, -hours, -1) for m_id, worked_on, hours in rows]
+
+
+def remove_hours_for_mechanic(mechanic_id):
+    if hours_rollup_enabled():
+        db.session.execute(
+            db.delete(MechanicHoursRollup)
+            .where(MechanicHoursRollup.mechanic_id == mechanic_id)
+        )
+
+
+def rebuild_hours_rollup():
+    """
+    Recompute every rollup row from service_ticket_mechanics.
+    """
+    db.session.execute(db.delete(MechanicHoursRollup))
+    daily = _daily_hours()
+    rows = [
+        {"period": period, "period_start": start, "mechanic_id": m_id, "hours": hours, "links": links}
+        for period in PERIODS
+        for (start, m_id), (hours, links) in _bucket(period, daily).items()
+    ]
+    if rows:
+        db.session.execute(db.insert(MechanicHoursRollup), rows)
+    db.session.commit()
+    return len(rows)
@@ -0,0 +1,134 @@
+# app/mechanics/leaderboard.py
+from flask import current_app
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from app.extensions import db
+from app.models import Mechanic, MechanicLeaderboard, ServiceTicketMechanic
+
+
+def leaderboard_enabled():
+    return current_app.config.get("MECHANIC_LEADERBOARD_ENABLED", False)
+
+
+# -----------------------------
+# READS
+# -----------------------------
+def ranked_mechanics(limit, offset):
+    """
+    Mechanics ranked by number of ticket links, computed with a single
+    GROUP BY over service_ticket_mechanics. Returns
+    (id, name, email, phone, tickets_worked) rows.
+    """
+    tickets_worked = func.count(ServiceTicketMechanic.id)
+    return db.session.execute(
+        db.select(
+            Mechanic.id,
+            Mechanic.name,
+            Mechanic.email,
+            Mechanic.phone,
+            tickets_worked.label("tickets_worked")
+        )
+        .outerjoin(ServiceTicketMechanic, ServiceTicketMechanic.mechanic_id == Mechanic.id)
+        .group_by(Mechanic.id, Mechanic.name, Mechanic.email, Mechanic.phone)
+        .order_by(tickets_worked.desc(), Mechanic.id)
+        .limit(limit)
+        .offset(offset)
+    ).all()
+
+
+def leaderboard_page(limit, offset):
+    """
+    Same rows as ranked_mechanics, read from the precomputed leaderboard
+    table so only limit + offset rows are touched.
+    """
+    return db.session.execute(
+        db.select(
+            Mechanic.id,
+            Mechanic.name,
+            Mechanic.email,
+            Mechanic.phone,
+            MechanicLeaderboard.tickets_worked
+        )
+        .join(Mechanic, Mechanic.id == MechanicLeaderboard.mechanic_id)
+        .order_by(MechanicLeaderboard.tickets_worked.desc(), MechanicLeaderboard.mechanic_id)
+        .limit(limit)
+        .offset(offset)
+    ).all()
+
+
+# -----------------------------
+# WRITES
+# -----------------------------
+def _seed(mechanic_id):
+    # No row yet: build it from the link table, which already includes
+    # this change once written. A savepoint on the connection rather than
+    # session.begin_nested(), which would flush and so cannot run from a
+    # flush hook.
+    count = db.session.scalar(
+        db.select(func.count(ServiceTicketMechanic.id))
+        .where(ServiceTicketMechanic.mechanic_id == mechanic_id)
+    )
+    with db.session.connection().begin_nested():
+        db.session.execute(
+            db.insert(MechanicLeaderboard).values(mechanic_id=mechanic_id, tickets_worked=count)
+        )
+
+
+def adjust_leaderboard(deltas):
+    """
+    Apply {mechanic_id: +/-count} changes to the leaderboard in the
+    current transaction. Call after the link rows have been written;
+    links written through the unit of work are applied by
+    app.mechanics.links. A no-op when the leaderboard is disabled.
+    """
+    if not leaderboard_enabled():
+        return
+
+    for mechanic_id, delta in deltas.items():
+        if not delta:
+            continue
+
+        update = (
+            db.update(MechanicLeaderboard)
+            .where(MechanicLeaderboard.mechanic_id == mechanic_id)
+            .values(tickets_worked=MechanicLeaderboard.tickets_worked + delta)
+        )
+        if db.session.execute(update).rowcount:
+            continue
+        try:
+            _seed(mechanic_id)
+        except IntegrityError:
+            # Seeded concurrently by another request; add to its row
+            db.session.execute(update)
+
+
+def add_to_leaderboard(mechanic_id):
+    if leaderboard_enabled():
+        db.session.add(MechanicLeaderboard(mechanic_id=mechanic_id, tickets_worked=0))
+
+
+def remove_from_leaderboard(mechanic_id):
+    if leaderboard_enabled():
+        db.session.execute(
+            db.delete(MechanicLeaderboard)
+            .where(MechanicLeaderboard.mechanic_id == mechanic_id)
+        )
+
+
+def rebuild_leaderboard():
+    """
+    Recompute every leaderboard row from service_ticket_mechanics.
+    """
+    db.session.execute(db.delete(MechanicLeaderboard))
+    counts = db.session.execute(
+        db.select(Mechanic.id, func.count(ServiceTicketMechanic.id))
+        .outerjoin(ServiceTicketMechanic, ServiceTicketMechanic.mechanic_id == Mechanic.id)
+        .group_by(Mechanic.id)
+    ).all()
+    if counts:
+        db.session.execute(
+            db.insert(MechanicLeaderboard),
+            [{"mechanic_id": m_id, "tickets_worked": n} for m_id, n in counts]
+        )
+    db.session.commit()
+    return len(counts)
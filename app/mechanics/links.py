@@ -0,0 +1,124 @@
+# app/mechanics/links.py
+from collections import Counter
+from flask import has_app_context
+from sqlalchemy import and_, event, inspect, or_
+from sqlalchemy.orm import Session
+from app.extensions import db
+from app.models import Mechanic, ServiceTicket, ServiceTicketMechanic, utcdate
+from .leaderboard import leaderboard_enabled, adjust_leaderboard
+from .hours import hours_rollup_enabled, adjust_hours
+
+_REMOVED_LINKS = "mechanic_links_removed"
+
+_LINK_COLUMNS = ("mechanic_id", "worked_on", "hours_worked")
+
+
+# -----------------------------
+# Link changes in a flush
+# -----------------------------
+# Links written through the unit of work (session.add/delete, ticket.mechanics,
+# deleting a ticket or its vehicle) are picked up here. Batched link writes
+# issued with session.execute() bypass it; their callers adjust the
+# leaderboard and hours rollup themselves.
+def _tracking():
+    return has_app_context() and (leaderboard_enabled() or hours_rollup_enabled())
+
+
+def _committed(obj):
+    state = inspect(obj)
+    return tuple(
+        (state.attrs[key].history.deleted or state.attrs[key].history.unchanged or [None])[0]
+        for key in _LINK_COLUMNS
+    )
+
+
+def _removed_links(session):
+    """
+    (mechanic_id, worked_on, hours_worked) of every link row this flush
+    will delete. Read before the flush, while the rows still exist.
+    """
+    removed = {}
+    deleted_tickets = []
+    pairs = []
+    for obj in session.deleted:
+        if isinstance(obj, ServiceTicketMechanic) and obj.id is not None:
+            removed[obj.id] = _committed(obj)
+        elif isinstance(obj, ServiceTicket) and obj.id is not None:
+            deleted_tickets.append(obj.id)
+    for obj in session.dirty:
+        if isinstance(obj, ServiceTicket):
+            # The secondary DELETE matches every row for the pair
+            pairs.extend((obj.id, m.id) for m in inspect(obj).attrs.mechanics.history.deleted)
+
+    conditions = []
+    if deleted_tickets:
+        conditions.append(ServiceTicketMechanic.ticket_id.in_(deleted_tickets))
+    conditions.extend(
+        and_(ServiceTicketMechanic.ticket_id == t_id, ServiceTicketMechanic.mechanic_id == m_id)
+        for t_id, m_id in pairs
+    )
+    if conditions:
+        links = ServiceTicketMechanic
+        with session.no_autoflush:
+            rows = session.execute(
+                db.select(links.id, links.mechanic_id, links.worked_on, links.hours_worked)
+                .where(or_(*conditions))
+            )
+            for link_id, *values in rows:
+                removed.setdefault(link_id, tuple(values))
+
+    # A deleted mechanic's leaderboard and rollup rows go with it
+    gone = {obj.id for obj in session.deleted if isinstance(obj, Mechanic)}
+    return [values for values in removed.values() if values[0] not in gone]
+
+
+def _added_links(session):
+    """
+    (mechanic_id, worked_on, hours_worked) of every link row this flush
+    inserted. Read after the flush, once new rows have their ids.
+    """
+    added = []
+    for obj in session.new:
+        if isinstance(obj, ServiceTicketMechanic):
+            added.append((obj.mechanic_id, obj.worked_on, obj.hours_worked))
+    for obj in list(session.new) + list(session.dirty):
+        if isinstance(obj, ServiceTicket):
+            added.extend(
+                (m.id, utcdate(), None) for m in inspect(obj).attrs.mechanics.history.added
+            )
+    return added
+
+
+def _before_flush(session, flush_context, instances):
+    if _tracking():
+        session.info[_REMOVED_LINKS] = _removed_links(session)
+
+
+def _after_flush(session, flush_context):
+    removed = session.info.pop(_REMOVED_LINKS, None)
+    if removed is None:
+        return
+
+    added = _added_links(session)
+    deltas = Counter(mechanic_id for mechanic_id, _, _ in added)
+    deltas.subtract(mechanic_id for mechanic_id, _, _ in removed)
+    adjust_leaderboard(dict(deltas))
+
+    adjust_hours(
+        [(m_id, worked_on, hours, 1) for m_id, worked_on, hours in added if hours is not None]
+        + [(m_id, worked_on, -hours, -1) for m_id, worked_on, hours in removed if hours is not None]
+    )
+
+
+def register_link_tracking():
+    """
+    Keep the mechanic leaderboard and hours rollup in step with link rows
+    that the unit of work inserts or deletes, including cascades from
+    deleted tickets and vehicles.
+    """
+    for name, fn in (
+        ("before_flush", _before_flush),
+        ("after_flush", _after_flush),
+    ):
+        if not event.contains(Session, name, fn):
+            event.listen(Session, name, fn)
@@ -1,42 +1,35 @@
 # app/mechanics/routes.py
+from datetime import date
 from flask import request, jsonify
-from app.extensions import db
+from app.extensions import db, password_hasher
 from app.models import Mechanic
 from . import mechanics_bp
-from .schemas import mechanic_schema, mechanics_schema
-from werkzeug.security import generate_password_hash, check_password_hash
-from jose import jwt, JWTError, ExpiredSignatureError
-from functools import wraps
-from app.utils.util import mechanic_token_required
-import datetime
-
-# Secret key for JWT
-SECRET_KEY = "super-secret-key"  # replace with env var in production
-
-# -----------------------------
-# Mechanic Token Required Decorator
-# -----------------------------
-def mechanic_token_required(f):
-    @wraps(f)
-    def decorated(*args, **kwargs):
-        token = None
-        if "Authorization" in request.headers:
-            parts = request.headers["Authorization"].split(" ")
-            if len(parts) == 2 and parts[0] == "Bearer":
-                token = parts[1]
-        if not token:
-            return jsonify({"message": "Token is missing"}), 401
-        try:
-            payload = jwt.decode(token, SECRET_KEY, algorithms=["HS256"])
-            current_mechanic_id = payload.get("mechanic_id")
-            if not current_mechanic_id:
-                return jsonify({"message": "Invalid token"}), 403
-        except ExpiredSignatureError:
-            return jsonify({"message": "Token has expired"}), 403
-        except JWTError:
-            return jsonify({"message": "Token is invalid"}), 403
-        return f(current_mechanic_id, *args, **kwargs)
-    return decorated
+from app.utils.util import mechanic_token_required, encode_mechanic_token
+from app.utils.caching import versioned_json_response
+from .leaderboard import (
+    leaderboard_enabled,
+    ranked_mechanics,
+    leaderboard_page,
+    add_to_leaderboard,
+    remove_from_leaderboard,
+    rebuild_leaderboard,
+)
+from .hours import (
+    PERIODS,
+    hours_rollup_enabled,
+    computed_hours,
+    rollup_hours,
+    remove_hours_for_mechanic,
+    rebuild_hours_rollup,
+)
+from .links import register_link_tracking
+import click
+from app.utils.lazy import lazy_import
+from app.utils.replicas import replica_reads
+
+mechanic_schema, mechanics_projection = lazy_import(
+    "app.mechanics.schemas", "mechanic_schema", "mechanics_projection"
+)
 
 # -----------------------------
 # CREATE MECHANIC
@@ -53,13 +46,11 @@ def create_mechanic():
         phone=data.get("phone"),
         address=data.get("address"),
         salary=data.get("salary"),
-        password=generate_password_hash(
-    data["password"],
-    method="pbkdf2:sha256"
-)
-
+        password=password_hasher.hash(data["password"])
     )
     db.session.add(mechanic)
+    db.session.flush()
+    add_to_leaderboard(mechanic.id)
     db.session.commit()
     return mechanic_schema.jsonify(mechanic), 201
 
@@ -78,21 +69,17 @@ def login_mechanic():
     if not mechanic:
         return jsonify({"message": "Mechanic not found"}), 404
 
-    if not check_password_hash(mechanic.password, password):
+    if not password_hasher.verify(mechanic.password, password):
         return jsonify({"message": "Invalid credentials"}), 401
+
+    if password_hasher.needs_rehash(mechanic.password):
+        mechanic.password = password_hasher.hash(password)
+        db.session.commit()
     
     # -----------------------------
     # Generate JWT token
     # -----------------------------
-    token = jwt.encode(
-        {
-            "mechanic_id": mechanic.id,
-            "exp": datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(hours=1)  # expires in 1 hour
-        },
-        SECRET_KEY,
-        algorithm="HS256"
-    )
-
+    token = encode_mechanic_token(mechanic.id)
 
     return jsonify({"token": token}), 200
 
@@ -100,9 +87,13 @@ def login_mechanic():
 # GET ALL MECHANICS
 # -----------------------------
 @mechanics_bp.route("/", methods=["GET"])
+@replica_reads
 def get_mechanics():
-    all_mechanics = Mechanic.query.all()
-    return mechanics_schema.jsonify(all_mechanics)
+    return versioned_json_response(
+        "mechanics:all",
+        [Mechanic.__tablename__],
+        mechanics_projection.all
+    )
 
 # -----------------------------
 # UPDATE MECHANIC (protected)
@@ -131,6 +122,8 @@ def update_mechanic(current_mechanic_id, id):
 def delete_mechanic(current_mechanic_id, id):
     mechanic = Mechanic.query.get_or_404(id)
     db.session.delete(mechanic)
+    remove_from_leaderboard(id)
+    remove_hours_for_mechanic(id)
     db.session.commit()
     return jsonify({"message": "Mechanic deleted"}), 200
 
@@ -139,20 +132,82 @@ def delete_mechanic(current_mechanic_id, id):
 # -----------------------------
 @mechanics_bp.route("/popular", methods=["GET"])
 def popular_mechanics():
-    mechanics = Mechanic.query.all()
-    mechanics.sort(key=lambda m: len(m.service_tickets), reverse=True)
-
     limit = int(request.args.get("limit", 10))
     offset = int(request.args.get("offset", 0))
-    mechanics_paginated = mechanics[offset:offset + limit]
+
+    # Ranking is done in SQL; the leaderboard table is a precomputed
+    # copy of the same counts kept up to date as links change.
+    if leaderboard_enabled():
+        rows = leaderboard_page(limit, offset)
+    else:
+        rows = ranked_mechanics(limit, offset)
 
     return jsonify([
         {
-            "id": m.id,
-            "name": m.name,
-            "email": m.email,
-            "phone": m.phone,
-            "tickets_worked": len(m.service_tickets)
+            "id": row.id,
+            "name": row.name,
+            "email": row.email,
+            "phone": row.phone,
+            "tickets_worked": row.tickets_worked
         }
-        for m in mechanics_paginated
+        for row in rows
     ])
+
+
+# -----------------------------
+# HOURS REPORT (day / week / month)
+# -----------------------------
+@mechanics_bp.route("/hours", methods=["GET"])
+@replica_reads
+@mechanic_token_required
+def mechanic_hours(current_mechanic_id):
+    period = request.args.get("period", "month")
+    if period not in PERIODS:
+        return jsonify({"error": "period must be day, week or month"}), 400
+
+    try:
+        start, end = (
+            date.fromisoformat(request.args[name]) if request.args.get(name) else None
+            for name in ("start", "end")
+        )
+    except ValueError:
+        return jsonify({"error": "start and end must be ISO 8601 dates"}), 400
+    mechanic_id = request.args.get("mechanic_id", type=int)
+
+    # Periods overlapping [start, end]; the rollup table holds the same
+    # totals precomputed, one row per mechanic per period.
+    report = rollup_hours if hours_rollup_enabled() else computed_hours
+    return jsonify({
+        "period": period,
+        "start": start.isoformat() if start else None,
+        "end": end.isoformat() if end else None,
+        "rows": report(period, start, end, mechanic_id),
+    })
+
+
+# -----------------------------
+# CLI: flask mechanics rebuild-leaderboard
+# -----------------------------
+@mechanics_bp.cli.command("rebuild-leaderboard")
+def rebuild_leaderboard_command():
+    """Recompute the mechanic leaderboard from service_ticket_mechanics."""
+    count = rebuild_leaderboard()
+    click.echo(f"Leaderboard rebuilt for {count} mechanics")
+
+
+
+# -----------------------------
+# CLI: flask mechanics rebuild-hours
+# -----------------------------
+@mechanics_bp.cli.command("rebuild-hours")
+def rebuild_hours_command():
+    """Recompute mechanic_hours_rollup from service_ticket_mechanics."""
+    count = rebuild_hours_rollup()
+    click.echo(f"Hours rollup rebuilt: {count} rows")
+
+
+@mechanics_bp.record_once
+def _track_mechanic_links(state):
+    # Applies leaderboard and hours deltas for link rows the unit of work inserts
+    # or deletes, including ticket and vehicle delete cascades
+    register_link_tracking()
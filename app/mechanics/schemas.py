@@ -1,5 +1,6 @@
 from app.extensions import ma
 from app.models import Mechanic
+from app.utils.projection import Projection
 
 class MechanicSchema(ma.SQLAlchemyAutoSchema):
     class Meta:
@@ -9,3 +10,4 @@ class MechanicSchema(ma.SQLAlchemyAutoSchema):
 
 mechanic_schema = MechanicSchema()
 mechanics_schema = MechanicSchema(many=True)
+mechanics_projection = Projection(MechanicSchema)
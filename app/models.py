@@ -1,7 +1,18 @@
 # app/models.py
 
+from datetime import datetime, timezone
 from app.extensions import db
 
+
+def utcnow():
+    """Naive UTC timestamp, as stored in DateTime columns."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def utcdate():
+    """Today's date in UTC."""
+    return datetime.now(timezone.utc).date()
+
 # ------------------------------------------------
 # Customer Model
 # ------------------------------------------------
@@ -12,7 +23,7 @@ class Customer(db.Model):
     name = db.Column(db.String(120), nullable=False)
     phone = db.Column(db.String(50))
     password = db.Column(db.String(255), nullable=False)
-    email = db.Column(db.String(120))
+    email = db.Column(db.String(120), index=True)
     address = db.Column(db.String(255))
 
     vehicles = db.relationship(
@@ -36,7 +47,8 @@ class Vehicle(db.Model):
     customer_id = db.Column(
         db.Integer,
         db.ForeignKey("customer.id"),
-        nullable=False
+        nullable=False,
+        index=True
     )
 
     vin = db.Column(
@@ -57,6 +69,10 @@ class Vehicle(db.Model):
 # ------------------------------------------------
 class ServiceTicketMechanic(db.Model):
     __tablename__ = "service_ticket_mechanics"
+    __table_args__ = (
+        # ticket -> mechanics lookups (eager loads, edit sync)
+        db.Index("ix_service_ticket_mechanics_ticket_id_mechanic_id", "ticket_id", "mechanic_id"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
 
@@ -69,10 +85,13 @@ class ServiceTicketMechanic(db.Model):
     mechanic_id = db.Column(
         db.Integer,
         db.ForeignKey("mechanic.id"),
-        nullable=False
+        nullable=False,
+        index=True
     )
 
     hours_worked = db.Column(db.Float, nullable=True)
+    # Day the hours count towards in mechanic_hours_rollup
+    worked_on = db.Column(db.Date, nullable=False, default=utcdate)
 
     role = db.Column(db.String(50), nullable=True)
 
@@ -127,7 +146,8 @@ class Inventory(db.Model):
     __tablename__ = "inventory"
 
     id = db.Column(db.Integer, primary_key=True)
-    name = db.Column(db.String(120), nullable=False)
+    # Bulk import upserts on name
+    name = db.Column(db.String(120), nullable=False, index=True)
     price = db.Column(db.Float, nullable=False)
 
     service_tickets = db.relationship(
@@ -142,6 +162,10 @@ class Inventory(db.Model):
 # ------------------------------------------------
 class ServiceTicket(db.Model):
     __tablename__ = "service_tickets"
+    __table_args__ = (
+        # vehicle -> tickets lookups, optionally narrowed by status
+        db.Index("ix_service_tickets_vehicle_id_status", "vehicle_id", "status"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     description = db.Column(db.String(255), nullable=False)
@@ -153,6 +177,7 @@ class ServiceTicket(db.Model):
     estimated_cost = db.Column(db.Float)
     final_cost = db.Column(db.Float)
     status = db.Column(db.String(50), default="Pending")
+    created_at = db.Column(db.DateTime, nullable=False, default=utcnow, index=True)
 
     vehicle_id = db.Column(
         db.Integer,
@@ -172,3 +197,64 @@ class ServiceTicket(db.Model):
         back_populates="service_tickets"
     )
 
+
+# ------------------------------------------------
+# Mechanic Leaderboard (precomputed ticket counts)
+# ------------------------------------------------
+class MechanicLeaderboard(db.Model):
+    __tablename__ = "mechanic_leaderboard"
+
+    mechanic_id = db.Column(db.Integer, primary_key=True)
+    tickets_worked = db.Column(db.Integer, nullable=False, default=0, index=True)
+
+
+# ------------------------------------------------
+# Mechanic Hours Rollup (hours per mechanic per day/week/month)
+# ------------------------------------------------
+class MechanicHoursRollup(db.Model):
+    __tablename__ = "mechanic_hours_rollup"
+
+    # Primary key order serves date-range reads across all mechanics
+    period = db.Column(db.String(5), primary_key=True)  # day | week | month
+    period_start = db.Column(db.Date, primary_key=True)
+    mechanic_id = db.Column(db.Integer, primary_key=True)
+    hours = db.Column(db.Float, nullable=False, default=0.0)
+    links = db.Column(db.Integer, nullable=False, default=0)
+
+
+# ------------------------------------------------
+# Background Jobs
+# ------------------------------------------------
+class Job(db.Model):
+    __tablename__ = "jobs"
+
+    id = db.Column(db.String(32), primary_key=True)
+    type = db.Column(db.String(50), nullable=False)
+    # queued -> running -> succeeded | failed
+    status = db.Column(db.String(20), nullable=False, default="queued")
+    progress = db.Column(db.Float, nullable=False, default=0.0)
+    params = db.Column(db.JSON)
+    error = db.Column(db.Text)
+
+    # Results live in the job result store; these describe the stored file
+    result_mimetype = db.Column(db.String(100))
+    result_size = db.Column(db.Integer)
+
+    # No foreign key: job history outlives deleted mechanics
+    created_by_mechanic_id = db.Column(db.Integer, index=True)
+    # host:pid of the process whose pool runs the job
+    runner = db.Column(db.String(100))
+    created_at = db.Column(db.DateTime, nullable=False, default=utcnow)
+    started_at = db.Column(db.DateTime)
+    finished_at = db.Column(db.DateTime)
+
+
+# ------------------------------------------------
+# Cache Versions
+# ------------------------------------------------
+class CacheVersion(db.Model):
+    __tablename__ = "cache_versions"
+
+    # Table name or narrower version scope (see app/utils/caching.py)
+    name = db.Column(db.String(100), primary_key=True)
+    version = db.Column(db.String(32), nullable=False)
@@ -1,19 +1,29 @@
+from datetime import date
 from flask import request, jsonify
 from . import service_ticket_mechanics_bp
-from app.models import ServiceTicketMechanic, ServiceTicket, Mechanic
-from .schemas import st_mech_schema, st_mechs_schema
+from app.models import ServiceTicketMechanic, ServiceTicket, Mechanic, utcdate
 from app.extensions import db, limiter
 from app.utils.util import mechanic_token_required
+from app.utils.caching import versioned_json_response
+from app.utils.lazy import lazy_import
+from app.utils.replicas import replica_reads
+
+st_mech_schema, st_mechs_projection = lazy_import(
+    "app.service_ticket_mechanics.schemas", "st_mech_schema", "st_mechs_projection"
+)
 
 
 # -----------------------------
 # GET all links
 # -----------------------------
 @service_ticket_mechanics_bp.get("/")
+@replica_reads
 def get_all_links():
-    links = ServiceTicketMechanic.query.all()
-    # <-- change here
-    return jsonify(st_mechs_schema.dump(links))
+    return versioned_json_response(
+        "service_ticket_mechanics:all",
+        [ServiceTicketMechanic.__tablename__],
+        st_mechs_projection.all
+    )
 
 
 # -----------------------------
@@ -47,13 +57,23 @@ def create_link(current_mechanic_id):
     if mechanic_id != current_mechanic_id:
         return jsonify({"message": "Unauthorized"}), 403
 
+    hours_worked = data.get("hours_worked")
+    if hours_worked is not None and (type(hours_worked) not in (int, float) or hours_worked < 0):
+        return jsonify({"error": "hours_worked must be a non-negative number"}), 400
+
+    try:
+        worked_on = date.fromisoformat(data["worked_on"]) if data.get("worked_on") else utcdate()
+    except (TypeError, ValueError):
+        return jsonify({"error": "worked_on must be an ISO 8601 date"}), 400
+
     ticket = ServiceTicket.query.get_or_404(ticket_id)
     mechanic = Mechanic.query.get_or_404(mechanic_id)
 
     new_link = ServiceTicketMechanic(
         ticket_id=ticket_id,
         mechanic_id=mechanic_id,
-        hours_worked=data.get("hours_worked"),
+        hours_worked=hours_worked,
+        worked_on=worked_on,
         role=data.get("role")
     )
 
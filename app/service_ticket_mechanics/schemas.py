@@ -1,6 +1,7 @@
 from app.extensions import ma
 from app.models import ServiceTicketMechanic
 from marshmallow_sqlalchemy import SQLAlchemyAutoSchema
+from app.utils.projection import Projection
 
 class STMechSchema(SQLAlchemyAutoSchema):
     class Meta:
@@ -10,3 +11,4 @@ class STMechSchema(SQLAlchemyAutoSchema):
 
 st_mech_schema = STMechSchema()
 st_mechs_schema = STMechSchema(many=True)
+st_mechs_projection = Projection(STMechSchema)
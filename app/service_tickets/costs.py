@@ -0,0 +1,164 @@
+# app/service_tickets/costs.py
+from flask import current_app
+from sqlalchemy import func, inspect
+from app.extensions import db
+from app.models import (
+    Inventory,
+    Mechanic,
+    ServiceTicket,
+    ServiceTicketMechanic,
+    service_ticket_inventory,
+)
+from app.utils.caching import versioned_cache_many
+
+# Version scope bumped when a part price or mechanic salary changes, which
+# can change any ticket's cost; link changes only bump ticket_cost_scope
+COST_RATES_SCOPE = "ticket_cost:rates"
+# Ticket ids per aggregate query
+COST_BATCH_SIZE = 500
+
+
+# -------------------------------------------------
+# AGGREGATE QUERY
+# -------------------------------------------------
+def ticket_costs_statement(ticket_ids, hours_per_year):
+    """
+    One SELECT returning (ticket_id, parts_cost, parts_count, labor_hours,
+    labor_cost) for each existing ticket in ticket_ids. Parts and labor are
+    summed in separate grouped subqueries so neither multiplies the other.
+    Labor is hours_worked x salary / hours_per_year.
+    """
+    parts = (
+        db.select(
+            service_ticket_inventory.c.ticket_id,
+            func.sum(Inventory.price).label("cost"),
+            func.count().label("count"),
+        )
+        .join(Inventory, Inventory.id == service_ticket_inventory.c.inventory_id)
+        .where(service_ticket_inventory.c.ticket_id.in_(ticket_ids))
+        .group_by(service_ticket_inventory.c.ticket_id)
+        .subquery()
+    )
+
+    hours = func.coalesce(ServiceTicketMechanic.hours_worked, 0)
+    labor = (
+        db.select(
+            ServiceTicketMechanic.ticket_id,
+            func.sum(hours).label("hours"),
+            func.sum(hours * func.coalesce(Mechanic.salary, 0) / hours_per_year).label("cost"),
+        )
+        .join(Mechanic, Mechanic.id == ServiceTicketMechanic.mechanic_id)
+        .where(ServiceTicketMechanic.ticket_id.in_(ticket_ids))
+        .group_by(ServiceTicketMechanic.ticket_id)
+        .subquery()
+    )
+
+    return (
+        db.select(
+            ServiceTicket.id,
+            func.coalesce(parts.c.cost, 0),
+            func.coalesce(parts.c.count, 0),
+            func.coalesce(labor.c.hours, 0),
+            func.coalesce(labor.c.cost, 0),
+        )
+        .outerjoin(parts, parts.c.ticket_id == ServiceTicket.id)
+        .outerjoin(labor, labor.c.ticket_id == ServiceTicket.id)
+        .where(ServiceTicket.id.in_(ticket_ids))
+    )
+
+
+def compute_ticket_costs(ticket_ids):
+    """
+    {ticket_id: cost breakdown} for the existing tickets among ticket_ids,
+    one aggregate query per COST_BATCH_SIZE ids.
+    """
+    hours_per_year = current_app.config["MECHANIC_HOURS_PER_YEAR"]
+    costs = {}
+    for start in range(0, len(ticket_ids), COST_BATCH_SIZE):
+        batch = ticket_ids[start:start + COST_BATCH_SIZE]
+        rows = db.session.execute(ticket_costs_statement(batch, hours_per_year))
+        for ticket_id, parts_cost, parts_count, labor_hours, labor_cost in rows:
+            costs[ticket_id] = {
+                "ticket_id": ticket_id,
+                "parts_cost": round(parts_cost, 2),
+                "parts_count": parts_count,
+                "labor_hours": round(labor_hours, 2),
+                "labor_cost": round(labor_cost, 2),
+                "total_cost": round(parts_cost + labor_cost, 2),
+            }
+    return costs
+
+
+# -------------------------------------------------
+# VERSION SCOPES
+# -------------------------------------------------
+def ticket_cost_scope(ticket_id):
+    return f"ticket_cost:{ticket_id}"
+
+
+def _changed(obj, *attributes):
+    state = inspect(obj)
+    return any(state.attrs[a].history.has_changes() for a in attributes)
+
+
+def ticket_cost_scopes(session):
+    """
+    Version scopes (see register_version_scope) of the ticket costs the
+    session is about to change: the tickets whose link rows change, plus
+    COST_RATES_SCOPE for price and salary changes.
+    """
+    scopes, ticket_ids = set(), set()
+    deleted = set(session.deleted)
+    for obj in list(session.new) + list(session.dirty) + list(deleted):
+        if isinstance(obj, ServiceTicketMechanic):
+            if obj in session.new or obj in deleted or _changed(obj, "ticket_id", "mechanic_id", "hours_worked"):
+                history = inspect(obj).attrs.ticket_id.history
+                ticket_ids.update([obj.ticket_id, *history.deleted])
+        elif isinstance(obj, ServiceTicket):
+            if obj in deleted or _changed(obj, "mechanics", "inventory"):
+                ticket_ids.add(obj.id)
+        elif isinstance(obj, Inventory):
+            if obj in deleted or _changed(obj, "price"):
+                scopes.add(COST_RATES_SCOPE)
+        elif isinstance(obj, Mechanic):
+            if obj in deleted or _changed(obj, "salary"):
+                scopes.add(COST_RATES_SCOPE)
+
+    ticket_ids.discard(None)
+    return scopes | {ticket_cost_scope(t) for t in ticket_ids}
+
+
+# -------------------------------------------------
+# CACHED LOOKUP
+# -------------------------------------------------
+def ticket_costs(ticket_ids):
+    """
+    Cost breakdowns keyed by ticket id, served per ticket from the cache
+    and recomputed in bulk for the misses. Unknown ids are left out.
+    """
+    return versioned_cache_many(
+        "ticket_cost",
+        list(dict.fromkeys(ticket_ids)),
+        [COST_RATES_SCOPE],
+        compute_ticket_costs,
+        timeout=current_app.config["TICKET_COST_CACHE_TIMEOUT"],
+        scope=ticket_cost_scope
+    )
+
+
+def cost_report(ticket_ids, progress=None):
+    """
+    {"costs": [...], "missing": [...]} for ticket_ids in request order,
+    looked up COST_BATCH_SIZE tickets at a time. progress(done, total) is
+    called after each batch.
+    """
+    ticket_ids = list(dict.fromkeys(ticket_ids))
+    costs = {}
+    for start in range(0, len(ticket_ids), COST_BATCH_SIZE):
+        costs.update(ticket_costs(ticket_ids[start:start + COST_BATCH_SIZE]))
+        if progress:
+            progress(min(start + COST_BATCH_SIZE, len(ticket_ids)), len(ticket_ids))
+    return {
+        "costs": [costs[i] for i in ticket_ids if i in costs],
+        "missing": [i for i in ticket_ids if i not in costs]
+    }
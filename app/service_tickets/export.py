@@ -0,0 +1,109 @@
+# app/service_tickets/export.py
+import csv
+import io
+import json
+from datetime import datetime
+from app.extensions import db
+from app.models import ServiceTicket
+
+# Columns written by the export, in output order
+EXPORT_COLUMNS = (
+    ServiceTicket.id,
+    ServiceTicket.vehicle_id,
+    ServiceTicket.status,
+    ServiceTicket.created_at,
+    ServiceTicket.description,
+    ServiceTicket.description_of_issue,
+    ServiceTicket.work_performed,
+    ServiceTicket.odometer_reading,
+    ServiceTicket.estimated_cost,
+    ServiceTicket.final_cost,
+)
+EXPORT_FIELDS = [column.key for column in EXPORT_COLUMNS]
+_CREATED_AT = EXPORT_FIELDS.index("created_at")
+
+
+# -------------------------------------------------
+# QUERY
+# -------------------------------------------------
+def parse_export_filters(args):
+    """
+    statuses, created_from (inclusive) and created_to (exclusive) from the
+    query string. Dates are ISO 8601 dates or datetimes. Raises ValueError
+    on malformed dates.
+    """
+    statuses = [s.strip() for s in args.get("status", "").split(",") if s.strip()]
+    created_from = args.get("created_from")
+    created_to = args.get("created_to")
+    return {
+        "statuses": statuses,
+        "created_from": datetime.fromisoformat(created_from) if created_from else None,
+        "created_to": datetime.fromisoformat(created_to) if created_to else None,
+    }
+
+
+def export_statement(statuses=None, created_from=None, created_to=None):
+    """
+    Column-only SELECT over the tickets matching the filters, in id order.
+    """
+    statement = db.select(*EXPORT_COLUMNS).order_by(ServiceTicket.id)
+    if statuses:
+        statement = statement.where(ServiceTicket.status.in_(statuses))
+    if created_from:
+        statement = statement.where(ServiceTicket.created_at >= created_from)
+    if created_to:
+        statement = statement.where(ServiceTicket.created_at < created_to)
+    return statement
+
+
+def iter_partitions(statement, batch_size):
+    """
+    Result rows in lists of batch_size, fetched from a streaming cursor so
+    only one batch is held in memory at a time.
+    """
+    result = db.session.execute(
+        statement.execution_options(stream_results=True, yield_per=batch_size)
+    )
+    try:
+        yield from result.partitions()
+    finally:
+        result.close()
+
+
+# -------------------------------------------------
+# ENCODERS (one output chunk per batch)
+# -------------------------------------------------
+def _with_iso_dates(row):
+    row = list(row)
+    if row[_CREATED_AT] is not None:
+        row[_CREATED_AT] = row[_CREATED_AT].isoformat()
+    return row
+
+
+def iter_csv(partitions):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_FIELDS)
+    for rows in partitions:
+        writer.writerows(_with_iso_dates(row) for row in rows)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def iter_ndjson(partitions):
+    encode = json.JSONEncoder(separators=(",", ":")).encode
+    for rows in partitions:
+        yield "".join(
+            encode(dict(zip(EXPORT_FIELDS, _with_iso_dates(row)))) + "\n"
+            for row in rows
+        )
+
+
+# format query arg -> (encoder, mimetype)
+EXPORT_FORMATS = {
+    "csv": (iter_csv, "text/csv"),
+    "ndjson": (iter_ndjson, "application/x-ndjson"),
+}
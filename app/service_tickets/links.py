@@ -0,0 +1,72 @@
+# app/service_tickets/links.py
+from collections import Counter
+from app.extensions import db
+from app.models import Mechanic, Inventory, ServiceTicketMechanic, service_ticket_inventory
+from app.utils.caching import touch_version_scopes
+from .costs import ticket_cost_scope
+
+
+def _existing_ids(model, ids):
+    """
+    The subset of ids that exist for model, in one IN query.
+    """
+    if not ids:
+        return set()
+    return set(db.session.scalars(db.select(model.id).where(model.id.in_(ids))))
+
+
+def _sync(table, owner_column, target_column, ticket_id, target_model, add_ids, remove_ids):
+    """
+    Set-based sync of one association table for a ticket.
+
+    Ids are resolved with one IN query, the current link rows with one
+    more, and the difference is applied as one executemany INSERT and one
+    DELETE. Adds are applied before removes, so an id present in both
+    lists ends up unlinked. Returns (added, removed) Counters of target id
+    -> number of link rows.
+    """
+    add_ids, remove_ids = set(add_ids), set(remove_ids)
+    valid = _existing_ids(target_model, add_ids | remove_ids)
+    if not valid:
+        return Counter(), Counter()
+
+    linked = Counter(db.session.scalars(
+        db.select(target_column).where(owner_column == ticket_id)
+    ))
+
+    to_remove = (remove_ids & valid) & linked.keys()
+    to_add = (add_ids & valid) - linked.keys() - remove_ids
+
+    if to_add:
+        db.session.execute(
+            db.insert(table),
+            [{owner_column.key: ticket_id, target_column.key: target_id} for target_id in sorted(to_add)]
+        )
+    if to_remove:
+        db.session.execute(
+            db.delete(table)
+            .where(owner_column == ticket_id)
+            .where(target_column.in_(to_remove))
+        )
+    if to_add or to_remove:
+        touch_version_scopes({ticket_cost_scope(ticket_id)})
+
+    added = Counter(to_add)
+    removed = Counter({target_id: linked[target_id] for target_id in to_remove})
+    return added, removed
+
+
+def sync_ticket_mechanics(ticket_id, add_ids=(), remove_ids=()):
+    links = ServiceTicketMechanic.__table__
+    return _sync(
+        links, links.c.ticket_id, links.c.mechanic_id,
+        ticket_id, Mechanic, add_ids, remove_ids
+    )
+
+
+def sync_ticket_parts(ticket_id, add_ids=(), remove_ids=()):
+    links = service_ticket_inventory
+    return _sync(
+        links, links.c.ticket_id, links.c.inventory_id,
+        ticket_id, Inventory, add_ids, remove_ids
+    )
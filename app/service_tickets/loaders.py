@@ -0,0 +1,147 @@
+# app/service_tickets/loaders.py
+from sqlalchemy import inspect
+from sqlalchemy.orm import selectinload
+from app.extensions import db
+from app.models import ServiceTicket, Vehicle
+
+
+# -------------------------------------------------
+# QUERY BUILDERS
+# -------------------------------------------------
+def customer_tickets_query(customer_id, with_links=True):
+    """
+    Tickets for every vehicle owned by a customer.
+
+    With with_links=True the mechanics and parts are loaded with one
+    SELECT ... IN per relationship, so the whole listing costs a fixed
+    number of queries no matter how many tickets the customer has.
+    """
+    query = (
+        ServiceTicket.query
+        .join(Vehicle)
+        .filter(Vehicle.customer_id == customer_id)
+        .order_by(ServiceTicket.id)
+    )
+    if with_links:
+        query = query.options(
+            selectinload(ServiceTicket.mechanics),
+            selectinload(ServiceTicket.inventory),
+        )
+    return query
+
+
+def customer_ticket_page(customer_id, statuses=None, after=None, limit=50):
+    """
+    One page of a customer's ticket summaries in id order, from a single
+    column-only SELECT joined to vehicles. Returns (summaries,
+    next_cursor); next_cursor is the last id on the page when another
+    page follows (one extra row is fetched to tell), else None.
+    """
+    statement = (
+        db.select(ServiceTicket.id, ServiceTicket.description, ServiceTicket.status)
+        .join(Vehicle, Vehicle.id == ServiceTicket.vehicle_id)
+        .where(Vehicle.customer_id == customer_id)
+        .order_by(ServiceTicket.id)
+        .limit(limit + 1)
+    )
+    if statuses:
+        statement = statement.where(ServiceTicket.status.in_(statuses))
+    if after is not None:
+        statement = statement.where(ServiceTicket.id > after)
+
+    rows = db.session.execute(statement).all()
+    next_cursor = rows[limit - 1].id if len(rows) > limit else None
+    return [serialize_ticket_summary(row) for row in rows[:limit]], next_cursor
+
+
+def load_ticket_with_links(ticket_id):
+    """
+    Single ticket with mechanics and parts eager loaded.
+    """
+    return db.session.execute(
+        db.select(ServiceTicket)
+        .options(
+            selectinload(ServiceTicket.mechanics),
+            selectinload(ServiceTicket.inventory),
+        )
+        .filter_by(id=ticket_id)
+        .execution_options(populate_existing=True)
+    ).scalar_one_or_none()
+
+
+# -------------------------------------------------
+# CACHE SCOPES
+# -------------------------------------------------
+def customer_tickets_scope(customer_id):
+    return f"service_tickets:customer:{customer_id}"
+
+
+def _current_and_previous(obj, attribute):
+    history = inspect(obj).attrs[attribute].history
+    return {getattr(obj, attribute), *history.deleted}
+
+
+def _loaded(obj, relationship):
+    # Only a related object already in memory; never lazy loads
+    return inspect(obj).dict.get(relationship)
+
+
+def customer_ticket_scopes(session):
+    """
+    Version scopes (see register_version_scope) of every customer whose
+    tickets or vehicles the session is about to change, including the
+    previous owner when a ticket or vehicle moves.
+    """
+    customer_ids, vehicle_ids = set(), set()
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(obj, Vehicle):
+            customer_ids |= _current_and_previous(obj, "customer_id")
+            customer = _loaded(obj, "customer")
+            if customer is not None:
+                customer_ids.add(customer.id)
+        elif isinstance(obj, ServiceTicket):
+            vehicle_ids |= _current_and_previous(obj, "vehicle_id")
+            vehicle = _loaded(obj, "vehicle")
+            if vehicle is not None:
+                customer_ids |= _current_and_previous(vehicle, "customer_id")
+
+    vehicle_ids.discard(None)
+    if vehicle_ids:
+        customer_ids.update(session.scalars(
+            db.select(Vehicle.customer_id).where(Vehicle.id.in_(vehicle_ids))
+        ))
+    return {customer_tickets_scope(c) for c in customer_ids if c is not None}
+
+
+# -------------------------------------------------
+# SERIALIZERS
+# -------------------------------------------------
+def serialize_ticket_links(ticket):
+    return {
+        "mechanics": [{"id": m.id, "name": m.name} for m in ticket.mechanics],
+        "inventory": [{"id": p.id, "name": p.name, "price": p.price} for p in ticket.inventory]
+    }
+
+
+def serialize_ticket(ticket):
+    data = {
+        "id": ticket.id,
+        "vehicle_id": ticket.vehicle_id,
+        "description": ticket.description,
+        "odometer_reading": ticket.odometer_reading,
+        "description_of_issue": ticket.description_of_issue,
+        "work_performed": ticket.work_performed,
+        "estimated_cost": ticket.estimated_cost,
+        "final_cost": ticket.final_cost,
+        "status": ticket.status,
+    }
+    data.update(serialize_ticket_links(ticket))
+    return data
+
+
+def serialize_ticket_summary(ticket):
+    return {
+        "id": ticket.id,
+        "description": ticket.description,
+        "status": ticket.status
+    }
@@ -1,10 +1,27 @@
 # app/service_tickets/routes.py
-from flask import request, jsonify
+from flask import request, jsonify, current_app, Response, stream_with_context
 from app.extensions import db
 from app.models import ServiceTicket, Mechanic, Inventory, Vehicle
 from . import service_tickets_bp
-from .schemas import service_ticket_schema
+from .costs import ticket_costs, cost_report, ticket_cost_scopes
+from .export import EXPORT_FORMATS, parse_export_filters, export_statement, iter_partitions
+from .links import sync_ticket_mechanics, sync_ticket_parts
+from .loaders import (
+    customer_tickets_query,
+    load_ticket_with_links,
+    serialize_ticket,
+    serialize_ticket_links,
+)
 from app.utils.util import token_required, mechanic_token_required
+from app.utils.jobs import accepted_response
+from app.extensions import job_runner
+from app.mechanics.leaderboard import adjust_leaderboard
+from app.mechanics.hours import adjust_hours, removed_link_hours
+from app.utils.lazy import lazy_import
+from app.utils.replicas import replica_reads
+from app.utils.caching import register_version_scope
+
+service_ticket_schema = lazy_import("app.service_tickets.schemas", "service_ticket_schema")
 
 # -------------------------------------------------
 # CREATE SERVICE TICKET (CUSTOMER ONLY)
@@ -39,35 +56,78 @@ def create_ticket(current_customer_id):
 # GET ALL TICKETS FOR CUSTOMER
 # -------------------------------------------------
 @service_tickets_bp.route("/", methods=["GET"])
+@replica_reads
 @token_required
 def get_tickets(current_customer_id):
-    # Only tickets for vehicles belonging to this customer
-    tickets = (
-        ServiceTicket.query
-        .join(Vehicle)
-        .filter(Vehicle.customer_id == current_customer_id)
-        .all()
-    )
+    # Only tickets for vehicles belonging to this customer; mechanics and
+    # parts are eager loaded so this is a fixed number of queries.
+    tickets = customer_tickets_query(current_customer_id).all()
 
-    result = []
-    for t in tickets:
-        result.append({
-            "id": t.id,
-            "vehicle_id": t.vehicle_id,
-            "description": t.description,
-            "odometer_reading": t.odometer_reading,
-            "description_of_issue": t.description_of_issue,
-            "work_performed": t.work_performed,
-            "estimated_cost": t.estimated_cost,
-            "final_cost": t.final_cost,
-            "status": t.status,
-            "mechanics": [{"id": m.id, "name": m.name} for m in t.mechanics],
-            "inventory": [{"id": p.id, "name": p.name, "price": p.price} for p in t.inventory]
-        })
+    result = [serialize_ticket(t) for t in tickets]
 
     return jsonify(result), 200
 
 
+# -------------------------------------------------
+# EXPORT ALL TICKETS AS CSV / NDJSON (MECHANIC ONLY)
+# -------------------------------------------------
+@service_tickets_bp.route("/export", methods=["GET"])
+@mechanic_token_required
+def export_tickets(current_mechanic_id):
+    fmt = request.args.get("format", "csv")
+    if fmt not in EXPORT_FORMATS:
+        return jsonify({"error": "format must be csv or ndjson"}), 400
+    try:
+        filters = parse_export_filters(request.args)
+    except ValueError:
+        return jsonify({"error": "created_from and created_to must be ISO 8601 dates"}), 400
+
+    # ?async=1 hands the export to the job runner: 202 now, file from
+    # GET /jobs/<id>/result when done
+    if request.args.get("async") == "1":
+        params = {k: request.args[k] for k in ("format", "status", "created_from", "created_to") if k in request.args}
+        return accepted_response(job_runner.submit("ticket_export", params, current_mechanic_id))
+
+    # Rows are streamed from the cursor one batch at a time, so memory
+    # stays flat however many tickets match
+    encode, mimetype = EXPORT_FORMATS[fmt]
+    partitions = iter_partitions(
+        export_statement(**filters),
+        current_app.config["SERVICE_TICKET_EXPORT_BATCH_SIZE"]
+    )
+    return Response(
+        stream_with_context(encode(partitions)),
+        mimetype=mimetype,
+        headers={"Content-Disposition": f"attachment; filename=service_tickets.{fmt}"}
+    )
+
+
+# -------------------------------------------------
+# TICKET COST ROLLUP: PARTS + LABOR (MECHANIC ONLY)
+# -------------------------------------------------
+@service_tickets_bp.route("/<int:ticket_id>/cost", methods=["GET"])
+@mechanic_token_required
+def get_ticket_cost(current_mechanic_id, ticket_id):
+    cost = ticket_costs([ticket_id]).get(ticket_id)
+    if cost is None:
+        return jsonify({"message": "Ticket not found"}), 404
+    return jsonify(cost), 200
+
+
+@service_tickets_bp.route("/costs", methods=["POST"])
+@mechanic_token_required
+def get_ticket_costs(current_mechanic_id):
+    data = request.get_json(silent=True) or {}
+    ticket_ids = data.get("ticket_ids")
+    if not isinstance(ticket_ids, list) or not all(type(i) is int for i in ticket_ids):
+        return jsonify({"error": "ticket_ids must be a list of integers"}), 400
+
+    if request.args.get("async") == "1":
+        return accepted_response(job_runner.submit("ticket_costs", {"ticket_ids": ticket_ids}, current_mechanic_id))
+
+    return jsonify(cost_report(ticket_ids)), 200
+
+
 # -------------------------------------------------
 # EDIT TICKET: ADD/REMOVE MECHANICS & PARTS (MECHANIC OR ADMIN)
 # -------------------------------------------------
@@ -84,35 +144,33 @@ def edit_ticket(current_customer_id, ticket_id):
 
     data = request.get_json()
 
+    # Set-based sync: one IN query per entity type, batched INSERT/DELETE
+    # on the link tables, so large edits cost a constant number of queries.
     # --- Mechanics ---
-    for mech_id in data.get("add_mechanics", []):
-        mechanic = Mechanic.query.get(mech_id)
-        if mechanic and mechanic not in ticket.mechanics:
-            ticket.mechanics.append(mechanic)
-
-    for mech_id in data.get("remove_mechanics", []):
-        mechanic = Mechanic.query.get(mech_id)
-        if mechanic and mechanic in ticket.mechanics:
-            ticket.mechanics.remove(mechanic)
+    removed_hours = removed_link_hours(ticket.id, data.get("remove_mechanics", []))
+    added, removed = sync_ticket_mechanics(
+        ticket.id,
+        data.get("add_mechanics", []),
+        data.get("remove_mechanics", [])
+    )
+    added.subtract(removed)
+    leaderboard_deltas = dict(added)
 
     # --- Inventory / Parts ---
-    for part_id in data.get("add_parts", []):
-        part = Inventory.query.get(part_id)
-        if part and part not in ticket.inventory:
-            ticket.inventory.append(part)
-
-    for part_id in data.get("remove_parts", []):
-        part = Inventory.query.get(part_id)
-        if part and part in ticket.inventory:
-            ticket.inventory.remove(part)
+    sync_ticket_parts(
+        ticket.id,
+        data.get("add_parts", []),
+        data.get("remove_parts", [])
+    )
 
+    adjust_leaderboard(leaderboard_deltas)
+    adjust_hours(removed_hours)
     db.session.commit()
 
-    return jsonify({
-        "ticket_id": ticket.id,
-        "mechanics": [{"id": m.id, "name": m.name} for m in ticket.mechanics],
-        "inventory": [{"id": p.id, "name": p.name, "price": p.price} for p in ticket.inventory]
-    }), 200
+    ticket = load_ticket_with_links(ticket.id)
+    response = {"ticket_id": ticket.id}
+    response.update(serialize_ticket_links(ticket))
+    return jsonify(response), 200
 
 
 # -------------------------------------------------
@@ -181,3 +239,10 @@ def add_part_to_ticket(current_customer_id, ticket_id):
     db.session.commit()
 
     return jsonify({"message": f"Added {quantity} x {part.name} to ticket {ticket.id}"}), 201
+
+
+@service_tickets_bp.record_once
+def _track_ticket_cost_versions(state):
+    # Bumps ticket_cost_scope(id) whenever a flush touches that ticket's
+    # links, and COST_RATES_SCOPE on price or salary changes
+    register_version_scope(ticket_cost_scopes)
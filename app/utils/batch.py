@@ -0,0 +1,188 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from flask import has_request_context, request
+from werkzeug.datastructures import Headers
+from werkzeug.http import parse_cookie
+
+logger = logging.getLogger("app.batch")
+
+# WSGI environ key set on sub-requests dispatched by POST /batch
+BATCH_ENVIRON_KEY = "app.batch"
+
+BATCH_METHODS = {"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE"}
+READ_METHODS = {"GET", "HEAD"}
+
+# Dropped from sub-responses: meaningless once the body is re-encoded, or
+# (Set-Cookie) moved to the batch response
+_HOP_HEADERS = {"Content-Length", "Content-Encoding", "Transfer-Encoding", "Set-Cookie"}
+
+
+def in_batch():
+    """
+    True inside a sub-request of POST /batch. Used as the limiter's
+    default_limits_exempt_when: the batch itself is counted once, while
+    per-route limits still apply to each sub-request.
+    """
+    return has_request_context() and bool(request.environ.get(BATCH_ENVIRON_KEY))
+
+
+def parse_batch(data, max_requests):
+    """
+    Validated sub-requests from a POST /batch body, as
+    {"method", "path", "body", "headers"} dicts. Raises ValueError.
+    """
+    subs = data.get("requests") if isinstance(data, dict) else None
+    if not isinstance(subs, list) or not subs:
+        raise ValueError("requests must be a non-empty list")
+    if len(subs) > max_requests:
+        raise ValueError(f"At most {max_requests} requests per batch")
+
+    parsed = []
+    for sub in subs:
+        if not isinstance(sub, dict):
+            raise ValueError("Each request must be an object")
+        method = str(sub.get("method", "GET")).upper()
+        path = sub.get("path")
+        headers = sub.get("headers") or {}
+        if method not in BATCH_METHODS:
+            raise ValueError(f"Unsupported method: {method}")
+        if not isinstance(path, str) or not path.startswith("/") or path.startswith("//"):
+            raise ValueError("path must be an absolute path, e.g. /vehicles/")
+        if path.split("?")[0].rstrip("/") == "/batch":
+            raise ValueError("Batches cannot be nested")
+        if not isinstance(headers, dict) or not all(isinstance(v, str) for v in headers.values()):
+            raise ValueError("headers must map names to strings")
+        parsed.append({"method": method, "path": path, "body": sub.get("body"), "headers": headers})
+    return parsed
+
+
+class BatchDispatcher:
+    """
+    Runs POST /batch sub-requests through the app's normal request
+    handling (before/after request hooks, auth decorators, error
+    handlers), each in its own app context and so its own db session.
+    Runs of consecutive reads can be spread over a thread pool.
+
+    Config (read in init_app):
+        BATCH_MAX_REQUESTS  sub-requests accepted per batch
+        BATCH_WORKERS       pool size for parallel reads; 0 runs every
+                            sub-request in order on the request thread
+    """
+
+    def __init__(self, app=None):
+        self.max_requests = 20
+        self.workers = 0
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault("BATCH_MAX_REQUESTS", 20)
+        app.config.setdefault("BATCH_WORKERS", 4)
+
+        self.shutdown()
+        self.max_requests = app.config["BATCH_MAX_REQUESTS"]
+        self.workers = app.config["BATCH_WORKERS"]
+        app.extensions["batch_dispatcher"] = self
+
+    # -----------------------------
+    # Pool
+    # -----------------------------
+    def _get_pool(self):
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="batch")
+            return self._pool
+
+    def shutdown(self):
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+    # -----------------------------
+    # Dispatch
+    # -----------------------------
+    def dispatch(self, app, sub, headers, environ_base):
+        """
+        Run one sub-request and return {"status", "headers", "body"}, plus
+        "set_cookies" (its Set-Cookie values) for run() to pop.
+        """
+        headers = Headers(headers)
+        for name, value in sub["headers"].items():
+            headers[name] = value
+        try:
+            with app.app_context(), app.test_request_context(
+                sub["path"],
+                method=sub["method"],
+                json=sub["body"],
+                headers=headers,
+                environ_base={**environ_base, BATCH_ENVIRON_KEY: True},
+            ):
+                response = app.full_dispatch_request()
+                try:
+                    return dict(_serialize(response), set_cookies=response.headers.getlist("Set-Cookie"))
+                finally:
+                    response.close()
+        except Exception:
+            logger.exception("Batch sub-request %s %s failed", sub["method"], sub["path"])
+            return {"status": 500, "headers": {}, "body": {"error": "Internal server error"}, "set_cookies": []}
+
+    def run(self, app, subs, headers, environ_base, parallel=False):
+        """
+        (responses for subs in order, Set-Cookie values they returned).
+        Writes run one at a time in order; with parallel, each run of
+        consecutive reads between them is dispatched concurrently.
+        Cookies set by a write are sent with the sub-requests after it,
+        as a browser would (e.g. the read-your-writes pin).
+        """
+        headers = Headers(headers)
+        responses = []
+        segment = []
+
+        def flush_reads():
+            if len(segment) > 1 and parallel and self.workers:
+                responses.extend(self._get_pool().map(
+                    lambda sub: self.dispatch(app, sub, headers, environ_base), segment
+                ))
+            else:
+                responses.extend(self.dispatch(app, sub, headers, environ_base) for sub in segment)
+            segment.clear()
+
+        for sub in subs:
+            if sub["method"] in READ_METHODS:
+                segment.append(sub)
+                continue
+            flush_reads()
+            response = self.dispatch(app, sub, headers, environ_base)
+            responses.append(response)
+            _carry_cookies(headers, response["set_cookies"])
+        flush_reads()
+
+        set_cookies = [cookie for response in responses for cookie in response.pop("set_cookies")]
+        return responses, set_cookies
+
+
+def _carry_cookies(headers, set_cookies):
+    if not set_cookies:
+        return
+    # Name and value only; the app's cookies need no quoting
+    jar = dict(parse_cookie(headers.get("Cookie", "")))
+    for set_cookie in set_cookies:
+        name, _, rest = set_cookie.partition("=")
+        jar[name] = rest.split(";", 1)[0]
+    headers["Cookie"] = "; ".join(f"{name}={value}" for name, value in jar.items())
+
+
+def _serialize(response):
+    if response.is_json:
+        body = response.get_json(silent=True)
+    else:
+        body = response.get_data(as_text=True) or None
+    return {
+        "status": response.status_code,
+        "headers": {k: v for k, v in response.headers.items() if k not in _HOP_HEADERS},
+        "body": body,
+    }
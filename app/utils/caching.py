@@ -0,0 +1,284 @@
+import hashlib
+import threading
+import time
+import uuid
+from flask import current_app, has_app_context, jsonify, request
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+from app.extensions import cache, db
+from app.utils.replicas import primary_reads
+
+# How long a recompute may hold the cache lock entry before others give
+# up waiting and compute for themselves
+LOCK_TIMEOUT = 10
+LOCK_POLL_INTERVAL = 0.01
+
+_CHANGED_TABLES = "changed_tables"
+_local_locks = [threading.Lock() for _ in range(64)]
+_scope_resolvers = []
+
+
+# -----------------------------
+# Per-table version counters
+# -----------------------------
+# Versions live in the cache_versions table, written in the same
+# transaction as the change, so every worker sees the same version (and
+# ETag) for the same data and sees it as soon as the change commits.
+# A table with no row yet has this version.
+INITIAL_VERSION = "0-0"
+
+
+def _new_version():
+    # Millisecond timestamp first, so readers can tell how recently the
+    # table was written
+    return f"{int(time.time() * 1000):x}-{uuid.uuid4().hex[:8]}"
+
+
+def written_within(versions, seconds):
+    """
+    Whether any of the version tokens was issued in the last seconds.
+    """
+    cutoff = (time.time() - seconds) * 1000
+    return any(int(version.split("-")[0], 16) > cutoff for version in versions)
+
+
+def table_versions(tables):
+    """
+    Current version token for each table, in one query on the primary.
+    """
+    from app.models import CacheVersion
+
+    with primary_reads():
+        found = dict(db.session.execute(
+            db.select(CacheVersion.name, CacheVersion.version).where(CacheVersion.name.in_(tables))
+        ).all())
+    return [found.get(t, INITIAL_VERSION) for t in tables]
+
+
+def bump_versions(connection, tables):
+    """
+    Give each table a new version on connection, inside its transaction.
+    """
+    from app.models import CacheVersion
+
+    # Sorted, so concurrent bumps lock the rows in the same order
+    rows = [{"name": t, "version": _new_version()} for t in sorted(tables)]
+    # MySQL in production, SQLite in tests
+    if connection.dialect.name == "mysql":
+        from sqlalchemy.dialects.mysql import insert
+        statement = insert(CacheVersion.__table__)
+        statement = statement.on_duplicate_key_update(version=statement.inserted.version)
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+        statement = insert(CacheVersion.__table__)
+        statement = statement.on_conflict_do_update(
+            index_elements=["name"], set_={"version": statement.excluded.version}
+        )
+    connection.execute(statement, rows)
+
+
+def _record_tables(session, tables):
+    session.info.setdefault(_CHANGED_TABLES, set()).update(tables)
+
+
+def _tables_in_flush(session):
+    tables = set()
+    deleted = set(session.deleted)
+    for obj in list(session.new) + list(session.dirty) + list(deleted):
+        state = inspect(obj)
+        mapper = state.mapper
+        tables.update(t.name for t in mapper.tables)
+        # Many-to-many collection changes only show up on the owner, and
+        # deleting the owner removes its secondary rows without any
+        for rel in mapper.relationships:
+            if rel.secondary is not None and (
+                obj in deleted or state.attrs[rel.key].history.has_changes()
+            ):
+                tables.add(rel.secondary.name)
+    return tables
+
+
+def _before_flush(session, flush_context, instances):
+    tables = _tables_in_flush(session)
+    for resolver in _scope_resolvers:
+        with session.no_autoflush:
+            tables.update(resolver(session))
+    _record_tables(session, tables)
+
+
+def _do_orm_execute(orm_execute_state):
+    # Bulk INSERT/UPDATE/DELETE issued through session.execute()
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        table = getattr(orm_execute_state.statement, "table", None)
+        if table is not None:
+            _record_tables(orm_execute_state.session, {table.name})
+
+
+def _before_commit(session):
+    if not has_app_context():
+        return
+    # Flush now so this flush's tables are recorded before bumping
+    session.flush()
+    tables = session.info.pop(_CHANGED_TABLES, None)
+    if tables:
+        bump_versions(session.connection(), tables)
+
+
+def _after_rollback(session):
+    session.info.pop(_CHANGED_TABLES, None)
+
+
+def register_cache_versioning():
+    """
+    Bump the version of every table written in a transaction as part of
+    its commit, so versioned_cache entries never need to be deleted by hand.
+    """
+    for name, fn in (
+        ("before_flush", _before_flush),
+        ("do_orm_execute", _do_orm_execute),
+        ("before_commit", _before_commit),
+        ("after_rollback", _after_rollback),
+    ):
+        if not event.contains(Session, name, fn):
+            event.listen(Session, name, fn)
+
+
+def register_version_scope(resolver):
+    """
+    Add resolver(session) -> names of narrower version scopes (e.g. one
+    customer's tickets) touched by the session's pending changes. They are
+    bumped on commit like table names, so a cache entry listing a scope
+    instead of its whole table survives writes to other rows.
+    """
+    if resolver not in _scope_resolvers:
+        _scope_resolvers.append(resolver)
+
+
+def touch_version_scopes(names):
+    """
+    Bump names on commit along with the written tables. For writes issued
+    with session.execute(), which version scope resolvers never see.
+    """
+    _record_tables(db.session, names)
+
+
+# -----------------------------
+# Single-flight cached reads
+# -----------------------------
+def versioned_cache(key, tables, compute, timeout=None):
+    """
+    Return the cached value for key, recomputing it with compute() when
+    any of tables has changed since it was stored.
+
+    Only one caller recomputes a missing entry: threads in this process
+    queue on a local lock, and callers that share the cache backend wait
+    on a lock entry in it. With the default SimpleCache that entry (like
+    the cached values) is per process, so each worker recomputes once;
+    a shared backend (e.g. Redis) makes it one recompute per TTL expiry.
+    """
+    versions = table_versions(tables)
+    return _single_flight(_versioned_key(key, versions), _fresh(compute, versions), timeout)
+
+
+def _versioned_key(key, versions):
+    return f"{key}@{'.'.join(versions)}"
+
+
+def _fresh(compute, versions):
+    """
+    compute, reading from the primary when a table changed recently
+    enough that a read replica may not have the write yet; otherwise a
+    stale replica read would be cached under the new version.
+    """
+    if not written_within(versions, current_app.config.get("DB_REPLICA_STICKY_SECONDS", 0)):
+        return compute
+
+    def from_primary():
+        with primary_reads():
+            return compute()
+    return from_primary
+
+
+def _single_flight(versioned_key, compute, timeout):
+    value = cache.get(versioned_key)
+    if value is not None:
+        return value
+
+    with _local_locks[hash(versioned_key) % len(_local_locks)]:
+        value = cache.get(versioned_key)
+        if value is not None:
+            return value
+
+        lock_key = f"{versioned_key}:lock"
+        if cache.add(lock_key, 1, timeout=LOCK_TIMEOUT):
+            try:
+                value = compute()
+                cache.set(versioned_key, value, timeout=timeout)
+            finally:
+                cache.delete(lock_key)
+            return value
+
+        deadline = time.monotonic() + LOCK_TIMEOUT
+        while time.monotonic() < deadline:
+            time.sleep(LOCK_POLL_INTERVAL)
+            value = cache.get(versioned_key)
+            if value is not None:
+                return value
+
+    return compute()
+
+
+# -----------------------------
+# Conditional GET
+# -----------------------------
+def versioned_json_response(key, tables, compute, timeout=None, private=False):
+    """
+    JSON response for versioned_cache(key, tables, compute) with a strong
+    ETag derived from the table versions, which are the same in every
+    worker. A matching If-None-Match gets a 304 after the one version
+    query, before compute() runs or anything is serialized.
+    """
+    versions = table_versions(tables)
+    versioned_key = _versioned_key(key, versions)
+    etag = hashlib.sha1(versioned_key.encode()).hexdigest()
+
+    # Weak comparison (RFC 9110): gzip responses carry the weak form
+    if request.if_none_match.contains_weak(etag):
+        response = current_app.response_class(status=304)
+    else:
+        response = jsonify(_single_flight(versioned_key, _fresh(compute, versions), timeout))
+
+    response.set_etag(etag)
+    # Clients may keep the body but must revalidate before reusing it
+    response.cache_control.no_cache = True
+    response.cache_control.private = private or None
+    return response
+
+
+def versioned_cache_many(prefix, ids, tables, compute_missing, timeout=None, scope=None):
+    """
+    Per-id cached values for many ids at once: one get_many for the lot,
+    then compute_missing(missing_ids) -> {id: value} for the misses only.
+    Ids compute_missing leaves out are omitted from the result. Entries
+    share the table versions, so they are invalidated like versioned_cache;
+    scope(id), if given, names a version scope of the id's own, looked up
+    in the same query, so bumping it only invalidates that entry.
+    """
+    scopes = {id: scope(id) for id in ids} if scope else {}
+    names = list(tables) + list(dict.fromkeys(scopes.values()))
+    versions = dict(zip(names, table_versions(names)))
+    shared = ".".join(versions[t] for t in tables)
+    keys = {
+        id: f"{prefix}:{id}@{shared}" + (f".{versions[scopes[id]]}" if scope else "")
+        for id in ids
+    }
+    cached = cache.get_many(*keys.values())
+    found = {id: value for id, value in zip(keys, cached) if value is not None}
+
+    missing = [id for id in keys if id not in found]
+    if missing:
+        computed = compute_missing(missing)
+        if computed:
+            cache.set_many({keys[id]: value for id, value in computed.items()}, timeout=timeout)
+        found.update(computed)
+    return found
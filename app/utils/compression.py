@@ -0,0 +1,165 @@
+import gzip
+import hashlib
+import mimetypes
+import os
+import zlib
+from flask import Response, request, send_from_directory
+
+# Text formats worth compressing; images and archives are already compressed
+COMPRESSIBLE_MIMETYPES = {
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/yaml",
+    "image/svg+xml",
+    "text/css",
+    "text/csv",
+    "text/html",
+    "text/plain",
+}
+
+# mimetypes has no entry for YAML on most platforms
+STATIC_MIMETYPES = {".yaml": "application/yaml", ".yml": "application/yaml"}
+
+
+def static_mimetype(filename):
+    ext = os.path.splitext(filename)[1].lower()
+    return STATIC_MIMETYPES.get(ext) or mimetypes.guess_type(filename)[0] or "application/octet-stream"
+
+
+def asset_url(static_folder, filename):
+    """
+    /static URL for filename with a content hash in the query string, so
+    it can be cached for a long time and still change on deploy.
+    """
+    with open(os.path.join(static_folder, filename), "rb") as f:
+        digest = hashlib.sha1(f.read()).hexdigest()[:12]
+    return f"/static/{filename}?v={digest}"
+
+
+def _gzip_stream(chunks, encoded, level):
+    # A sync flush per chunk keeps streamed exports incremental for the client
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    try:
+        for chunk in encoded:
+            yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        yield compressor.flush()
+    finally:
+        if hasattr(chunks, "close"):
+            chunks.close()
+
+
+class Compressor:
+    """
+    gzip for responses when the client sends Accept-Encoding: gzip.
+
+    Buffered responses are compressed once they reach COMPRESS_MIN_SIZE;
+    streamed responses are compressed chunk by chunk as they are sent.
+    Compressed responses get Vary: Accept-Encoding and a weak ETag, since
+    the bytes differ from the identity encoding.
+
+    Files under the static folder are gzipped once at startup and served
+    with a long-lived Cache-Control (link them with asset_url).
+
+    Config:
+        COMPRESS_ENABLED     turn the middleware on (default True)
+        COMPRESS_MIN_SIZE    smallest body in bytes worth compressing (default 1024)
+        COMPRESS_LEVEL       gzip level 1-9 (default 6)
+        STATIC_MAX_AGE       Cache-Control max-age for static files (default 1 year)
+    """
+
+    def __init__(self, app=None):
+        self.static_files = {}
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault("COMPRESS_ENABLED", True)
+        app.config.setdefault("COMPRESS_MIN_SIZE", 1024)
+        app.config.setdefault("COMPRESS_LEVEL", 6)
+        app.config.setdefault("STATIC_MAX_AGE", 365 * 24 * 3600)
+        if not app.config["COMPRESS_ENABLED"]:
+            return
+
+        self.min_size = app.config["COMPRESS_MIN_SIZE"]
+        self.level = app.config["COMPRESS_LEVEL"]
+        self.static_max_age = app.config["STATIC_MAX_AGE"]
+        self.static_folder = app.static_folder
+        self.static_files = self._precompress(app.static_folder)
+
+        app.view_functions["static"] = self.send_static
+        app.after_request(self._compress)
+        app.extensions["compressor"] = self
+
+    # -----------------------------
+    # Dynamic responses
+    # -----------------------------
+    def _compress(self, response):
+        if (
+            response.direct_passthrough
+            or not 200 <= response.status_code < 300
+            or response.status_code in (204, 206)
+            or "Content-Encoding" in response.headers
+            or response.mimetype not in COMPRESSIBLE_MIMETYPES
+        ):
+            return response
+
+        if response.is_streamed:
+            response.vary.add("Accept-Encoding")
+            if not request.accept_encodings["gzip"]:
+                return response
+            response.response = _gzip_stream(response.response, response.iter_encoded(), self.level)
+            response.headers.pop("Content-Length", None)
+        else:
+            data = response.get_data()
+            if len(data) < self.min_size:
+                return response
+            response.vary.add("Accept-Encoding")
+            if not request.accept_encodings["gzip"]:
+                return response
+            response.set_data(gzip.compress(data, self.level, mtime=0))
+
+        response.headers["Content-Encoding"] = "gzip"
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+        return response
+
+    # -----------------------------
+    # Static files
+    # -----------------------------
+    def _precompress(self, static_folder):
+        """
+        filename -> gzipped bytes for every compressible static file.
+        """
+        files = {}
+        if not static_folder or not os.path.isdir(static_folder):
+            return files
+        for root, _, names in os.walk(static_folder):
+            for name in names:
+                path = os.path.join(root, name)
+                filename = os.path.relpath(path, static_folder).replace(os.sep, "/")
+                if static_mimetype(filename) not in COMPRESSIBLE_MIMETYPES:
+                    continue
+                with open(path, "rb") as f:
+                    files[filename] = gzip.compress(f.read(), 9, mtime=0)
+        return files
+
+    def send_static(self, filename):
+        compressed = self.static_files.get(filename)
+        if compressed is None or not request.accept_encodings["gzip"]:
+            response = send_from_directory(
+                self.static_folder, filename,
+                mimetype=static_mimetype(filename), max_age=self.static_max_age
+            )
+        else:
+            response = Response(compressed, mimetype=static_mimetype(filename))
+            response.headers["Content-Encoding"] = "gzip"
+            response.set_etag(hashlib.sha1(compressed).hexdigest())
+            response.cache_control.public = True
+            response.cache_control.max_age = self.static_max_age
+            response.make_conditional(request)
+
+        if compressed is not None:
+            response.vary.add("Accept-Encoding")
+        return response
@@ -0,0 +1,290 @@
+import json
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from flask import current_app, jsonify, url_for
+from sqlalchemy import inspect
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger("app.jobs")
+
+# Minimum seconds between progress writes for one job
+PROGRESS_INTERVAL = 0.5
+
+INTERRUPTED_ERROR = "Interrupted: the process running this job exited"
+
+RESULT_EXTENSIONS = {
+    "application/json": ".json",
+    "text/csv": ".csv",
+    "application/x-ndjson": ".ndjson",
+}
+
+
+class FileResult:
+    """
+    Task result written to the result store chunk by chunk instead of
+    being serialized as JSON, e.g. a CSV export generator.
+    """
+
+    def __init__(self, chunks, mimetype):
+        self.chunks = chunks
+        self.mimetype = mimetype
+
+
+class JobContext:
+    """
+    Handed to a running task for progress reporting. Progress is written
+    on its own connection (throttled to PROGRESS_INTERVAL) so it never
+    commits the task's own transaction.
+    """
+
+    def __init__(self, runner, job_id):
+        self.runner = runner
+        self.job_id = job_id
+        self._last_write = 0.0
+
+    def progress(self, done, total):
+        now = time.monotonic()
+        if not total or now - self._last_write < PROGRESS_INTERVAL:
+            return
+        self._last_write = now
+        self.runner.update_job(self.job_id, progress=min(done / total, 1.0))
+
+
+class JobRunner:
+    """
+    Runs registered tasks outside the request in a thread pool, tracking
+    each run in the jobs table and keeping its result in the result store.
+
+    Config (read in init_app):
+        JOBS_WORKERS     pool size; 0 runs each job inline when submitted
+        JOBS_RESULT_DIR  directory for result files (defaults to
+                         <instance path>/job_results)
+        JOBS_RECOVER_INTERRUPTED
+                         fail this host's queued/running jobs whose
+                         process has exited, at startup
+    """
+
+    def __init__(self, app=None, db=None):
+        self.tasks = {}
+        self.db = None
+        self.workers = 0
+        self.result_dir = None
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        if app is not None:
+            self.init_app(app, db)
+
+    def init_app(self, app, db):
+        app.config.setdefault("JOBS_WORKERS", 2)
+        app.config.setdefault("JOBS_RESULT_DIR", os.path.join(app.instance_path, "job_results"))
+        app.config.setdefault("JOBS_RECOVER_INTERRUPTED", True)
+
+        self.shutdown()
+        self.db = db
+        self.workers = app.config["JOBS_WORKERS"]
+        self.result_dir = app.config["JOBS_RESULT_DIR"]
+        app.extensions["job_runner"] = self
+
+        if app.config["JOBS_RECOVER_INTERRUPTED"]:
+            with app.app_context():
+                self._recover_on_startup()
+
+    def _recover_on_startup(self):
+        from app.models import Job
+
+        try:
+            # e.g. `flask db upgrade` before the jobs table exists
+            if not inspect(self.db.engine).has_table(Job.__tablename__):
+                logger.info("No %s table yet; skipping interrupted job recovery", Job.__tablename__)
+                return
+            self.recover_interrupted()
+        except SQLAlchemyError as error:
+            logger.warning("Could not check for interrupted jobs: %s", error.__class__.__name__)
+
+    def task(self, name):
+        """
+        Register fn(params, ctx) as job type name. It returns JSON-able
+        data or a FileResult, and may call ctx.progress(done, total).
+        """
+        def register(fn):
+            self.tasks[name] = fn
+            return fn
+        return register
+
+    # -----------------------------
+    # Pool
+    # -----------------------------
+    def _get_pool(self):
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="job")
+            return self._pool
+
+    def shutdown(self):
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+    # -----------------------------
+    # Public API
+    # -----------------------------
+    def submit(self, job_type, params=None, mechanic_id=None):
+        """
+        Record a queued job and start it. Returns the Job, refreshed so an
+        inline run is already reflected in its status.
+        """
+        from app.models import Job
+
+        db = self.db
+        if job_type not in self.tasks:
+            raise ValueError(f"Unknown job type: {job_type}")
+
+        job = Job(
+            id=uuid.uuid4().hex, type=job_type, params=params or {},
+            created_by_mechanic_id=mechanic_id, runner=_runner_id(),
+        )
+        db.session.add(job)
+        db.session.commit()
+
+        app = current_app._get_current_object()
+        if self.workers:
+            self._get_pool().submit(self._execute, app, job.id)
+        else:
+            self._execute(app, job.id)
+            db.session.refresh(job)
+        return job
+
+    def update_job(self, job_id, **values):
+        """
+        Update a job row on a separate session, outside any task transaction.
+        """
+        from app.models import Job
+
+        with Session(self.db.engine) as session:
+            session.execute(self.db.update(Job).where(Job.id == job_id).values(**values))
+            session.commit()
+
+    def recover_interrupted(self):
+        """
+        Mark queued/running jobs failed when the process that owned them
+        on this host has exited (a crash or restart), so they do not stay
+        pending forever. Jobs owned by other hosts are left alone. Meant
+        for startup, before this process submits jobs of its own. Returns
+        the number of jobs marked failed.
+        """
+        from app.models import Job, utcnow
+
+        with Session(self.db.engine) as session:
+            pending = session.execute(
+                self.db.select(Job.id, Job.runner).where(Job.status.in_(("queued", "running")))
+            ).all()
+            interrupted = [job_id for job_id, runner in pending if _runner_exited(runner)]
+            if interrupted:
+                session.execute(
+                    self.db.update(Job)
+                    .where(Job.id.in_(interrupted), Job.status.in_(("queued", "running")))
+                    .values(status="failed", error=INTERRUPTED_ERROR, finished_at=utcnow())
+                )
+                session.commit()
+                logger.warning("Marked %d interrupted job(s) failed", len(interrupted))
+        return len(interrupted)
+
+    def result_path(self, job):
+        return os.path.join(self.result_dir, job.id + RESULT_EXTENSIONS.get(job.result_mimetype, ""))
+
+    # -----------------------------
+    # Execution
+    # -----------------------------
+    def _execute(self, app, job_id):
+        with app.app_context():
+            try:
+                self._run(job_id)
+            except Exception:
+                logger.exception("Job %s could not be recorded", job_id)
+            finally:
+                self.db.session.remove()
+
+    def _run(self, job_id):
+        from app.models import Job, utcnow
+
+        db = self.db
+        job = db.session.get(Job, job_id)
+        job.status = "running"
+        job.started_at = utcnow()
+        job_type, params = job.type, dict(job.params or {})
+        db.session.commit()
+
+        try:
+            mimetype, size = self._store(job_id, self.tasks[job_type](params, JobContext(self, job_id)))
+        except Exception as err:
+            db.session.rollback()
+            logger.exception("Job %s (%s) failed", job_id, job_type)
+            values = {"status": "failed", "error": str(err) or type(err).__name__}
+        else:
+            values = {"status": "succeeded", "progress": 1.0, "result_mimetype": mimetype, "result_size": size}
+
+        db.session.execute(
+            db.update(Job).where(Job.id == job_id).values(finished_at=utcnow(), **values)
+        )
+        db.session.commit()
+
+    def _store(self, job_id, result):
+        if isinstance(result, FileResult):
+            mimetype, chunks = result.mimetype, result.chunks
+        else:
+            mimetype, chunks = "application/json", [json.dumps(result)]
+
+        os.makedirs(self.result_dir, exist_ok=True)
+        path = os.path.join(self.result_dir, job_id + RESULT_EXTENSIONS.get(mimetype, ""))
+        partial = path + ".partial"
+        try:
+            with open(partial, "w", encoding="utf-8", newline="") as f:
+                for chunk in chunks:
+                    f.write(chunk)
+            os.replace(partial, path)
+        finally:
+            if os.path.exists(partial):
+                os.remove(partial)
+        return mimetype, os.path.getsize(path)
+
+
+def _runner_id():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _runner_exited(runner):
+    # Jobs recorded before runners were tracked count as exited
+    host, _, pid = (runner or "").rpartition(":")
+    if not runner or not pid.isdigit():
+        return True
+    if host != socket.gethostname():
+        return False
+    if int(pid) == os.getpid():
+        # A previous process that had this pid
+        return True
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return True
+    except PermissionError:
+        return False
+    return False
+
+
+def accepted_response(job):
+    """
+    202 response for work handed to the job runner, pointing at the job's
+    status endpoint.
+    """
+    status_url = url_for("jobs.get_job", job_id=job.id)
+    response = jsonify({"id": job.id, "type": job.type, "status": job.status, "status_url": status_url})
+    response.status_code = 202
+    response.headers["Location"] = status_url
+    return response
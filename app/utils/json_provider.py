@@ -0,0 +1,74 @@
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # optional speedup; the stdlib provider is used without it
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    app.json provider that encodes with orjson, keeping Flask's defaults:
+    sorted keys, non-string keys converted to strings, and dates, Decimals,
+    UUIDs and dataclasses handed to the same default() (RFC 822 dates,
+    Decimals as strings).
+
+    Differences from the stdlib provider: non-ASCII text is written as
+    UTF-8 instead of \\u escapes, and NaN/Infinity become null. Calls with
+    json.dumps keyword arguments (indent, ...) and values orjson cannot
+    encode (ints beyond 64 bits) fall back to the stdlib.
+    """
+
+    def _options(self):
+        options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        return options
+
+    def _encode(self, obj):
+        try:
+            return orjson.dumps(obj, default=self.default, option=self._options())
+        except orjson.JSONEncodeError:
+            return super().dumps(obj, separators=(",", ":")).encode()
+
+    def dumps(self, obj, **kwargs):
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return self._encode(obj).decode()
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            # The stdlib accepts a little more (huge ints, NaN) and raises
+            # the usual error for anything else
+            return super().loads(s)
+
+    def response(self, *args, **kwargs):
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self._encode(obj) + b"\n", mimetype=self.mimetype)
+
+
+# JSON_PROVIDER config value -> provider class (None when not installed)
+JSON_PROVIDERS = {
+    "stdlib": DefaultJSONProvider,
+    "orjson": OrjsonProvider if orjson is not None else None,
+}
+
+
+def select_json_provider(name="auto"):
+    """
+    Provider class for JSON_PROVIDER: "auto" picks the fastest installed
+    encoder, "orjson" or "stdlib" force one. Raises ValueError for an
+    unknown or uninstalled provider.
+    """
+    if name == "auto":
+        return JSON_PROVIDERS["orjson"] or DefaultJSONProvider
+    provider = JSON_PROVIDERS.get(name)
+    if provider is None:
+        raise ValueError(f"JSON provider {name!r} is not available")
+    return provider
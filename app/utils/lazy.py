@@ -0,0 +1,50 @@
+from functools import partial
+from importlib import import_module
+
+_UNSET = object()
+
+
+class Lazy:
+    """
+    Stand-in for a value built on first use: attribute access and calls
+    are forwarded to factory()'s result, which is built once and kept.
+    Two threads racing on first use may both run factory(); the imports
+    and schema constructors used here are safe to repeat.
+    """
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._value = _UNSET
+
+    def resolve(self):
+        value = self._value
+        if value is _UNSET:
+            value = self._value = self._factory()
+        return value
+
+    def __getattr__(self, name):
+        return getattr(self.resolve(), name)
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+    def __repr__(self):
+        state = "unresolved" if self._value is _UNSET else repr(self._value)
+        return f"<Lazy {state}>"
+
+
+def _import_attr(module, name):
+    return getattr(import_module(module), name)
+
+
+def lazy_import(module, *names):
+    """
+    Lazy stand-ins for names in module (or for the module itself when no
+    names are given), which is only imported when one of them is first
+    used. Lets route modules reference their schemas without building
+    every SQLAlchemyAutoSchema at startup.
+    """
+    if not names:
+        return Lazy(partial(import_module, module))
+    stand_ins = [Lazy(partial(_import_attr, module, name)) for name in names]
+    return stand_ins[0] if len(stand_ins) == 1 else stand_ins
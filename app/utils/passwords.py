@@ -0,0 +1,130 @@
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from flask import jsonify
+from werkzeug.security import (
+    generate_password_hash,
+    check_password_hash,
+    DEFAULT_PBKDF2_ITERATIONS,
+)
+
+DEFAULT_HASH_METHOD = f"pbkdf2:sha256:{DEFAULT_PBKDF2_ITERATIONS}"
+
+
+def _expand_method(method):
+    """
+    method with werkzeug's defaults filled in, i.e. the prefix
+    generate_password_hash writes into the hash ("scrypt" ->
+    "scrypt:32768:8:1"). Unknown methods are returned unchanged.
+    """
+    name, *args = method.split(":")
+    if name == "scrypt" and not args:
+        return "scrypt:32768:8:1"
+    if name == "pbkdf2" and len(args) < 2:
+        hash_name = args[0] if args else "sha256"
+        return f"pbkdf2:{hash_name}:{DEFAULT_PBKDF2_ITERATIONS}"
+    return method
+
+
+class HasherBusy(Exception):
+    """
+    Raised when the hashing queue is full, so the request can be shed
+    with a 503 instead of piling up behind CPU-bound work.
+    """
+
+
+class PasswordHasher:
+    """
+    Runs password hashing and verification in a process pool so a login
+    burst does not pin request threads on pbkdf2.
+
+    Config (read in init_app):
+        PASSWORD_HASH_METHOD      werkzeug method string incl. cost,
+                                  e.g. "pbkdf2:sha256:1000000"
+        PASSWORD_HASH_WORKERS     pool size; 0 hashes inline on the
+                                  request thread
+        PASSWORD_HASH_QUEUE_SIZE  max hashes queued or running at once
+        PASSWORD_HASH_TIMEOUT     seconds to wait for a queue slot
+                                  before raising HasherBusy
+    """
+
+    def __init__(self, app=None):
+        self.method = DEFAULT_HASH_METHOD
+        self.workers = 0
+        self.timeout = 1.0
+        self._slots = None
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault("PASSWORD_HASH_METHOD", DEFAULT_HASH_METHOD)
+        app.config.setdefault("PASSWORD_HASH_WORKERS", 2)
+        app.config.setdefault("PASSWORD_HASH_QUEUE_SIZE", 64)
+        app.config.setdefault("PASSWORD_HASH_TIMEOUT", 1.0)
+
+        self.shutdown()
+        # Expanded so needs_rehash compares like with like
+        self.method = _expand_method(app.config["PASSWORD_HASH_METHOD"])
+        self.workers = app.config["PASSWORD_HASH_WORKERS"]
+        self.timeout = app.config["PASSWORD_HASH_TIMEOUT"]
+        self._slots = threading.BoundedSemaphore(app.config["PASSWORD_HASH_QUEUE_SIZE"])
+
+        app.register_error_handler(HasherBusy, _busy_response)
+        app.extensions["password_hasher"] = self
+
+    # -----------------------------
+    # Pool
+    # -----------------------------
+    def _get_pool(self):
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers)
+            return self._pool
+
+    def shutdown(self):
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+    def _run(self, fn, *args):
+        if not self._slots.acquire(timeout=self.timeout):
+            raise HasherBusy()
+
+        if not self.workers:
+            try:
+                return fn(*args)
+            finally:
+                self._slots.release()
+
+        try:
+            future = self._get_pool().submit(fn, *args)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future.result()
+
+    # -----------------------------
+    # Public API
+    # -----------------------------
+    def hash(self, password):
+        return self._run(generate_password_hash, password, self.method)
+
+    def verify(self, stored_hash, password):
+        return self._run(check_password_hash, stored_hash, password)
+
+    def needs_rehash(self, stored_hash):
+        """
+        True when stored_hash was made with a different method or cost
+        than the one currently configured.
+        """
+        return stored_hash.split("$", 1)[0] != self.method
+
+
+def _busy_response(error):
+    response = jsonify({"error": "Server busy, please retry"})
+    response.status_code = 503
+    response.headers["Retry-After"] = "1"
+    return response
@@ -0,0 +1,136 @@
+import os
+import threading
+import time
+from sqlalchemy import event, exc
+from sqlalchemy.pool import QueuePool
+
+
+def engine_options_from_env(environ=os.environ):
+    """
+    SQLALCHEMY_ENGINE_OPTIONS for a pooled server database, overridable
+    with DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE
+    and DB_POOL_PRE_PING.
+    """
+    return {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": int(environ.get("DB_POOL_SIZE", 10)),
+        "max_overflow": int(environ.get("DB_MAX_OVERFLOW", 20)),
+        "pool_timeout": int(environ.get("DB_POOL_TIMEOUT", 30)),
+        # Recycle before MySQL/proxy idle timeouts drop the connection
+        "pool_recycle": int(environ.get("DB_POOL_RECYCLE", 1800)),
+        "pool_pre_ping": environ.get("DB_POOL_PRE_PING", "1").lower() not in ("0", "false", "no"),
+    }
+
+
+class PoolMetrics:
+    """
+    Counters for one connection pool, fed by pool events and by
+    InstrumentedQueuePool's checkout timing.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.checkouts = 0
+            self.timeouts = 0
+            self.waits = 0
+            self.peak_checked_out = 0
+            self.peak_overflow = 0
+            self.wait_total = 0.0
+            self.wait_max = 0.0
+            self._checked_out = 0
+
+    def record_wait(self, seconds, timed_out=False):
+        with self._lock:
+            self.waits += 1
+            self.wait_total += seconds
+            self.wait_max = max(self.wait_max, seconds)
+            if timed_out:
+                self.timeouts += 1
+
+    def attach(self, engine):
+        pool = engine.pool
+        if isinstance(pool, InstrumentedQueuePool):
+            pool.metrics = self
+
+        @event.listens_for(engine, "checkout")
+        def on_checkout(dbapi_conn, conn_record, conn_proxy):
+            with self._lock:
+                self.checkouts += 1
+                self._checked_out += 1
+                self.peak_checked_out = max(self.peak_checked_out, self._checked_out)
+                overflow = engine.pool.overflow() if isinstance(engine.pool, QueuePool) else 0
+                self.peak_overflow = max(self.peak_overflow, overflow)
+
+        @event.listens_for(engine, "checkin")
+        def on_checkin(dbapi_conn, conn_record):
+            with self._lock:
+                self._checked_out = max(self._checked_out - 1, 0)
+
+    def snapshot(self, engine):
+        pool = engine.pool
+        queue_pool = isinstance(pool, QueuePool)
+        with self._lock:
+            return {
+                "pool_class": type(pool).__name__,
+                "size": pool.size() if queue_pool else None,
+                "checked_out": pool.checkedout() if queue_pool else self._checked_out,
+                "overflow": pool.overflow() if queue_pool else 0,
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "peak_checked_out": self.peak_checked_out,
+                "peak_overflow": self.peak_overflow,
+                "wait_avg_ms": (self.wait_total / self.waits * 1000) if self.waits else 0.0,
+                "wait_max_ms": self.wait_max * 1000,
+            }
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    QueuePool that times how long each checkout waits for a connection.
+    """
+
+    metrics = None
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except exc.TimeoutError:
+            if self.metrics is not None:
+                self.metrics.record_wait(time.perf_counter() - start, timed_out=True)
+            raise
+        if self.metrics is not None:
+            self.metrics.record_wait(time.perf_counter() - start)
+        return conn
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+def init_pool_metrics(app, db):
+    """
+    Attach a PoolMetrics to every engine of db and store them on
+    app.extensions["pool_metrics"], keyed by bind name.
+    """
+    metrics = {}
+    with app.app_context():
+        for bind_key, engine in db.engines.items():
+            metrics[bind_key] = PoolMetrics()
+            metrics[bind_key].attach(engine)
+    app.extensions["pool_metrics"] = metrics
+    return metrics
+
+
+def pool_status(app, db):
+    metrics = app.extensions.get("pool_metrics", {})
+    return {
+        bind_key or "default": metrics[bind_key].snapshot(engine)
+        for bind_key, engine in db.engines.items()
+        if bind_key in metrics
+    }
@@ -0,0 +1,116 @@
+import logging
+import re
+import time
+from collections import Counter
+from flask import g, has_request_context, request
+from sqlalchemy import event
+
+logger = logging.getLogger("app.sql_profiler")
+
+_WHITESPACE = re.compile(r"\s+")
+# Expanded IN lists ("IN (?, ?, ?)") differ only in length; fold them
+_IN_LIST = re.compile(r"\bIN\s*\((?:\s*(?:\?|%s|:\w+)\s*,?)+\)", re.IGNORECASE)
+
+
+def statement_shape(statement):
+    """
+    Normalize a parameterized statement so repeats of the same query
+    with different bound values (or IN-list lengths) compare equal.
+    """
+    shape = _WHITESPACE.sub(" ", statement).strip()
+    return _IN_LIST.sub("IN (...)", shape)
+
+
+class RequestProfile:
+    def __init__(self):
+        self.count = 0
+        self.db_time = 0.0
+        self.shapes = Counter()
+
+    def record(self, statement, elapsed):
+        self.count += 1
+        self.db_time += elapsed
+        self.shapes[statement_shape(statement)] += 1
+
+    def repeated(self, threshold):
+        """
+        Statement shapes run more than threshold times, most frequent first.
+        """
+        return [(shape, n) for shape, n in self.shapes.most_common() if n > threshold]
+
+
+class SQLProfiler:
+    """
+    Opt-in per-request SQL profiling.
+
+    Counts statements and DB time for each request, reports them in
+    X-DB-Query-Count / X-DB-Time-Ms headers and a log line, and flags a
+    likely N+1 (X-DB-N-Plus-One header, warning log) when one statement
+    shape runs more than SQL_PROFILER_N_PLUS_ONE_THRESHOLD times.
+
+    Config:
+        SQL_PROFILER_ENABLED                 turn the middleware on
+        SQL_PROFILER_N_PLUS_ONE_THRESHOLD    repeats before flagging (default 10)
+    """
+
+    def __init__(self, app=None, db=None):
+        if app is not None:
+            self.init_app(app, db)
+
+    def init_app(self, app, db):
+        app.config.setdefault("SQL_PROFILER_ENABLED", False)
+        app.config.setdefault("SQL_PROFILER_N_PLUS_ONE_THRESHOLD", 10)
+        if not app.config["SQL_PROFILER_ENABLED"]:
+            return
+
+        self.threshold = app.config["SQL_PROFILER_N_PLUS_ONE_THRESHOLD"]
+
+        with app.app_context():
+            for engine in db.engines.values():
+                event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+                event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+        app.before_request(self._start)
+        app.after_request(self._finish)
+        app.extensions["sql_profiler"] = self
+
+    def _start(self):
+        g.sql_profile = RequestProfile()
+
+    def _finish(self, response):
+        profile = g.pop("sql_profile", None)
+        if profile is None:
+            return response
+
+        response.headers["X-DB-Query-Count"] = str(profile.count)
+        response.headers["X-DB-Time-Ms"] = f"{profile.db_time * 1000:.2f}"
+        logger.info(
+            "%s %s %s queries=%d db_ms=%.2f",
+            request.method, request.path, response.status_code,
+            profile.count, profile.db_time * 1000
+        )
+
+        repeated = profile.repeated(self.threshold)
+        if repeated:
+            response.headers["X-DB-N-Plus-One"] = str(repeated[0][1])
+            for shape, n in repeated:
+                logger.warning(
+                    "Possible N+1 in %s %s: statement ran %d times: %s",
+                    request.method, request.path, n, shape
+                )
+        return response
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("profiler_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get("profiler_start")
+    if not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+    if has_request_context():
+        profile = g.get("sql_profile")
+        if profile is not None:
+            profile.record(statement, elapsed)
@@ -0,0 +1,192 @@
+import os
+import sqlite3
+import threading
+import time
+import urllib.parse
+from limits.storage import Storage, MovingWindowSupport
+
+_SCHEMA = [
+    # Fixed / elastic window counters
+    "CREATE TABLE IF NOT EXISTS counters ("
+    "key TEXT PRIMARY KEY, value INTEGER NOT NULL, expiry REAL NOT NULL) WITHOUT ROWID",
+    # Moving window: one row per acquired entry, kept until ts + its window
+    "CREATE TABLE IF NOT EXISTS events (key TEXT NOT NULL, ts REAL NOT NULL, expiry REAL NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS ix_events_key_ts ON events (key, ts)",
+]
+
+# Longest default/route limit window; bounds events written before the
+# expiry column existed
+_LEGACY_EVENT_WINDOW = 24 * 3600
+
+
+def _upgrade_events(conn):
+    # Files created before events.expiry: add it, inside a write
+    # transaction so concurrent workers do not both alter the table
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(events)")}
+        if "expiry" not in columns:
+            conn.execute("ALTER TABLE events ADD COLUMN expiry REAL NOT NULL DEFAULT 0")
+            conn.execute("UPDATE events SET expiry = ts + ?", (_LEGACY_EVENT_WINDOW,))
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("CREATE INDEX IF NOT EXISTS ix_events_expiry ON events (expiry)")
+
+
+class SQLiteStorage(Storage, MovingWindowSupport):
+    """
+    Flask-Limiter / limits storage in a SQLite database in WAL mode, so
+    every worker process on the host shares the same counters and they
+    survive restarts.
+
+        RATELIMIT_STORAGE_URI = "sqlite:////var/lib/mechanic-shop/ratelimit.db"
+
+    Each thread keeps its own connection (reopened after a fork). Fixed
+    window hits are a single UPSERT; moving window acquisitions run in a
+    BEGIN IMMEDIATE transaction so check-and-insert is atomic across
+    processes.
+
+    Expired rows are only replaced when their own key is hit again, so
+    every sweep_interval seconds (per process) a hit also deletes expired
+    counters and events. Each event stores its own expiry, so a sweep
+    never cuts into another limit's longer window.
+    """
+
+    STORAGE_SCHEME = ["sqlite"]
+
+    def __init__(self, uri=None, wrap_exceptions=False, busy_timeout=5000, sweep_interval=60, **options):
+        # Same convention as SQLAlchemy: sqlite:///relative.db, sqlite:////abs.db
+        self.path = urllib.parse.urlparse(uri).path[1:] or ":memory:"
+        self.busy_timeout = int(busy_timeout)
+        self.sweep_interval = float(sweep_interval)
+        self._next_sweep = 0.0
+        self._local = threading.local()
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+
+    @property
+    def base_exceptions(self):
+        return sqlite3.Error
+
+    @property
+    def connection(self):
+        local = self._local
+        if getattr(local, "pid", None) != os.getpid():
+            conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+            conn.execute(f"PRAGMA busy_timeout = {self.busy_timeout}")
+            conn.execute("PRAGMA journal_mode = WAL")
+            # WAL + NORMAL only syncs at checkpoints; losing the last few
+            # hits on power loss is fine for rate limiting
+            conn.execute("PRAGMA synchronous = NORMAL")
+            for statement in _SCHEMA:
+                conn.execute(statement)
+            _upgrade_events(conn)
+            local.conn, local.pid = conn, os.getpid()
+        return local.conn
+
+    # -----------------------------
+    # Fixed window
+    # -----------------------------
+    def incr(self, key, expiry, elastic_expiry=False, amount=1):
+        now = time.time()
+        self._maybe_sweep(now)
+        return self.connection.execute(
+            "INSERT INTO counters (key, value, expiry) VALUES (:key, :amount, :new_expiry) "
+            "ON CONFLICT (key) DO UPDATE SET "
+            "value = CASE WHEN expiry <= :now THEN :amount ELSE value + :amount END, "
+            "expiry = CASE WHEN expiry <= :now OR :elastic THEN :new_expiry ELSE expiry END "
+            "RETURNING value",
+            {"key": key, "amount": amount, "now": now, "new_expiry": now + expiry, "elastic": elastic_expiry},
+        ).fetchone()[0]
+
+    def get(self, key):
+        row = self.connection.execute(
+            "SELECT value FROM counters WHERE key = ? AND expiry > ?", (key, time.time())
+        ).fetchone()
+        return row[0] if row else 0
+
+    def get_expiry(self, key):
+        now = time.time()
+        row = self.connection.execute(
+            "SELECT expiry FROM counters WHERE key = ? AND expiry > ?", (key, now)
+        ).fetchone()
+        return row[0] if row else now
+
+    # -----------------------------
+    # Moving window
+    # -----------------------------
+    def acquire_entry(self, key, limit, expiry, amount=1):
+        if amount > limit:
+            return False
+
+        conn = self.connection
+        now = time.time()
+        self._maybe_sweep(now)
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # The window is full when the (limit - amount + 1)th newest
+            # entry is still inside it
+            row = conn.execute(
+                "SELECT ts FROM events WHERE key = ? ORDER BY ts DESC LIMIT 1 OFFSET ?",
+                (key, limit - amount),
+            ).fetchone()
+            if row and row[0] > now - expiry:
+                conn.execute("COMMIT")
+                return False
+
+            conn.execute("DELETE FROM events WHERE key = ? AND ts <= ?", (key, now - expiry))
+            conn.executemany(
+                "INSERT INTO events (key, ts, expiry) VALUES (?, ?, ?)", [(key, now, now + expiry)] * amount
+            )
+            conn.execute("COMMIT")
+            return True
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def get_moving_window(self, key, limit, expiry):
+        now = time.time()
+        start, count = self.connection.execute(
+            "SELECT MIN(ts), COUNT(*) FROM events WHERE key = ? AND ts > ?", (key, now - expiry)
+        ).fetchone()
+        return (start if count else now), count
+
+    # -----------------------------
+    # Maintenance
+    # -----------------------------
+    def check(self):
+        try:
+            self.connection.execute("SELECT 1")
+            return True
+        except sqlite3.Error:
+            return False
+
+    def _maybe_sweep(self, now):
+        if now >= self._next_sweep:
+            self._next_sweep = now + self.sweep_interval
+            self.sweep(now)
+
+    def sweep(self, now=None):
+        """
+        Delete expired counters and events. Returns the number of rows
+        deleted.
+        """
+        now = time.time() if now is None else now
+        conn = self.connection
+        deleted = conn.execute("DELETE FROM counters WHERE expiry <= ?", (now,)).rowcount
+        deleted += conn.execute("DELETE FROM events WHERE expiry <= ?", (now,)).rowcount
+        return deleted
+
+    def clear(self, key):
+        conn = self.connection
+        conn.execute("DELETE FROM counters WHERE key = ?", (key,))
+        conn.execute("DELETE FROM events WHERE key = ?", (key,))
+
+    def reset(self):
+        conn = self.connection
+        cleared = conn.execute("DELETE FROM counters").rowcount
+        cleared += conn.execute("DELETE FROM events").rowcount
+        return cleared
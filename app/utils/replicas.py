@@ -0,0 +1,138 @@
+from contextlib import contextmanager
+from functools import wraps
+from flask import current_app, g, has_request_context, request
+from flask_sqlalchemy.session import Session
+from itsdangerous import BadSignature, URLSafeTimedSerializer
+from sqlalchemy import event
+
+# SQLALCHEMY_BINDS key of the read replica
+REPLICA_BIND = "replica"
+
+# Cookie a client that just wrote carries for DB_REPLICA_STICKY_SECONDS
+PIN_COOKIE = "db_primary_pin"
+
+_WROTE = "wrote_to_primary"
+
+
+def replica_configured():
+    return REPLICA_BIND in (current_app.config.get("SQLALCHEMY_BINDS") or {})
+
+
+class RoutingSession(Session):
+    """
+    db.session class that sends reads made inside replica_reads views to
+    the "replica" bind. Flushes, DML statements and every read after them
+    in the same session go to the primary, so a request reads its own
+    writes.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and has_request_context() and g.get("db_replica_reads"):
+            if self._flushing or getattr(clause, "is_dml", False):
+                self.info[_WROTE] = True
+            elif not self.info.get(_WROTE) and not g.get("db_force_primary"):
+                return self._db.engines[REPLICA_BIND]
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+# -----------------------------
+# Read-your-writes across requests
+# -----------------------------
+# The pin travels with the client as a signed, timestamped cookie, so
+# whichever worker serves its next request sees it; the signature keeps
+# clients from pinning themselves to the primary for longer.
+def _pin_serializer():
+    return URLSafeTimedSerializer(current_app.secret_key, salt="db-primary-pin")
+
+
+def _pinned():
+    token = request.cookies.get(PIN_COOKIE)
+    if not token:
+        return False
+    try:
+        _pin_serializer().loads(token, max_age=current_app.config["DB_REPLICA_STICKY_SECONDS"])
+    except BadSignature:
+        return False
+    return True
+
+
+def _after_flush(session, flush_context):
+    session.info[_WROTE] = True
+
+
+def _do_orm_execute(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info[_WROTE] = True
+
+
+def _after_commit(session):
+    # A client that just wrote reads from the primary until the replica
+    # has had time to catch up
+    if not (session.info.get(_WROTE) and has_request_context()):
+        return
+    if current_app.config["DB_REPLICA_STICKY_SECONDS"] > 0 and replica_configured():
+        g.db_primary_pin = True
+
+
+def _set_pin_cookie(response):
+    if g.get("db_primary_pin"):
+        response.set_cookie(
+            PIN_COOKIE,
+            _pin_serializer().dumps(1),
+            max_age=current_app.config["DB_REPLICA_STICKY_SECONDS"],
+            httponly=True,
+            samesite="Lax",
+        )
+    return response
+
+
+def register_replica_routing(app, db):
+    """
+    Track writes on db.session so later reads (and the client's next
+    requests, via the PIN_COOKIE cookie) stay on the primary.
+    """
+    # The replica gets its schema by replication; without a (model-less)
+    # metadata entry create_all/drop_all leave it alone
+    db.metadatas.pop(REPLICA_BIND, None)
+
+    for name, fn in (
+        ("after_flush", _after_flush),
+        ("do_orm_execute", _do_orm_execute),
+        ("after_commit", _after_commit),
+    ):
+        if not event.contains(RoutingSession, name, fn):
+            event.listen(RoutingSession, name, fn)
+    app.after_request(_set_pin_cookie)
+
+
+# -----------------------------
+# View decorator / overrides
+# -----------------------------
+def replica_reads(f):
+    """
+    Route the view's reads to the read replica, when one is configured
+    and the client has not written within DB_REPLICA_STICKY_SECONDS.
+    """
+    @wraps(f)
+    def decorated(*args, **kwargs):
+        if replica_configured() and not _pinned():
+            g.db_replica_reads = True
+        return f(*args, **kwargs)
+
+    return decorated
+
+
+@contextmanager
+def primary_reads():
+    """
+    Send reads inside the block to the primary, even in a replica_reads view.
+    """
+    if not has_request_context():
+        yield
+        return
+    previous = g.get("db_force_primary", False)
+    g.db_force_primary = True
+    try:
+        yield
+    finally:
+        g.db_force_primary = previous
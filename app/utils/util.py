@@ -1,11 +1,20 @@
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from jose import jwt, JWTError
+from jose.exceptions import JWTError, ExpiredSignatureError
 from functools import wraps
-from flask import request, jsonify
+from flask import request, jsonify, g
+import hashlib
+import threading
+import time
+from app.utils.lazy import lazy_import
+
+# jose.jwt loads its RSA/EC key backends on import (~15ms of startup)
+jwt = lazy_import("jose.jwt")
 
 SECRET_KEY = "super-secret-key"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60
+TOKEN_CACHE_SIZE = 1024
 
 
 def encode_token(customer_id):
@@ -22,46 +31,146 @@ def encode_token(customer_id):
     return token
 
 
+def encode_mechanic_token(mechanic_id):
+    """
+    Generate a JWT token for a mechanic.
+    """
+    payload = {
+        "mechanic_id": mechanic_id,
+        "exp": datetime.now(timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    }
+
+    return jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
+
+
+# -----------------------------
+# Verified token cache
+# -----------------------------
+class TokenCache:
+    """
+    Bounded LRU of already-verified JWT claims, keyed by a SHA-256 digest
+    of the raw token. Entries are dropped once their exp has passed, so a
+    hit never outlives the token itself.
+    """
+
+    def __init__(self, maxsize=TOKEN_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token):
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token):
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                claims, expires_at = entry
+                if expires_at > time.time():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return claims
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, token, claims):
+        expires_at = claims.get("exp")
+        if expires_at is None:
+            return
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (claims, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+token_cache = TokenCache()
+
+
+def decode_token(token):
+    """
+    Verify a JWT and return its claims, skipping signature checks and
+    JSON parsing for tokens already verified. Raises JWTError.
+    """
+    claims = token_cache.get(token)
+    if claims is None:
+        claims = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        token_cache.put(token, claims)
+    return claims
+
+
+def get_bearer_token():
+    """
+    Token from an "Authorization: Bearer <token>" header, or None.
+    """
+    parts = request.headers.get("Authorization", "").split(" ")
+    if len(parts) == 2 and parts[0] == "Bearer" and parts[1]:
+        return parts[1]
+    return None
+
+
+# -----------------------------
+# Route decorators
+# -----------------------------
 def token_required(f):
     """
     Decorator to protect routes and extract customer_id from token.
+    The id is passed as the first argument and stored on g.current_customer_id.
     """
     @wraps(f)
     def decorated(*args, **kwargs):
-        token = None
-
-        if "Authorization" in request.headers:
-            auth_header = request.headers["Authorization"]
-            if auth_header.startswith("Bearer "):
-                token = auth_header.split(" ")[1]
-
+        token = get_bearer_token()
         if not token:
             return jsonify({"message": "Token is missing!"}), 401
 
         try:
-            decoded = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-            customer_id = int(decoded["sub"])
-        except JWTError:
+            customer_id = int(decode_token(token)["sub"])
+        except (JWTError, KeyError, ValueError):
             return jsonify({"message": "Invalid or expired token!"}), 401
 
+        g.current_customer_id = customer_id
         return f(customer_id, *args, **kwargs)
 
     return decorated
 
+
 def mechanic_token_required(f):
+    """
+    Decorator to protect mechanic routes and extract mechanic_id from token.
+    The id is passed as the first argument and stored on g.current_mechanic_id.
+    """
     @wraps(f)
     def decorated(*args, **kwargs):
-        token = None
-        # Check for Authorization header
-        if "Authorization" in request.headers:
-            token = request.headers["Authorization"].split(" ")[1]
+        token = get_bearer_token()
         if not token:
             return jsonify({"message": "Token is missing"}), 401
+
         try:
-            payload = jwt.decode(token, SECRET_KEY, algorithms=["HS256"])
-            current_mechanic_id = payload.get("mechanic_id")
-        except:
-            return jsonify({"message": "Token is invalid or expired"}), 403
+            current_mechanic_id = decode_token(token).get("mechanic_id")
+        except ExpiredSignatureError:
+            return jsonify({"message": "Token has expired"}), 403
+        except JWTError:
+            return jsonify({"message": "Token is invalid"}), 403
+        if not current_mechanic_id:
+            return jsonify({"message": "Invalid token"}), 403
+
+        g.current_mechanic_id = current_mechanic_id
         return f(current_mechanic_id, *args, **kwargs)
-    return decorated
 
+    return decorated
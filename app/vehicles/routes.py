@@ -3,8 +3,14 @@ from flask import request, jsonify
 from app.extensions import db
 from app.models import Vehicle
 from . import vehicles_bp
-from .schemas import vehicle_schema, vehicles_schema
 from app.utils.util import token_required
+from app.utils.caching import versioned_json_response
+from app.utils.lazy import lazy_import
+from app.utils.replicas import replica_reads
+
+vehicle_schema, vehicles_projection = lazy_import(
+    "app.vehicles.schemas", "vehicle_schema", "vehicles_projection"
+)
 
 
 # -----------------------------
@@ -32,10 +38,15 @@ def create_vehicle(current_customer_id):
 # GET all vehicles for current customer
 # -----------------------------
 @vehicles_bp.route("/", methods=["GET"])
+@replica_reads
 @token_required
 def get_vehicles(current_customer_id):
-    vehicles = Vehicle.query.filter_by(customer_id=current_customer_id).all()
-    return vehicles_schema.jsonify(vehicles), 200
+    return versioned_json_response(
+        f"vehicles:customer:{current_customer_id}",
+        [Vehicle.__tablename__],
+        lambda: vehicles_projection.all(Vehicle.customer_id == current_customer_id),
+        private=True
+    )
 
 
 # -----------------------------
@@ -43,7 +54,7 @@ def get_vehicles(current_customer_id):
 # -----------------------------
 @vehicles_bp.route("/<int:id>", methods=["GET"])
 @token_required
-def get_vehicle(id, current_customer_id):
+def get_vehicle(current_customer_id, id):
     vehicle = db.session.get(Vehicle, id)
     if not vehicle or vehicle.customer_id != current_customer_id:
         return jsonify({"message": "Vehicle not found or unauthorized"}), 404
@@ -55,7 +66,7 @@ def get_vehicle(id, current_customer_id):
 # -----------------------------
 @vehicles_bp.route("/<int:id>", methods=["PUT"])
 @token_required
-def update_vehicle(id, current_customer_id):
+def update_vehicle(current_customer_id, id):
     vehicle = db.session.get(Vehicle, id)
     if not vehicle or vehicle.customer_id != current_customer_id:
         return jsonify({"message": "Vehicle not found or unauthorized"}), 404
@@ -77,7 +88,7 @@ def update_vehicle(id, current_customer_id):
 # -----------------------------
 @vehicles_bp.route("/<int:id>", methods=["DELETE"])
 @token_required
-def delete_vehicle(id, current_customer_id):
+def delete_vehicle(current_customer_id, id):
     vehicle = db.session.get(Vehicle, id)
     if not vehicle or vehicle.customer_id != current_customer_id:
         return jsonify({"message": "Vehicle not found or unauthorized"}), 404
@@ -1,5 +1,6 @@
 from app.extensions import ma
 from app.models import Vehicle
+from app.utils.projection import Projection
 
 
 class VehicleSchema(ma.SQLAlchemyAutoSchema):
@@ -11,3 +12,4 @@ class VehicleSchema(ma.SQLAlchemyAutoSchema):
 
 vehicle_schema = VehicleSchema()
 vehicles_schema = VehicleSchema(many=True)
+vehicles_projection = Projection(VehicleSchema)
@@ -0,0 +1,74 @@
+"""
+Bulk inventory import vs. one POST per part.
+
+Streams an NDJSON catalog through POST /inventory/bulk and compares it
+with creating the same parts one at a time through POST /inventory/
+(sampled, then extrapolated):
+
+    python -m benchmarks.bench_inventory_import --rows 100000 --batch-size 1000
+"""
+import argparse
+import io
+import json
+import time
+from app import create_app, db
+from app.utils.util import encode_mechanic_token
+
+
+def catalog(rows):
+    return "".join(
+        json.dumps({"name": f"Part {i}", "price": 1.5 + i % 100}) + "\n"
+        for i in range(rows)
+    ).encode()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--single-sample", type=int, default=500)
+    args = parser.parse_args()
+
+    app = create_app(testing=True)
+    client = app.test_client()
+    headers = {"Authorization": f"Bearer {encode_mechanic_token(1)}"}
+
+    with app.app_context():
+        db.create_all()
+
+    body = catalog(args.rows)
+    start = time.perf_counter()
+    res = client.post(
+        f"/inventory/bulk?batch_size={args.batch_size}",
+        input_stream=io.BytesIO(body),
+        headers=dict(headers, **{"Content-Type": "application/x-ndjson", "Content-Length": str(len(body))})
+    )
+    bulk = time.perf_counter() - start
+    report = res.get_json()
+    print(f"bulk:   {args.rows} rows in {bulk:.2f}s "
+          f"({args.rows / bulk:,.0f} rows/s, inserted={report['inserted']}, failed={report['failed']})")
+
+    # Re-importing the same catalog takes the update path
+    start = time.perf_counter()
+    res = client.post(
+        f"/inventory/bulk?batch_size={args.batch_size}",
+        input_stream=io.BytesIO(body),
+        headers=dict(headers, **{"Content-Type": "application/x-ndjson", "Content-Length": str(len(body))})
+    )
+    upsert = time.perf_counter() - start
+    print(f"upsert: {args.rows} rows in {upsert:.2f}s (updated={res.get_json()['updated']})")
+
+    start = time.perf_counter()
+    for i in range(args.single_sample):
+        client.post("/inventory/", json={"name": f"Single {i}", "price": 1.0}, headers=headers)
+    single = (time.perf_counter() - start) / args.single_sample
+    print(f"single: {single * 1000:.2f}ms per POST, ~{single * args.rows:.1f}s for {args.rows} rows "
+          f"({single * args.rows / bulk:.0f}x slower)")
+
+    with app.app_context():
+        db.session.remove()
+        db.drop_all()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Inventory search latency at catalog scale.
+
+Loads N parts (indexed by the full-text triggers as they are inserted)
+and times search_inventory() for common, rare and missing terms in both
+modes, against a plain LIKE scan of the table:
+
+    python -m benchmarks.bench_inventory_search --parts 1000000
+"""
+import argparse
+import random
+import statistics
+import time
+from app import create_app, db
+from app.inventory.search import search_inventory
+from app.models import Inventory
+
+WORDS = ["Brake", "Pad", "Oil", "Filter", "Spark", "Plug", "Rotor", "Belt",
+         "Hose", "Gasket", "Sensor", "Pump", "Valve", "Bearing", "Clutch", "Mount"]
+
+QUERIES = [
+    ("brake pad", "substring", {}),
+    ("brake", "prefix", {}),
+    ("filter", "substring", {"min_price": 100, "max_price": 120}),
+    ("gasket 9999", "substring", {}),
+    ("123456", "substring", {}),
+    ("no such part", "substring", {}),
+]
+
+
+def load(parts, chunk=50000):
+    rng = random.Random(1)
+    for first in range(0, parts, chunk):
+        db.session.execute(db.insert(Inventory.__table__), [
+            {"name": f"{rng.choice(WORDS)} {rng.choice(WORDS)} {i}", "price": round(rng.uniform(1, 500), 2)}
+            for i in range(first, min(first + chunk, parts))
+        ])
+    db.session.commit()
+
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        samples.append(time.perf_counter() - start)
+    return result, statistics.median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--parts", type=int, default=1000000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    app = create_app(testing=True)
+    with app.app_context():
+        db.create_all()
+        start = time.perf_counter()
+        load(args.parts)
+        print(f"loaded {args.parts} parts in {time.perf_counter() - start:.1f}s\n")
+
+        print(f"{'query':<14} {'mode':<10} {'filters':<38} {'hits':>5} {'search ms':>10} {'LIKE scan ms':>13}")
+        for q, mode, filters in QUERIES:
+            hits, search_ms = timed(lambda: search_inventory(q, mode=mode, **filters), args.repeat)
+            pattern = (q if mode == "prefix" else f"%{q}") + "%"
+            scan = db.select(Inventory.id).where(Inventory.name.ilike(pattern)).limit(20)
+            _, scan_ms = timed(lambda: db.session.execute(scan).all(), 3)
+            print(f"{q:<14} {mode:<10} {str(filters):<38} {len(hits):>5} {search_ms:>10.3f} {scan_ms:>13.1f}")
+
+        db.session.remove()
+        db.drop_all()
+
+
+if __name__ == "__main__":
+    main()
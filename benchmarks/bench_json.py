@@ -0,0 +1,83 @@
+"""
+jsonify cost: stdlib JSON provider vs. orjson.
+
+Times app.json.response() (what jsonify calls) for list payloads shaped
+like the ticket, customer and inventory endpoints, plus one with raw
+dates and Decimals that go through default(), and checks both providers
+produce the same JSON:
+
+    python -m benchmarks.bench_json --rows 1000 10000
+"""
+import argparse
+import json
+import time
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from app import create_app
+from app.utils.json_provider import JSON_PROVIDERS
+
+START = datetime(2024, 1, 1, 8, 0)
+
+PAYLOADS = {
+    "tickets": lambda i: {
+        "id": i, "vehicle_id": i % 500 + 1, "status": "Pending" if i % 3 else "Completed",
+        "created_at": (START + timedelta(hours=i)).isoformat(),
+        "description": f"Ticket {i}", "description_of_issue": "Grinding noise when braking",
+        "work_performed": None, "odometer_reading": 40000 + i,
+        "estimated_cost": 120.5 + i % 40, "final_cost": None, "mechanics": [i % 50 + 1, i % 7 + 1],
+    },
+    "customers": lambda i: {
+        "id": i, "name": f"Customer {i}", "email": f"customer{i}@shop.com",
+        "phone": "555-0100", "vehicles": [2 * i, 2 * i + 1],
+    },
+    "inventory": lambda i: {"id": i, "name": f"Part {i}", "price": 1.5 + i % 100},
+    "typed": lambda i: {
+        "id": i, "opened": START + timedelta(hours=i), "due": date(2024, 6, 1),
+        "parts": Decimal("19.99") * (i % 5 + 1), "labor": 48.08,
+    },
+}
+
+
+def best_of(fn, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    providers = {name: cls for name, cls in JSON_PROVIDERS.items() if cls is not None}
+    if "orjson" not in providers:
+        print("orjson is not installed; only the stdlib provider is timed")
+
+    apps = {name: create_app(testing=True, config={"JSON_PROVIDER": name}) for name in providers}
+
+    print(f"{'payload':<10} {'rows':>7} " + " ".join(f"{name + ' ms':>10}" for name in providers) + f" {'speedup':>8}")
+    for rows in args.rows:
+        for payload, make_row in PAYLOADS.items():
+            data = [make_row(i) for i in range(1, rows + 1)]
+            times, bodies = {}, {}
+            for name, app in apps.items():
+                with app.app_context():
+                    bodies[name] = json.loads(app.json.response(data).get_data())
+                    times[name] = best_of(lambda: app.json.response(data), args.repeat)
+            assert all(body == bodies["stdlib"] for body in bodies.values()), payload
+
+            speedup = times["stdlib"] / times["orjson"] if "orjson" in times else 1.0
+            print(
+                f"{payload:<10} {rows:>7} "
+                + " ".join(f"{times[name] * 1000:>10.2f}" for name in providers)
+                + f" {speedup:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Login throughput under concurrency.
+
+Compares inline hashing on the request thread with the process-pool
+hasher for a burst of concurrent logins:
+
+    python -m benchmarks.bench_login --threads 8 --requests 64
+"""
+import argparse
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from app import create_app, db
+from app.extensions import password_hasher
+from app.models import Customer
+
+
+def run(workers, threads, requests, iterations):
+    app = create_app(testing=True)
+    app.config["PASSWORD_HASH_METHOD"] = f"pbkdf2:sha256:{iterations}"
+    app.config["PASSWORD_HASH_WORKERS"] = workers
+    app.config["PASSWORD_HASH_QUEUE_SIZE"] = max(threads, 1) * 2
+    app.config["PASSWORD_HASH_TIMEOUT"] = 60
+    password_hasher.init_app(app)
+
+    with app.app_context():
+        db.create_all()
+        db.session.add(Customer(
+            name="Bench",
+            email="bench@shop.com",
+            password=password_hasher.hash("secret")
+        ))
+        db.session.commit()
+
+    def login(_):
+        client = app.test_client()
+        start = time.perf_counter()
+        res = client.post("/customers/login", json={"email": "bench@shop.com", "password": "secret"})
+        assert res.status_code == 200, res.get_data(as_text=True)
+        return time.perf_counter() - start
+
+    # Warm the pool so process start-up is not measured
+    login(None)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        latencies = sorted(executor.map(login, range(requests)))
+    elapsed = time.perf_counter() - start
+
+    password_hasher.shutdown()
+    with app.app_context():
+        db.drop_all()
+
+    return {
+        "workers": workers,
+        "throughput": requests / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=64)
+    parser.add_argument("--iterations", type=int, default=100000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[0, 2, 4])
+    args = parser.parse_args()
+
+    print(f"{args.requests} logins, {args.threads} threads, pbkdf2 x{args.iterations}")
+    print(f"{'workers':>8} {'logins/s':>10} {'p50 ms':>9} {'p95 ms':>9}")
+    for workers in args.workers:
+        result = run(workers, args.threads, args.requests, args.iterations)
+        print(
+            f"{result['workers']:>8} {result['throughput']:>10.1f} "
+            f"{result['p50_ms']:>9.1f} {result['p95_ms']:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Rate limit storage overhead per check.
+
+Times limits strategies against the in-process memory storage and the
+shared SQLite (WAL) storage, spreading hits over many client keys the
+way per-IP limits are used, and checks that separate processes share
+one budget:
+
+    python -m benchmarks.bench_ratelimit --checks 20000
+"""
+import argparse
+import os
+import tempfile
+import time
+from multiprocessing import Pool
+from limits import parse
+from limits.storage import storage_from_string
+from limits.strategies import FixedWindowRateLimiter, MovingWindowRateLimiter
+import app.utils.ratelimit  # noqa: F401 (registers sqlite://)
+
+LIMITS = ["5 per minute", "50 per hour", "200 per day"]
+STRATEGIES = {"fixed-window": FixedWindowRateLimiter, "moving-window": MovingWindowRateLimiter}
+
+
+def per_check_us(storage_uri, strategy, limit, checks, clients):
+    limiter = STRATEGIES[strategy](storage_from_string(storage_uri))
+    item = parse(limit)
+    start = time.perf_counter()
+    for i in range(checks):
+        limiter.hit(item, f"10.0.{i % clients // 256}.{i % 256}", "/customers/login")
+    return (time.perf_counter() - start) / checks * 1e6
+
+
+def _worker(args):
+    uri, hits = args
+    limiter = MovingWindowRateLimiter(storage_from_string(uri))
+    item = parse("100 per minute")
+    return sum(limiter.hit(item, "shared-client") for _ in range(hits))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--checks", type=int, default=20000)
+    parser.add_argument("--clients", type=int, default=5000)
+    parser.add_argument("--processes", type=int, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'storage':<8} {'strategy':<14} {'limit':<14} {'us/check':>9}")
+        for strategy in STRATEGIES:
+            for limit in LIMITS:
+                for name in ("memory", "sqlite"):
+                    uri = "memory://" if name == "memory" else f"sqlite:///{tmp}/{strategy}-{limit.replace(' ', '')}.db"
+                    us = per_check_us(uri, strategy, limit, args.checks, args.clients)
+                    print(f"{name:<8} {strategy:<14} {limit:<14} {us:>9.1f}")
+
+        uri = f"sqlite:///{os.path.join(tmp, 'shared.db')}"
+        with Pool(args.processes) as pool:
+            allowed = sum(pool.map(_worker, [(uri, 100)] * args.processes))
+        print(f"\n{args.processes} processes x 100 hits against '100 per minute': {allowed} allowed")
+
+
+if __name__ == "__main__":
+    main()
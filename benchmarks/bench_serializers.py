@@ -0,0 +1,69 @@
+"""
+Schema dump vs. precompiled projection for list endpoints.
+
+Times loading + serializing N rows both ways: ORM objects through
+SQLAlchemyAutoSchema.dump(), and column tuples through Projection.
+
+    python -m benchmarks.bench_serializers --rows 10000 100000
+"""
+import argparse
+import time
+from app import create_app, db
+from app.inventory.schemas import InventorySchema
+from app.mechanics.schemas import MechanicSchema
+from app.models import Inventory, Mechanic, ServiceTicketMechanic
+from app.service_ticket_mechanics.schemas import STMechSchema
+from app.utils.projection import Projection
+
+CASES = [
+    ("inventory", Inventory, InventorySchema,
+     lambda i: {"name": f"Part {i}", "price": 1.5 + i % 100}),
+    ("mechanics", Mechanic, MechanicSchema,
+     lambda i: {"name": f"Mechanic {i}", "email": f"m{i}@shop.com", "phone": "555",
+                "address": "1 Main St", "salary": 50000.0, "password": "x"}),
+    ("links", ServiceTicketMechanic, STMechSchema,
+     lambda i: {"ticket_id": i, "mechanic_id": i % 50 + 1, "hours_worked": 2.5, "role": "Technician"}),
+]
+
+
+def best_of(fn, repeat):
+    best = None
+    for _ in range(repeat):
+        db.session.expunge_all()
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'case':<10} {'rows':>8} {'dump ms':>10} {'projection ms':>14} {'speedup':>8}")
+    for rows in args.rows:
+        app = create_app(testing=True)
+        with app.app_context():
+            db.create_all()
+            for name, model, schema_class, make_row in CASES:
+                db.session.execute(db.insert(model.__table__), [make_row(i) for i in range(1, rows + 1)])
+                db.session.commit()
+
+                schema = schema_class(many=True)
+                projection = Projection(schema_class)
+                assert projection.all() == schema.dump(model.query.all())
+
+                dump_time = best_of(lambda: schema.dump(model.query.all()), args.repeat)
+                projection_time = best_of(projection.all, args.repeat)
+                print(
+                    f"{name:<10} {rows:>8} {dump_time * 1000:>10.1f} "
+                    f"{projection_time * 1000:>14.1f} {dump_time / projection_time:>7.1f}x"
+                )
+            db.drop_all()
+
+
+if __name__ == "__main__":
+    main()
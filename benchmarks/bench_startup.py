@@ -0,0 +1,104 @@
+"""
+Cold start time: import app, create_app() and the first request.
+
+Each run is a fresh interpreter, so nothing is cached between runs. Also
+prints an import-time report (python -X importtime) with the heaviest
+packages and app modules, and exits non-zero when the median cold start
+(import + create_app) is over budget:
+
+    python -m benchmarks.bench_startup --runs 10 --budget-ms 450
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+PROBE = """
+import json, time
+t0 = time.perf_counter()
+from app import create_app, db
+t1 = time.perf_counter()
+app = create_app(testing=True)
+t2 = time.perf_counter()
+with app.app_context():
+    db.create_all()
+t3 = time.perf_counter()
+app.test_client().get("/inventory/")
+t4 = time.perf_counter()
+print(json.dumps({"import_ms": (t1 - t0) * 1000, "create_app_ms": (t2 - t1) * 1000,
+                  "first_request_ms": (t4 - t3) * 1000}))
+"""
+
+PHASES = ["import_ms", "create_app_ms", "first_request_ms"]
+
+
+def run_probe(*flags):
+    result = subprocess.run(
+        [sys.executable, *flags, "-c", PROBE], capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1]), result.stderr
+
+
+def measure(runs):
+    """
+    Per-phase timings (ms) for runs fresh interpreters.
+    """
+    return [run_probe()[0] for _ in range(runs)]
+
+
+def import_report(top=10):
+    """
+    (packages, app_modules) from one -X importtime run: total self ms of
+    every module under each top-level package, and self ms per app
+    module, slowest first.
+    """
+    _, stderr = run_probe("-X", "importtime")
+    packages = defaultdict(float)
+    app_modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        module = name.strip()
+        packages[module.split(".")[0]] += int(self_us) / 1000
+        if module == "app" or module.startswith("app."):
+            app_modules[module] = int(self_us) / 1000
+
+    by_time = lambda item: -item[1]
+    return (
+        sorted(packages.items(), key=by_time)[:top],
+        sorted(app_modules.items(), key=by_time)[:top],
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=450.0)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    results = measure(args.runs)
+    print(f"{'phase':<18} {'median ms':>10} {'max ms':>8}")
+    for phase in PHASES:
+        values = [r[phase] for r in results]
+        print(f"{phase:<18} {statistics.median(values):>10.1f} {max(values):>8.1f}")
+
+    packages, app_modules = import_report(args.top)
+    print(f"\n{'package':<28} {'self ms':>14}")
+    for name, ms in packages:
+        print(f"{name:<28} {ms:>14.1f}")
+    print(f"\n{'app module':<40} {'self ms':>8}")
+    for name, ms in app_modules:
+        print(f"{name:<40} {ms:>8.1f}")
+
+    cold_start = statistics.median(r["import_ms"] + r["create_app_ms"] for r in results)
+    print(f"\ncold start (import + create_app): {cold_start:.1f} ms, budget {args.budget_ms:.0f} ms")
+    if cold_start > args.budget_ms:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,356 @@
+"""
+Endpoint benchmark suite.
+
+Seeds an in-memory SQLite database, drives every blueprint's endpoints
+through app.test_client() (all but /api/docs and /static, which serve
+files rather than run app code) and reports p50/p95 latency, throughput and
+SQL statements per request for each route. Results are written as JSON
+and compared with a stored baseline; the run exits non-zero when a route
+regresses past the tolerance.
+
+    python -m benchmarks.endpoints                      # run + compare
+    python -m benchmarks.endpoints --save-baseline      # record baseline
+    python -m benchmarks.endpoints --customers 2000 --iterations 50
+"""
+import argparse
+import itertools
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from collections import namedtuple
+from datetime import datetime, timezone
+from sqlalchemy import event
+from app import create_app, db
+from app.models import Customer, Vehicle, Mechanic, Inventory, ServiceTicket
+from app.utils.util import encode_token, encode_mechanic_token
+from .seed import seed, DEFAULT_VOLUMES, PASSWORD
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+BASELINE_PATH = os.path.join(HERE, "baseline.json")
+RESULTS_PATH = os.path.join(HERE, "results", "latest.json")
+
+DEFAULT_TOLERANCE = 0.5      # allowed fractional p95 slowdown
+MIN_REGRESSION_MS = 1.0      # ignore p95 changes smaller than this
+
+
+# -----------------------------
+# Routes
+# -----------------------------
+class Payload(namedtuple("Payload", "data content_type")):
+    """
+    Raw request body, for routes that do not take JSON.
+    """
+
+
+def _customer(ctx):
+    return {"Authorization": f"Bearer {ctx['customer_token']}"}
+
+
+def _mechanic(ctx):
+    return {"Authorization": f"Bearer {ctx['mechanic_token']}"}
+
+
+def _scratch(ctx, make):
+    """
+    Insert the row built by make(n) (n unique per call) before the timed
+    request, for routes that consume a row per call. Returns its id,
+    also kept as ctx["scratch_id"].
+    """
+    with ctx["app"].app_context():
+        row = make(next(ctx["seq"]))
+        db.session.add(row)
+        db.session.commit()
+        ctx["scratch_id"] = row.id
+    return row.id
+
+
+def _scratch_ticket(ctx, mechanics=()):
+    return _scratch(ctx, lambda n: ServiceTicket(
+        vehicle_id=ctx["vehicle_id"], description=f"Scratch {n}", description_of_issue="Noise",
+        mechanics=[db.session.get(Mechanic, m) for m in mechanics]
+    ))
+
+
+def _ndjson_parts(ctx):
+    lines = (json.dumps({"name": f"Imported part {i}", "price": 9.99}) for i in range(50))
+    return Payload("\n".join(lines), "application/x-ndjson")
+
+
+# (name, method, path, headers, body). body returns JSON data or a
+# Payload. path, headers and body are built before the timer starts, in
+# that order, so headers and body can use rows the path inserted.
+ROUTES = [
+    ("GET /customers/", "get", lambda ctx: "/customers/", None, None),
+    ("POST /customers/login", "post", lambda ctx: "/customers/login", None,
+     lambda ctx: {"email": "customer1@shop.com", "password": PASSWORD}),
+    ("GET /customers/my-tickets", "get", lambda ctx: "/customers/my-tickets", _customer, None),
+    ("GET /mechanics/", "get", lambda ctx: "/mechanics/", None, None),
+    ("GET /mechanics/popular", "get", lambda ctx: "/mechanics/popular", None, None),
+    ("GET /mechanics/hours", "get", lambda ctx: "/mechanics/hours?period=month", _mechanic, None),
+    ("POST /mechanics/login", "post", lambda ctx: "/mechanics/login", None,
+     lambda ctx: {"email": "mechanic1@shop.com", "password": PASSWORD}),
+    ("GET /vehicles/", "get", lambda ctx: "/vehicles/", _customer, None),
+    ("GET /vehicles/<id>", "get", lambda ctx: f"/vehicles/{ctx['vehicle_id']}", _customer, None),
+    ("GET /inventory/", "get", lambda ctx: "/inventory/", None, None),
+    ("GET /inventory/<id>", "get", lambda ctx: "/inventory/1", None, None),
+    ("GET /inventory/search", "get", lambda ctx: "/inventory/search?q=Part 1", None, None),
+    ("GET /service_tickets/", "get", lambda ctx: "/service_tickets/", _customer, None),
+    ("GET /service_tickets/export", "get", lambda ctx: "/service_tickets/export?format=ndjson",
+     _mechanic, None),
+    # Re-adding links the ticket already has leaves it unchanged
+    ("PUT /service_tickets/<id>/edit", "put", lambda ctx: f"/service_tickets/{ctx['ticket_id']}/edit",
+     _customer, lambda ctx: {"add_mechanics": ctx["ticket_mechanics"], "add_parts": ctx["ticket_parts"]}),
+    ("GET /service_tickets/<id>/cost", "get", lambda ctx: f"/service_tickets/{ctx['ticket_id']}/cost",
+     _mechanic, None),
+    ("POST /service_tickets/costs", "post", lambda ctx: "/service_tickets/costs", _mechanic,
+     lambda ctx: {"ticket_ids": list(range(1, 101))}),
+    ("GET /service_ticket_mechanics/", "get", lambda ctx: "/service_ticket_mechanics/", None, None),
+    ("GET /service_ticket_mechanics/<id>", "get", lambda ctx: "/service_ticket_mechanics/1", None, None),
+    ("GET /jobs/<id>", "get", lambda ctx: f"/jobs/{ctx['job_id']}", _mechanic, None),
+    ("GET /jobs/<id>/result", "get", lambda ctx: f"/jobs/{ctx['job_id']}/result", _mechanic, None),
+    ("GET /diagnostics/pool", "get", lambda ctx: "/diagnostics/pool", _mechanic, None),
+    ("POST /batch", "post", lambda ctx: "/batch", _customer,
+     lambda ctx: {"requests": [{"path": "/vehicles/"}, {"path": "/inventory/1"}, {"path": "/mechanics/"}]}),
+
+    # Writes run last so the rows they add do not skew the reads above.
+    # Updates write back the values the row already has.
+    ("POST /customers/", "post", lambda ctx: "/customers/", None,
+     lambda ctx: {"name": "New", "email": f"new{next(ctx['seq'])}@shop.com", "password": PASSWORD}),
+    ("PUT /customers/<id>", "put", lambda ctx: "/customers/1", _customer,
+     lambda ctx: {"name": "Customer 1"}),
+    ("DELETE /customers/<id>", "delete",
+     lambda ctx: f"/customers/{_scratch(ctx, lambda n: Customer(name='Gone', email=f'gone{n}@shop.com', password='x'))}",
+     lambda ctx: {"Authorization": f"Bearer {encode_token(ctx['scratch_id'])}"}, None),
+    ("POST /vehicles/", "post", lambda ctx: "/vehicles/", _customer,
+     lambda ctx: {"make": "Ford", "model": "Focus", "year": 2020, "vin": f"NEW{next(ctx['seq'])}"}),
+    ("PUT /vehicles/<id>", "put", lambda ctx: f"/vehicles/{ctx['vehicle_id']}", _customer,
+     lambda ctx: {"make": "Ford"}),
+    ("DELETE /vehicles/<id>", "delete",
+     lambda ctx: f"/vehicles/{_scratch(ctx, lambda n: Vehicle(customer_id=1, make='Ford', model='Focus', year=2020, vin=f'GONE{n}'))}",
+     _customer, None),
+    ("POST /inventory/", "post", lambda ctx: "/inventory/", _mechanic,
+     lambda ctx: {"name": f"New part {next(ctx['seq'])}", "price": 9.99}),
+    ("PUT /inventory/<id>", "put", lambda ctx: "/inventory/1", _mechanic,
+     lambda ctx: {"name": "Part 1"}),
+    ("DELETE /inventory/<id>", "delete",
+     lambda ctx: f"/inventory/{_scratch(ctx, lambda n: Inventory(name=f'Gone part {n}', price=1.0))}",
+     _mechanic, None),
+    # Re-imports the same 50 names, so every call after the first updates
+    ("POST /inventory/bulk", "post", lambda ctx: "/inventory/bulk", _mechanic, _ndjson_parts),
+    ("POST /mechanics/", "post", lambda ctx: "/mechanics/", None,
+     lambda ctx: {"name": "New", "email": f"new{next(ctx['seq'])}@shop.com", "password": PASSWORD}),
+    ("PUT /mechanics/<id>", "put", lambda ctx: "/mechanics/1", _mechanic,
+     lambda ctx: {"name": "Mechanic 1"}),
+    ("DELETE /mechanics/<id>", "delete",
+     lambda ctx: f"/mechanics/{_scratch(ctx, lambda n: Mechanic(name='Gone', email=f'gone{n}@shop.com', password='x'))}",
+     _mechanic, None),
+    ("POST /service_tickets/", "post", lambda ctx: "/service_tickets/", _customer,
+     lambda ctx: {"vehicle_id": ctx["vehicle_id"], "description": "New", "description_of_issue": "Noise"}),
+    ("PUT /service_tickets/<id>/assign-mechanic/<id>", "put",
+     lambda ctx: f"/service_tickets/{_scratch_ticket(ctx)}/assign-mechanic/1", _customer, None),
+    ("PUT /service_tickets/<id>/remove-mechanic/<id>", "put",
+     lambda ctx: f"/service_tickets/{_scratch_ticket(ctx, mechanics=[1])}/remove-mechanic/1", _customer, None),
+    ("POST /service_tickets/<id>/add-part", "post",
+     lambda ctx: f"/service_tickets/{_scratch_ticket(ctx)}/add-part", _customer,
+     lambda ctx: {"part_id": 1}),
+    ("POST /service_ticket_mechanics/", "post", lambda ctx: "/service_ticket_mechanics/", _mechanic,
+     lambda ctx: {"service_ticket_id": ctx["ticket_id"], "mechanic_id": 1, "hours_worked": 1.5}),
+    ("POST /jobs/", "post", lambda ctx: "/jobs/", _mechanic,
+     lambda ctx: {"type": "ticket_costs", "params": {"ticket_ids": list(range(1, 11))}}),
+]
+
+
+# -----------------------------
+# Runner
+# -----------------------------
+def _percentile(sorted_values, pct):
+    index = max(int(round(pct / 100 * len(sorted_values))) - 1, 0)
+    return sorted_values[index]
+
+
+def _request_kwargs(ctx, headers, body):
+    kwargs = {}
+    if headers:
+        kwargs["headers"] = headers(ctx)
+    if body:
+        data = body(ctx)
+        if isinstance(data, Payload):
+            kwargs["data"], kwargs["content_type"] = data
+        else:
+            kwargs["json"] = data
+    return kwargs
+
+
+def run_suite(volumes=None, iterations=20, routes=ROUTES, config=None):
+    result_dir = tempfile.mkdtemp(prefix="bench-jobs-")
+    app = create_app(testing=True, config={"JOBS_RESULT_DIR": result_dir, **(config or {})})
+    client = app.test_client()
+
+    with app.app_context():
+        db.create_all()
+        counts = seed(volumes)
+        engine = db.engine
+        ticket_id = db.session.execute(
+            db.text("SELECT MIN(id) FROM service_tickets WHERE vehicle_id IN "
+                    "(SELECT id FROM vehicle WHERE customer_id = 1)")
+        ).scalar()
+        vehicle_id = db.session.execute(
+            db.text("SELECT MIN(id) FROM vehicle WHERE customer_id = 1")
+        ).scalar()
+        ticket_mechanics = list(db.session.scalars(
+            db.text("SELECT mechanic_id FROM service_ticket_mechanics WHERE ticket_id = :t"),
+            {"t": ticket_id}
+        ))
+        ticket_parts = list(db.session.scalars(
+            db.text("SELECT inventory_id FROM service_ticket_inventory WHERE ticket_id = :t"),
+            {"t": ticket_id}
+        ))
+
+    ctx = {
+        "app": app,
+        "seq": itertools.count(1),
+        "customer_token": encode_token(1),
+        "mechanic_token": encode_mechanic_token(1),
+        "ticket_id": ticket_id,
+        "vehicle_id": vehicle_id,
+        "ticket_mechanics": ticket_mechanics,
+        "ticket_parts": ticket_parts,
+    }
+    ctx["job_id"] = client.post(
+        "/jobs/", json={"type": "ticket_costs", "params": {"ticket_ids": [ticket_id]}}, headers=_mechanic(ctx)
+    ).get_json()["id"]
+
+    statements = []
+
+    def count_statement(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", count_statement)
+    results = {}
+    try:
+        for name, method, path, headers, body in routes:
+            latencies = []
+            queries = []
+            for _ in range(iterations + 1):
+                url = path(ctx)
+                kwargs = _request_kwargs(ctx, headers, body)
+                statements.clear()
+                start = time.perf_counter()
+                res = getattr(client, method)(url, **kwargs)
+                res.get_data()
+                latencies.append(time.perf_counter() - start)
+                queries.append(len(statements))
+                if res.status_code >= 400:
+                    raise RuntimeError(f"{name} returned {res.status_code}: {res.get_data(as_text=True)[:200]}")
+
+            # The first call is a warm-up but its query count is kept:
+            # it is the uncached cost of the route
+            cold_queries = queries[0]
+            latencies = sorted(latencies[1:])
+            results[name] = {
+                "p50_ms": round(_percentile(latencies, 50) * 1000, 3),
+                "p95_ms": round(_percentile(latencies, 95) * 1000, 3),
+                "throughput_rps": round(len(latencies) / sum(latencies), 1),
+                "queries": cold_queries,
+                "queries_warm": int(statistics.median(queries[1:])),
+            }
+    finally:
+        event.remove(engine, "before_cursor_execute", count_statement)
+        with app.app_context():
+            db.session.remove()
+            db.drop_all()
+        shutil.rmtree(result_dir, ignore_errors=True)
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "iterations": iterations,
+            "volumes": dict(DEFAULT_VOLUMES, **(volumes or {})),
+            "rows": counts,
+        },
+        "routes": results,
+    }
+
+
+def compare(current, baseline, tolerance=DEFAULT_TOLERANCE, min_regression_ms=MIN_REGRESSION_MS):
+    """
+    List of human-readable regressions of current against baseline: p95
+    slower than baseline by more than tolerance (and min_regression_ms),
+    or more SQL statements than before.
+    """
+    regressions = []
+    for name, base in baseline.get("routes", {}).items():
+        now = current["routes"].get(name)
+        if now is None:
+            continue
+        limit = base["p95_ms"] * (1 + tolerance)
+        if now["p95_ms"] > limit and now["p95_ms"] - base["p95_ms"] > min_regression_ms:
+            regressions.append(
+                f"{name}: p95 {now['p95_ms']:.2f}ms > {limit:.2f}ms "
+                f"(baseline {base['p95_ms']:.2f}ms +{tolerance:.0%})"
+            )
+        if now["queries"] > base["queries"]:
+            regressions.append(f"{name}: {now['queries']} queries > baseline {base['queries']}")
+    return regressions
+
+
+def _write_json(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Endpoint benchmark suite")
+    for key, default in DEFAULT_VOLUMES.items():
+        parser.add_argument(f"--{key.replace('_', '-')}", type=int, default=default)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--output", default=RESULTS_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    volumes = {key: getattr(args, key) for key in DEFAULT_VOLUMES}
+    result = run_suite(volumes, iterations=args.iterations)
+    _write_json(args.output, result)
+
+    print(f"{'route':<48} {'p50 ms':>9} {'p95 ms':>9} {'req/s':>9} {'queries':>8}")
+    for name, r in result["routes"].items():
+        print(f"{name:<48} {r['p50_ms']:>9.2f} {r['p95_ms']:>9.2f} {r['throughput_rps']:>9.1f} {r['queries']:>8}")
+    print(f"\nResults written to {args.output}")
+
+    if args.save_baseline:
+        _write_json(args.baseline, result)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("No baseline found; run with --save-baseline to record one")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if baseline["meta"]["volumes"] != result["meta"]["volumes"]:
+        print("Baseline was recorded with different volumes; latency comparison may not be meaningful")
+
+    regressions = compare(result, baseline, tolerance=args.tolerance)
+    if regressions:
+        print("\nRegressions against baseline:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+
+    print("No regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
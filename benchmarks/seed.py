@@ -0,0 +1,123 @@
+"""
+Bulk seeding of large, realistic datasets for benchmarks.
+
+Rows are written with executemany INSERTs so seeding 100k rows takes
+seconds rather than minutes.
+"""
+import random
+from datetime import datetime, timedelta
+from app.extensions import db, password_hasher
+from app.models import (
+    Customer,
+    Vehicle,
+    ServiceTicket,
+    Mechanic,
+    Inventory,
+    ServiceTicketMechanic,
+    service_ticket_inventory,
+)
+
+PASSWORD = "benchmark"
+
+DEFAULT_VOLUMES = {
+    "customers": 200,
+    "vehicles_per_customer": 2,
+    "tickets_per_vehicle": 3,
+    "mechanics": 50,
+    "mechanics_per_ticket": 2,
+    "parts": 500,
+    "parts_per_ticket": 3,
+}
+
+STATUSES = ["Pending", "In Progress", "Completed"]
+
+# Seeded tickets are opened one hour apart starting here
+TICKETS_START = datetime(2025, 1, 1)
+
+
+def _insert(table, rows, batch_size=5000):
+    for start in range(0, len(rows), batch_size):
+        db.session.execute(db.insert(table), rows[start:start + batch_size])
+
+
+def seed(volumes=None, rng_seed=42):
+    """
+    Fill an empty database with the given volumes. Must run inside an app
+    context. Returns the row counts written per table.
+    """
+    volumes = dict(DEFAULT_VOLUMES, **(volumes or {}))
+    rng = random.Random(rng_seed)
+    password = password_hasher.hash(PASSWORD)
+
+    customers = [
+        {"id": i, "name": f"Customer {i}", "email": f"customer{i}@shop.com",
+         "phone": f"555-{i:04d}", "password": password, "address": f"{i} Main St"}
+        for i in range(1, volumes["customers"] + 1)
+    ]
+
+    vehicles = []
+    for customer in customers:
+        for _ in range(volumes["vehicles_per_customer"]):
+            vehicle_id = len(vehicles) + 1
+            vehicles.append({
+                "id": vehicle_id, "make": "Ford", "model": "F-150",
+                "year": 2000 + vehicle_id % 25, "customer_id": customer["id"],
+                "vin": f"VIN{vehicle_id:014d}"
+            })
+
+    tickets = []
+    for vehicle in vehicles:
+        for _ in range(volumes["tickets_per_vehicle"]):
+            ticket_id = len(tickets) + 1
+            tickets.append({
+                "id": ticket_id, "vehicle_id": vehicle["id"],
+                "description": f"Ticket {ticket_id}",
+                "description_of_issue": "Strange noise",
+                "odometer_reading": rng.randint(1000, 200000),
+                "estimated_cost": round(rng.uniform(50, 2000), 2),
+                "status": rng.choice(STATUSES),
+                "created_at": TICKETS_START + timedelta(hours=ticket_id - 1)
+            })
+
+    mechanics = [
+        {"id": i, "name": f"Mechanic {i}", "email": f"mechanic{i}@shop.com",
+         "phone": f"555-{i:04d}", "salary": 40000 + 100 * i, "password": password}
+        for i in range(1, volumes["mechanics"] + 1)
+    ]
+
+    parts = [
+        {"id": i, "name": f"Part {i}", "price": round(rng.uniform(5, 500), 2)}
+        for i in range(1, volumes["parts"] + 1)
+    ]
+
+    links = []
+    ticket_parts = []
+    mechanic_ids = [m["id"] for m in mechanics]
+    part_ids = [p["id"] for p in parts]
+    for ticket in tickets:
+        for mechanic_id in rng.sample(mechanic_ids, min(volumes["mechanics_per_ticket"], len(mechanic_ids))):
+            links.append({
+                "ticket_id": ticket["id"], "mechanic_id": mechanic_id,
+                "hours_worked": round(rng.uniform(0.5, 8), 1), "role": "Technician"
+            })
+        for part_id in rng.sample(part_ids, min(volumes["parts_per_ticket"], len(part_ids))):
+            ticket_parts.append({"ticket_id": ticket["id"], "inventory_id": part_id})
+
+    _insert(Customer.__table__, customers)
+    _insert(Vehicle.__table__, vehicles)
+    _insert(ServiceTicket.__table__, tickets)
+    _insert(Mechanic.__table__, mechanics)
+    _insert(Inventory.__table__, parts)
+    _insert(ServiceTicketMechanic.__table__, links)
+    _insert(service_ticket_inventory, ticket_parts)
+    db.session.commit()
+
+    return {
+        "customers": len(customers),
+        "vehicles": len(vehicles),
+        "service_tickets": len(tickets),
+        "mechanics": len(mechanics),
+        "inventory": len(parts),
+        "service_ticket_mechanics": len(links),
+        "service_ticket_inventory": len(ticket_parts),
+    }
@@ -0,0 +1,48 @@
+"""Add mechanic hours rollup
+
+Revision ID: 3a7d5e1c9b84
+Revises: 5f8c2d9a1e47
+Create Date: 2026-10-18 17:52:09.431276
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3a7d5e1c9b84'
+down_revision = '5f8c2d9a1e47'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('mechanic_hours_rollup',
+    sa.Column('period', sa.String(length=5), nullable=False),
+    sa.Column('period_start', sa.Date(), nullable=False),
+    sa.Column('mechanic_id', sa.Integer(), nullable=False),
+    sa.Column('hours', sa.Float(), nullable=False),
+    sa.Column('links', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('period', 'period_start', 'mechanic_id')
+    )
+
+    with op.batch_alter_table('service_ticket_mechanics', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('worked_on', sa.Date(), nullable=True))
+
+    # Existing links have no work date; use their ticket's open date.
+    # Fill the rollup afterwards with `flask mechanics rebuild-hours`
+    op.execute(sa.text(
+        "UPDATE service_ticket_mechanics SET worked_on = ("
+        "SELECT DATE(service_tickets.created_at) FROM service_tickets "
+        "WHERE service_tickets.id = service_ticket_mechanics.ticket_id)"
+    ))
+
+    with op.batch_alter_table('service_ticket_mechanics', schema=None) as batch_op:
+        batch_op.alter_column('worked_on', existing_type=sa.Date(), nullable=False)
+
+
+def downgrade():
+    with op.batch_alter_table('service_ticket_mechanics', schema=None) as batch_op:
+        batch_op.drop_column('worked_on')
+
+    op.drop_table('mechanic_hours_rollup')
@@ -0,0 +1,46 @@
+"""Add lookup indexes
+
+Revision ID: 4c1f9e2b7a30
+Revises: 83a242924829
+Create Date: 2026-10-18 12:05:11.204871
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4c1f9e2b7a30'
+down_revision = '83a242924829'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('customer', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_customer_email'), ['email'], unique=False)
+
+    with op.batch_alter_table('vehicle', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_vehicle_customer_id'), ['customer_id'], unique=False)
+
+    with op.batch_alter_table('service_tickets', schema=None) as batch_op:
+        batch_op.create_index('ix_service_tickets_vehicle_id_status', ['vehicle_id', 'status'], unique=False)
+
+    with op.batch_alter_table('service_ticket_mechanics', schema=None) as batch_op:
+        batch_op.create_index('ix_service_ticket_mechanics_ticket_id_mechanic_id', ['ticket_id', 'mechanic_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_service_ticket_mechanics_mechanic_id'), ['mechanic_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('service_ticket_mechanics', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_service_ticket_mechanics_mechanic_id'))
+        batch_op.drop_index('ix_service_ticket_mechanics_ticket_id_mechanic_id')
+
+    with op.batch_alter_table('service_tickets', schema=None) as batch_op:
+        batch_op.drop_index('ix_service_tickets_vehicle_id_status')
+
+    with op.batch_alter_table('vehicle', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_vehicle_customer_id'))
+
+    with op.batch_alter_table('customer', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_customer_email'))
@@ -0,0 +1,43 @@
+"""Add jobs
+
+Revision ID: 5f8c2d9a1e47
+Revises: e2a95c7d3b61
+Create Date: 2026-10-18 16:41:55.120384
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5f8c2d9a1e47'
+down_revision = 'e2a95c7d3b61'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('jobs',
+    sa.Column('id', sa.String(length=32), nullable=False),
+    sa.Column('type', sa.String(length=50), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('progress', sa.Float(), nullable=False),
+    sa.Column('params', sa.JSON(), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('result_mimetype', sa.String(length=100), nullable=True),
+    sa.Column('result_size', sa.Integer(), nullable=True),
+    sa.Column('created_by_mechanic_id', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('started_at', sa.DateTime(), nullable=True),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('jobs', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_jobs_created_by_mechanic_id'), ['created_by_mechanic_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('jobs', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_jobs_created_by_mechanic_id'))
+
+    op.drop_table('jobs')
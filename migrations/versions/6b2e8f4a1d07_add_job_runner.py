@@ -0,0 +1,26 @@
+"""Add job runner
+
+Revision ID: 6b2e8f4a1d07
+Revises: 3a7d5e1c9b84
+Create Date: 2026-10-18 21:12:40.518233
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6b2e8f4a1d07'
+down_revision = '3a7d5e1c9b84'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('jobs', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('runner', sa.String(length=100), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('jobs', schema=None) as batch_op:
+        batch_op.drop_column('runner')
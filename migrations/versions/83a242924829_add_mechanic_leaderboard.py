@@ -0,0 +1,42 @@
+"""Add mechanic leaderboard
+
+Revision ID: 83a242924829
+Revises: bd685ea1ab69
+Create Date: 2026-10-18 09:12:40.512384
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '83a242924829'
+down_revision = 'bd685ea1ab69'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('mechanic_leaderboard',
+    sa.Column('mechanic_id', sa.Integer(), nullable=False),
+    sa.Column('tickets_worked', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('mechanic_id')
+    )
+    with op.batch_alter_table('mechanic_leaderboard', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_mechanic_leaderboard_tickets_worked'), ['tickets_worked'], unique=False)
+
+    # Seed from the existing link rows so the table is usable immediately
+    op.execute(
+        "INSERT INTO mechanic_leaderboard (mechanic_id, tickets_worked) "
+        "SELECT mechanic.id, COUNT(service_ticket_mechanics.id) "
+        "FROM mechanic LEFT OUTER JOIN service_ticket_mechanics "
+        "ON service_ticket_mechanics.mechanic_id = mechanic.id "
+        "GROUP BY mechanic.id"
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('mechanic_leaderboard', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_mechanic_leaderboard_tickets_worked'))
+
+    op.drop_table('mechanic_leaderboard')
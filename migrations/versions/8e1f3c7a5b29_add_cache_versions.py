@@ -0,0 +1,28 @@
+"""Add cache versions
+
+Revision ID: 8e1f3c7a5b29
+Revises: 6b2e8f4a1d07
+Create Date: 2026-10-18 22:03:17.846102
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8e1f3c7a5b29'
+down_revision = '6b2e8f4a1d07'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('cache_versions',
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('version', sa.String(length=32), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+
+
+def downgrade():
+    op.drop_table('cache_versions')
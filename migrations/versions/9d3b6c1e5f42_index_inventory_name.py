@@ -0,0 +1,26 @@
+"""Index inventory name
+
+Revision ID: 9d3b6c1e5f42
+Revises: 4c1f9e2b7a30
+Create Date: 2026-10-18 13:10:42.518204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9d3b6c1e5f42'
+down_revision = '4c1f9e2b7a30'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('inventory', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_inventory_name'), ['name'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('inventory', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_inventory_name'))
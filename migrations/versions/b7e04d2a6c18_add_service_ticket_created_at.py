@@ -0,0 +1,35 @@
+"""Add service ticket created_at
+
+Revision ID: b7e04d2a6c18
+Revises: 9d3b6c1e5f42
+Create Date: 2026-10-18 14:02:37.906113
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7e04d2a6c18'
+down_revision = '9d3b6c1e5f42'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('service_tickets', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('created_at', sa.DateTime(), nullable=True))
+
+    # Existing tickets have no recorded open date; stamp them with the
+    # migration time so date-filtered exports still include them
+    op.execute(sa.text("UPDATE service_tickets SET created_at = CURRENT_TIMESTAMP"))
+
+    with op.batch_alter_table('service_tickets', schema=None) as batch_op:
+        batch_op.alter_column('created_at', existing_type=sa.DateTime(), nullable=False)
+        batch_op.create_index(batch_op.f('ix_service_tickets_created_at'), ['created_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('service_tickets', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_service_tickets_created_at'))
+        batch_op.drop_column('created_at')
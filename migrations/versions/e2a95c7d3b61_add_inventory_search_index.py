@@ -0,0 +1,55 @@
+"""Add inventory search index
+
+Revision ID: e2a95c7d3b61
+Revises: b7e04d2a6c18
+Create Date: 2026-10-18 15:20:09.331870
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2a95c7d3b61'
+down_revision = 'b7e04d2a6c18'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        op.execute(
+            "CREATE VIRTUAL TABLE inventory_fts USING fts5("
+            "name, content='inventory', content_rowid='id', tokenize='trigram')"
+        )
+        op.execute(
+            "CREATE TRIGGER inventory_fts_ai AFTER INSERT ON inventory BEGIN "
+            "INSERT INTO inventory_fts(rowid, name) VALUES (new.id, new.name); END"
+        )
+        op.execute(
+            "CREATE TRIGGER inventory_fts_ad AFTER DELETE ON inventory BEGIN "
+            "INSERT INTO inventory_fts(inventory_fts, rowid, name) VALUES ('delete', old.id, old.name); END"
+        )
+        op.execute(
+            "CREATE TRIGGER inventory_fts_au AFTER UPDATE OF name ON inventory BEGIN "
+            "INSERT INTO inventory_fts(inventory_fts, rowid, name) VALUES ('delete', old.id, old.name); "
+            "INSERT INTO inventory_fts(rowid, name) VALUES (new.id, new.name); END"
+        )
+        # Index the parts that already exist
+        op.execute("INSERT INTO inventory_fts(inventory_fts) VALUES ('rebuild')")
+    elif dialect == 'mysql':
+        op.execute(
+            "CREATE FULLTEXT INDEX ix_inventory_name_fulltext ON inventory (name) WITH PARSER ngram"
+        )
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        op.execute("DROP TRIGGER IF EXISTS inventory_fts_au")
+        op.execute("DROP TRIGGER IF EXISTS inventory_fts_ad")
+        op.execute("DROP TRIGGER IF EXISTS inventory_fts_ai")
+        op.execute("DROP TABLE IF EXISTS inventory_fts")
+    elif dialect == 'mysql':
+        op.execute("DROP INDEX ix_inventory_name_fulltext ON inventory")
@@ -0,0 +1,111 @@
+import time
+import unittest
+from jose import jwt
+from app import create_app, db
+from app.models import Customer
+from app.utils.util import (
+    TokenCache,
+    token_cache,
+    encode_token,
+    encode_mechanic_token,
+    SECRET_KEY,
+    ALGORITHM,
+)
+
+
+class TestTokenCache(unittest.TestCase):
+
+    def test_hit_after_put(self):
+        cache = TokenCache(maxsize=2)
+        claims = {"sub": "1", "exp": time.time() + 60}
+        self.assertIsNone(cache.get("a"))
+        cache.put("a", claims)
+        self.assertEqual(cache.get("a"), claims)
+        self.assertEqual(cache.stats(), {"hits": 1, "misses": 1, "size": 1})
+
+    def test_expired_entry_is_evicted(self):
+        cache = TokenCache()
+        cache.put("a", {"sub": "1", "exp": time.time() - 1})
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.stats()["size"], 0)
+
+    def test_least_recently_used_is_evicted(self):
+        cache = TokenCache(maxsize=2)
+        exp = time.time() + 60
+        cache.put("a", {"exp": exp})
+        cache.put("b", {"exp": exp})
+        cache.get("a")
+        cache.put("c", {"exp": exp})
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("c"))
+
+    def test_tokens_without_exp_are_not_cached(self):
+        cache = TokenCache()
+        cache.put("a", {"sub": "1"})
+        self.assertEqual(cache.stats()["size"], 0)
+
+
+class TestAuthDecorators(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app(testing=True)
+        self.client = self.app.test_client()
+        token_cache.clear()
+
+        with self.app.app_context():
+            db.create_all()
+            customer = Customer(name="Owner", email="owner@shop.com", password="x")
+            db.session.add(customer)
+            db.session.commit()
+            self.customer_id = customer.id
+
+    def tearDown(self):
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def get_vehicles(self, token):
+        return self.client.get("/vehicles/", headers={"Authorization": f"Bearer {token}"})
+
+    def test_repeated_requests_hit_cache(self):
+        token = encode_token(self.customer_id)
+        self.assertEqual(self.get_vehicles(token).status_code, 200)
+        self.assertEqual(self.get_vehicles(token).status_code, 200)
+        self.assertEqual(token_cache.stats()["misses"], 1)
+        self.assertEqual(token_cache.stats()["hits"], 1)
+
+    def test_invalid_and_missing_tokens(self):
+        self.assertEqual(self.client.get("/vehicles/").status_code, 401)
+        self.assertEqual(self.get_vehicles("not-a-token").status_code, 401)
+
+        forged = jwt.encode({"sub": "1", "exp": time.time() + 60}, "other-key", algorithm=ALGORITHM)
+        self.assertEqual(self.get_vehicles(forged).status_code, 401)
+
+    def test_expired_token_rejected(self):
+        expired = jwt.encode({"sub": str(self.customer_id), "exp": time.time() - 1}, SECRET_KEY, algorithm=ALGORITHM)
+        self.assertEqual(self.get_vehicles(expired).status_code, 401)
+
+    def test_tokens_are_not_interchangeable(self):
+        mechanic_token = encode_mechanic_token(1)
+        self.assertEqual(self.get_vehicles(mechanic_token).status_code, 401)
+
+        res = self.client.post(
+            "/inventory/",
+            json={"name": "Filter", "price": 5.0},
+            headers={"Authorization": f"Bearer {encode_token(self.customer_id)}"}
+        )
+        self.assertEqual(res.status_code, 403)
+
+    def test_mechanic_token_accepted(self):
+        res = self.client.post(
+            "/inventory/",
+            json={"name": "Filter", "price": 5.0},
+            headers={"Authorization": f"Bearer {encode_mechanic_token(7)}"}
+        )
+        self.assertEqual(res.status_code, 201)
+        self.assertEqual(res.get_json()["added_by_mechanic_id"], 7)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from app import create_app, db
+from app.models import Customer, Vehicle, Mechanic, Inventory, ServiceTicket
+from app.utils.util import encode_token, encode_mechanic_token, token_cache
+
+
+class TestBatch(unittest.TestCase):
+
+    def setUp(self, **config):
+        self.app = create_app(testing=True, config=config)
+        self.client = self.app.test_client()
+
+        with self.app.app_context():
+            db.create_all()
+            customer = Customer(name="Owner", email="owner@shop.com", password="x")
+            vehicle = Vehicle(make="Ford", model="F-150", year=2020, vin="VIN1", customer=customer)
+            mechanic = Mechanic(name="Mech", email="m@shop.com", password="x")
+            ticket = ServiceTicket(description="T", description_of_issue="Noise", vehicle=vehicle)
+            db.session.add_all([customer, mechanic, ticket, Inventory(name="Brake pad", price=40.0)])
+            db.session.commit()
+            self.customer_id = customer.id
+            self.mechanic_id = mechanic.id
+            self.ticket_id = ticket.id
+
+        self.headers = {"Authorization": f"Bearer {encode_token(self.customer_id)}"}
+        self.mechanic_headers = {"Authorization": f"Bearer {encode_mechanic_token(self.mechanic_id)}"}
+
+    def tearDown(self):
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def batch(self, requests, status=200, **extra):
+        res = self.client.post("/batch", json={"requests": requests, **extra}, headers=self.headers)
+        self.assertEqual(res.status_code, status)
+        return res.get_json()
+
+    # -----------------------------
+    # Tests
+    # -----------------------------
+    def test_reads_match_individual_calls(self):
+        paths = ["/vehicles/", "/inventory/", "/mechanics/", "/service_ticket_mechanics/"]
+        responses = self.batch([{"path": path} for path in paths])["responses"]
+
+        self.assertEqual([r["status"] for r in responses], [200] * 4)
+        for path, response in zip(paths, responses):
+            self.assertEqual(response["body"], self.client.get(path, headers=self.headers).get_json())
+        self.assertIn("ETag", responses[1]["headers"])
+
+    def test_writes_run_in_order(self):
+        vehicle = {"make": "Honda", "model": "Civic", "year": 2018, "vin": "VIN2"}
+        responses = self.batch([
+            {"method": "POST", "path": "/vehicles/", "body": vehicle},
+            {"path": "/vehicles/"},
+            {"method": "POST", "path": "/inventory/", "body": {"name": "Rotor", "price": 80.0},
+             "headers": self.mechanic_headers},
+            {"path": "/inventory/"},
+        ])["responses"]
+
+        self.assertEqual([r["status"] for r in responses], [201, 200, 201, 200])
+        self.assertEqual(sorted(v["vin"] for v in responses[1]["body"]), ["VIN1", "VIN2"])
+        self.assertIn("Rotor", [p["name"] for p in responses[3]["body"]])
+
+    def test_sub_request_failures_are_isolated(self):
+        responses = self.batch([
+            {"path": "/inventory/999"},
+            {"method": "POST", "path": "/inventory/", "body": {"name": "Rotor", "price": 80.0}},
+            {"path": "/nowhere"},
+            {"path": "/inventory/"},
+        ])["responses"]
+        self.assertEqual([r["status"] for r in responses], [404, 403, 404, 200])
+
+    def test_token_decoded_once(self):
+        token_cache.clear()
+        self.batch([{"path": "/vehicles/"}] * 3)
+        stats = token_cache.stats()
+        self.assertEqual(stats["misses"], 1)
+        self.assertGreaterEqual(stats["hits"], 3)
+
+    def test_invalid_batches(self):
+        self.batch([], status=400)
+        self.batch([{"path": "/inventory/"}] * 21, status=400)
+        self.batch([{"path": "/batch"}], status=400)
+        self.batch([{"method": "TRACE", "path": "/inventory/"}], status=400)
+        self.batch([{"path": "inventory"}], status=400)
+        self.batch([{"path": "/inventory/", "headers": {"X-Count": 1}}], status=400)
+
+
+class TestBatchParallel(TestBatch):
+
+    def setUp(self):
+        # Pool threads need their own connections, so a file database
+        self.tmp = tempfile.mkdtemp()
+        super().setUp(
+            SQLALCHEMY_DATABASE_URI=f"sqlite:///{os.path.join(self.tmp, 'batch.db')}",
+            BATCH_WORKERS=4,
+        )
+
+    def tearDown(self):
+        super().tearDown()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_parallel_reads(self):
+        threads = []
+        self.app.before_request(lambda: threads.append(threading.current_thread().name))
+
+        paths = ["/vehicles/", "/inventory/", "/mechanics/", "/service_ticket_mechanics/"]
+        sequential = self.batch([{"path": path} for path in paths])["responses"]
+        self.assertTrue(all(not name.startswith("batch") for name in threads))
+
+        threads.clear()
+        parallel = self.batch([{"path": path} for path in paths], parallel=True)["responses"]
+        self.assertEqual(
+            [(r["status"], r["body"]) for r in parallel],
+            [(r["status"], r["body"]) for r in sequential]
+        )
+        self.assertTrue(any(name.startswith("batch") for name in threads))
+
+
+class TestBatchRateLimits(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app(testing=True, config={"RATELIMIT_ENABLED": True})
+        self.client = self.app.test_client()
+        with self.app.app_context():
+            db.create_all()
+
+    def tearDown(self):
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def test_batch_counts_once_against_default_limits(self):
+        # Default limit is 50 per hour; 60 sub-requests in 3 batches pass
+        for _ in range(3):
+            res = self.client.post("/batch", json={"requests": [{"path": "/inventory/"}] * 20})
+            self.assertEqual(res.status_code, 200)
+            self.assertEqual({r["status"] for r in res.get_json()["responses"]}, {200})
+
+    def test_route_limits_still_apply(self):
+        body = {"email": "nobody@shop.com", "password": "x"}
+        res = self.client.post(
+            "/batch",
+            json={"requests": [{"method": "POST", "path": "/customers/login", "body": body}] * 6}
+        )
+        codes = [r["status"] for r in res.get_json()["responses"]]
+        self.assertEqual(codes[-1], 429)
+        self.assertNotIn(429, codes[:5])
+
+
+if __name__ == "__main__":
+    unittest.main()
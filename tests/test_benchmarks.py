@@ -0,0 +1,47 @@
+import json
+import unittest
+from benchmarks.endpoints import run_suite, compare, ROUTES, BASELINE_PATH
+
+TINY_VOLUMES = {
+    "customers": 5,
+    "mechanics": 4,
+    "parts": 10,
+}
+
+
+class TestEndpointBenchmarks(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.result = run_suite(TINY_VOLUMES, iterations=2)
+
+    def test_every_route_is_measured(self):
+        self.assertEqual(set(self.result["routes"]), {route[0] for route in ROUTES})
+        for stats in self.result["routes"].values():
+            self.assertGreater(stats["throughput_rps"], 0)
+            self.assertLessEqual(stats["p50_ms"], stats["p95_ms"])
+
+    def test_query_counts_do_not_exceed_baseline(self):
+        with open(BASELINE_PATH) as f:
+            baseline = json.load(f)
+        # Latency on a tiny dataset is not comparable; statement counts are
+        # non-decreasing in data volume so the baseline is an upper bound
+        for name, stats in self.result["routes"].items():
+            if name in baseline["routes"]:
+                self.assertLessEqual(stats["queries"], baseline["routes"][name]["queries"], name)
+
+    def test_compare_flags_regressions(self):
+        baseline = {"routes": {"GET /x": {"p95_ms": 10.0, "queries": 2}}}
+
+        ok = {"routes": {"GET /x": {"p95_ms": 14.0, "queries": 2}}}
+        self.assertEqual(compare(ok, baseline, tolerance=0.5), [])
+
+        slow = {"routes": {"GET /x": {"p95_ms": 16.0, "queries": 2}}}
+        self.assertEqual(len(compare(slow, baseline, tolerance=0.5)), 1)
+
+        chatty = {"routes": {"GET /x": {"p95_ms": 10.0, "queries": 3}}}
+        self.assertEqual(len(compare(chatty, baseline, tolerance=0.5)), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,240 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from sqlalchemy import event
+from app import create_app, db
+from app.models import Customer, Vehicle, ServiceTicket, Mechanic, Inventory
+from app.utils.caching import versioned_cache, versioned_json_response, table_versions
+from app.utils.util import encode_token, encode_mechanic_token
+
+
+class TestVersionedCache(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app(testing=True)
+        self.client = self.app.test_client()
+
+        with self.app.app_context():
+            db.create_all()
+
+    def tearDown(self):
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def count_statements(self, fn):
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        with self.app.app_context():
+            engine = db.engine
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            result = fn()
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+        return result, len(statements)
+
+    # -----------------------------
+    # Tests
+    # -----------------------------
+    def test_repeat_list_is_served_from_cache(self):
+        self.client.get("/inventory/")
+        res, count = self.count_statements(lambda: self.client.get("/inventory/"))
+        self.assertEqual(res.status_code, 200)
+        # Only the cache version lookup
+        self.assertEqual(count, 1)
+
+    def test_write_invalidates_without_manual_delete(self):
+        self.assertEqual(self.client.get("/inventory/").get_json(), [])
+
+        res = self.client.post(
+            "/inventory/",
+            json={"name": "Filter", "price": 5.0},
+            headers={"Authorization": f"Bearer {encode_mechanic_token(1)}"}
+        )
+        self.assertEqual(res.status_code, 201)
+
+        items = self.client.get("/inventory/").get_json()
+        self.assertEqual([i["name"] for i in items], ["Filter"])
+
+    def test_association_and_bulk_writes_bump_link_table(self):
+        with self.app.app_context():
+            customer = Customer(name="Owner", email="owner@shop.com", password="x")
+            vehicle = Vehicle(make="Ford", model="F-150", year=2020, vin="VIN1", customer=customer)
+            ticket = ServiceTicket(description="T", description_of_issue="Noise", vehicle=vehicle)
+            mechanics = [Mechanic(name=f"M{i}", email=f"m{i}@shop.com", password="x") for i in range(2)]
+            db.session.add_all([customer] + mechanics)
+            db.session.commit()
+            customer_id, ticket_id = customer.id, ticket.id
+            m0, m1 = [m.id for m in mechanics]
+
+        headers = {"Authorization": f"Bearer {encode_token(customer_id)}"}
+        self.assertEqual(self.client.get("/service_ticket_mechanics/").get_json(), [])
+
+        # ORM many-to-many append
+        self.client.put(f"/service_tickets/{ticket_id}/assign-mechanic/{m0}", headers=headers)
+        links = self.client.get("/service_ticket_mechanics/").get_json()
+        self.assertEqual([l["mechanic_id"] for l in links], [m0])
+
+        # Core executemany insert from edit_ticket
+        self.client.put(f"/service_tickets/{ticket_id}/edit", json={"add_mechanics": [m1]}, headers=headers)
+        links = self.client.get("/service_ticket_mechanics/").get_json()
+        self.assertEqual(sorted(l["mechanic_id"] for l in links), [m0, m1])
+
+    def test_deleting_owner_bumps_link_table(self):
+        with self.app.app_context():
+            customer = Customer(name="Owner", email="owner@shop.com", password="x")
+            vehicle = Vehicle(make="Ford", model="F-150", year=2020, vin="VIN1", customer=customer)
+            mechanic = Mechanic(name="M", email="m@shop.com", password="x")
+            ServiceTicket(description="T", description_of_issue="Noise", vehicle=vehicle, mechanics=[mechanic])
+            db.session.add_all([customer, mechanic])
+            db.session.commit()
+            mechanic_id = mechanic.id
+
+        self.assertEqual(len(self.client.get("/service_ticket_mechanics/").get_json()), 1)
+
+        # The link row goes with the mechanic, not through the collection
+        res = self.client.delete(
+            f"/mechanics/{mechanic_id}",
+            headers={"Authorization": f"Bearer {encode_mechanic_token(mechanic_id)}"}
+        )
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(self.client.get("/service_ticket_mechanics/").get_json(), [])
+
+    def test_rollback_keeps_versions(self):
+        with self.app.app_context():
+            before = table_versions(["inventory"])
+            db.session.add(Inventory(name="Filter", price=5.0))
+            db.session.flush()
+            db.session.rollback()
+            self.assertEqual(table_versions(["inventory"]), before)
+
+    # -----------------------------
+    # Conditional GET
+    # -----------------------------
+    def test_if_none_match_returns_304_after_version_lookup(self):
+        for path in ["/inventory/", "/mechanics/"]:
+            etag = self.client.get(path).headers["ETag"]
+            self.assertFalse(etag.startswith("W/"))
+
+            res, count = self.count_statements(
+                lambda: self.client.get(path, headers={"If-None-Match": etag})
+            )
+            self.assertEqual(res.status_code, 304)
+            self.assertEqual(res.data, b"")
+            self.assertEqual(res.headers["ETag"], etag)
+            self.assertEqual(count, 1)
+
+    def test_not_modified_skips_compute(self):
+        def compute():
+            raise AssertionError("compute() ran for a 304")
+
+        with self.app.test_request_context():
+            etag = versioned_json_response("parts", ["inventory"], lambda: []).get_etag()[0]
+        with self.app.test_request_context(headers={"If-None-Match": f'"{etag}"'}):
+            res = versioned_json_response("parts", ["inventory"], compute)
+        self.assertEqual(res.status_code, 304)
+
+    def test_write_changes_etag(self):
+        etag = self.client.get("/inventory/").headers["ETag"]
+        self.client.post(
+            "/inventory/",
+            json={"name": "Filter", "price": 5.0},
+            headers={"Authorization": f"Bearer {encode_mechanic_token(1)}"}
+        )
+
+        res = self.client.get("/inventory/", headers={"If-None-Match": etag})
+        self.assertEqual(res.status_code, 200)
+        self.assertNotEqual(res.headers["ETag"], etag)
+        self.assertEqual([i["name"] for i in res.get_json()], ["Filter"])
+
+    def test_vehicle_etags_are_per_customer(self):
+        with self.app.app_context():
+            owners = [Customer(name=f"C{i}", email=f"c{i}@shop.com", password="x") for i in range(2)]
+            db.session.add_all(owners)
+            db.session.add(Vehicle(make="Ford", model="F-150", year=2020, vin="VIN1", customer=owners[0]))
+            db.session.commit()
+            first, second = [{"Authorization": f"Bearer {encode_token(c.id)}"} for c in owners]
+
+        res = self.client.get("/vehicles/", headers=first)
+        etag = res.headers["ETag"]
+        self.assertIn("private", res.headers["Cache-Control"])
+
+        # Another customer's ETag never matches, so they get their own list
+        res = self.client.get("/vehicles/", headers={**second, "If-None-Match": etag})
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.get_json(), [])
+
+        res = self.client.get("/vehicles/", headers={**first, "If-None-Match": etag})
+        self.assertEqual(res.status_code, 304)
+
+    def test_single_flight_recompute(self):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.05)
+            return ["value"]
+
+        results = []
+
+        def worker():
+            with self.app.app_context():
+                results.append(versioned_cache("slow", ["inventory"], compute))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [["value"]] * 8)
+
+
+class TestVersionsAcrossWorkers(unittest.TestCase):
+    """
+    Two apps on one database file stand in for two worker processes, each
+    with its own SimpleCache.
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        config = {"SQLALCHEMY_DATABASE_URI": f"sqlite:///{os.path.join(self.tmp.name, 'shop.db')}"}
+        self.apps = [create_app(testing=True, config=config) for _ in range(2)]
+        self.clients = [app.test_client() for app in self.apps]
+        with self.apps[0].app_context():
+            db.create_all()
+
+    def tearDown(self):
+        for app in self.apps:
+            with app.app_context():
+                db.session.remove()
+                db.engine.dispose()
+        self.tmp.cleanup()
+
+    def test_workers_agree_on_etags_and_see_each_others_writes(self):
+        first, second = self.clients
+        etag = first.get("/inventory/").headers["ETag"]
+        self.assertEqual(second.get("/inventory/").headers["ETag"], etag)
+
+        res = first.post(
+            "/inventory/",
+            json={"name": "Filter", "price": 5.0},
+            headers={"Authorization": f"Bearer {encode_mechanic_token(1)}"}
+        )
+        self.assertEqual(res.status_code, 201)
+
+        res = second.get("/inventory/", headers={"If-None-Match": etag})
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual([i["name"] for i in res.get_json()], ["Filter"])
+        self.assertEqual(first.get("/inventory/").headers["ETag"], res.headers["ETag"])
+
+
+if __name__ == "__main__":
+    unittest.main()
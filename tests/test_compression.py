@@ -0,0 +1,115 @@
+import gzip
+import os
+import unittest
+from app import create_app, db
+from app.blueprints import API_URL
+from app.models import Customer, Inventory, ServiceTicket, Vehicle
+from app.utils.util import encode_mechanic_token
+
+GZIP = {"Accept-Encoding": "gzip"}
+
+
+class TestCompression(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app(testing=True)
+        self.client = self.app.test_client()
+
+        with self.app.app_context():
+            db.create_all()
+            db.session.add_all(Inventory(name=f"Part {i}", price=float(i)) for i in range(200))
+            db.session.commit()
+
+    def tearDown(self):
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    # -----------------------------
+    # Dynamic responses
+    # -----------------------------
+    def test_large_json_is_gzipped(self):
+        plain = self.client.get("/inventory/")
+        res = self.client.get("/inventory/", headers=GZIP)
+
+        self.assertEqual(res.headers["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", res.headers["Vary"])
+        self.assertLess(len(res.data), len(plain.data))
+        self.assertEqual(gzip.decompress(res.data), plain.data)
+
+    def test_gzip_etag_is_weak_and_revalidates(self):
+        res = self.client.get("/inventory/", headers=GZIP)
+        etag = res.headers["ETag"]
+        self.assertTrue(etag.startswith("W/"))
+
+        res = self.client.get("/inventory/", headers={**GZIP, "If-None-Match": etag})
+        self.assertEqual(res.status_code, 304)
+
+    def test_without_accept_encoding_is_identity(self):
+        res = self.client.get("/inventory/", headers={"Accept-Encoding": "identity"})
+        self.assertNotIn("Content-Encoding", res.headers)
+        self.assertEqual(len(res.get_json()), 200)
+
+    def test_small_payload_is_not_compressed(self):
+        res = self.client.get("/mechanics/", headers=GZIP)
+        self.assertEqual(res.get_json(), [])
+        self.assertNotIn("Content-Encoding", res.headers)
+
+    def test_streamed_export_is_gzipped(self):
+        with self.app.app_context():
+            customer = Customer(name="Owner", email="owner@shop.com", password="x")
+            vehicle = Vehicle(make="Ford", model="F-150", year=2020, vin="VIN1", customer=customer)
+            db.session.add_all(
+                ServiceTicket(description=f"T{i}", description_of_issue="Noise", vehicle=vehicle) for i in range(50)
+            )
+            db.session.commit()
+
+        self.app.config["SERVICE_TICKET_EXPORT_BATCH_SIZE"] = 10
+        headers = {"Authorization": f"Bearer {encode_mechanic_token(1)}"}
+        plain_chunks = list(self.client.get("/service_tickets/export", headers=headers).iter_encoded())
+        res = self.client.get("/service_tickets/export", headers={**headers, **GZIP})
+
+        self.assertTrue(res.is_streamed)
+        self.assertEqual(res.headers["Content-Encoding"], "gzip")
+        self.assertNotIn("Content-Length", res.headers)
+        chunks = list(res.iter_encoded())
+        # 50 tickets in batches of 10, each compressed as it arrives
+        self.assertEqual(len(plain_chunks), 5)
+        self.assertGreaterEqual(len(chunks), 5)
+        self.assertEqual(gzip.decompress(b"".join(chunks)), b"".join(plain_chunks))
+
+    # -----------------------------
+    # Static files
+    # -----------------------------
+    def test_static_served_precompressed_with_long_cache(self):
+        with open(os.path.join(self.app.static_folder, "swagger.yaml"), "rb") as f:
+            source = f.read()
+
+        res = self.client.get(API_URL, headers=GZIP)
+        self.assertEqual(res.headers["Content-Encoding"], "gzip")
+        self.assertEqual(res.mimetype, "application/yaml")
+        self.assertEqual(gzip.decompress(res.data), source)
+        self.assertIn("max-age=31536000", res.headers["Cache-Control"])
+
+        res = self.client.get(API_URL, headers={**GZIP, "If-None-Match": res.headers["ETag"]})
+        self.assertEqual(res.status_code, 304)
+
+        res = self.client.get(API_URL)
+        self.assertNotIn("Content-Encoding", res.headers)
+        self.assertEqual(res.data, source)
+        self.assertIn("max-age=31536000", res.headers["Cache-Control"])
+        res.close()
+
+    def test_disabled(self):
+        app = create_app(testing=True, config={"COMPRESS_ENABLED": False})
+        with app.app_context():
+            db.create_all()
+            db.session.add_all(Inventory(name=f"Part {i}", price=1.0) for i in range(200))
+            db.session.commit()
+            res = app.test_client().get("/inventory/", headers=GZIP)
+            db.drop_all()
+        self.assertNotIn("Content-Encoding", res.headers)
+
+
+if __name__ == "__main__":
+    unittest.main()
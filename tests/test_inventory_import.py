@@ -0,0 +1,107 @@
+import json
+import unittest
+from app import create_app, db
+from app.models import Inventory
+from app.utils.util import encode_mechanic_token
+
+
+class TestInventoryBulkImport(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app(testing=True)
+        self.client = self.app.test_client()
+        self.headers = {"Authorization": f"Bearer {encode_mechanic_token(1)}"}
+
+        with self.app.app_context():
+            db.create_all()
+            db.session.add(Inventory(name="Brake Pad", price=40.0))
+            db.session.commit()
+
+    def tearDown(self):
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def post(self, body, content_type, query=""):
+        return self.client.post(
+            f"/inventory/bulk{query}",
+            data=body,
+            headers=dict(self.headers, **{"Content-Type": content_type})
+        )
+
+    def prices(self):
+        with self.app.app_context():
+            return {i.name: i.price for i in Inventory.query.all()}
+
+    def test_ndjson_upserts_on_name(self):
+        body = "\n".join(json.dumps(row) for row in [
+            {"name": "Brake Pad", "price": 45.5},
+            {"name": "Oil Filter", "price": 12},
+            {"name": "Spark Plug", "price": 6.25},
+        ])
+        res = self.post(body, "application/x-ndjson", "?batch_size=2")
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json["inserted"], 2)
+        self.assertEqual(res.json["updated"], 1)
+        self.assertEqual(res.json["failed"], 0)
+        self.assertEqual(
+            self.prices(),
+            {"Brake Pad": 45.5, "Oil Filter": 12.0, "Spark Plug": 6.25}
+        )
+
+    def test_csv_import(self):
+        body = "name,price\nWiper Blade,15\nBrake Pad,41\n"
+        res = self.post(body, "text/csv")
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual((res.json["inserted"], res.json["updated"]), (1, 1))
+        self.assertEqual(self.prices(), {"Brake Pad": 41.0, "Wiper Blade": 15.0})
+
+    def test_invalid_rows_are_reported_and_skipped(self):
+        body = "\n".join([
+            json.dumps({"name": "Oil Filter", "price": 12}),
+            "not json",
+            json.dumps({"name": "No Price"}),
+            json.dumps({"name": "Bad Price", "price": "cheap"}),
+        ])
+        res = self.post(body, "application/x-ndjson")
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json["inserted"], 1)
+        self.assertEqual(res.json["failed"], 3)
+        self.assertEqual([e["line"] for e in res.json["errors"]], [2, 3, 4])
+        self.assertIn("price", res.json["errors"][1]["errors"])
+        self.assertFalse(res.json["errors_truncated"])
+        self.assertEqual(set(self.prices()), {"Brake Pad", "Oil Filter"})
+
+    def test_invalid_utf8_rows_are_reported_and_skipped(self):
+        body = b"name,price\n\xff,1\nWiper Blade,15\n"
+        res = self.post(body, "text/csv", "?batch_size=1")
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual((res.json["inserted"], res.json["failed"]), (1, 1))
+        self.assertEqual(res.json["errors"], [{"line": 2, "errors": {"_schema": ["Invalid UTF-8."]}}])
+
+        body = b"\n".join([
+            json.dumps({"name": "Oil Filter", "price": 12}).encode(),
+            b'{"name": "\xff", "price": 1}',
+            json.dumps({"name": "Spark Plug", "price": 6.25}).encode(),
+        ])
+        res = self.post(body, "application/x-ndjson", "?batch_size=1")
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual((res.json["inserted"], res.json["failed"]), (2, 1))
+        self.assertEqual([e["line"] for e in res.json["errors"]], [2])
+        self.assertEqual(set(self.prices()), {"Brake Pad", "Wiper Blade", "Oil Filter", "Spark Plug"})
+
+    def test_unsupported_content_type(self):
+        res = self.post("{}", "application/json")
+        self.assertEqual(res.status_code, 415)
+
+    def test_invalid_batch_size(self):
+        res = self.post("", "application/x-ndjson", "?batch_size=0")
+        self.assertEqual(res.status_code, 400)
+
+    def test_requires_mechanic_token(self):
+        res = self.client.post("/inventory/bulk", data="", content_type="text/csv")
+        self.assertEqual(res.status_code, 401)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import unittest
+from app import create_app, db
+from app.inventory.search import search_statement
+from app.models import Inventory
+from app.utils.util import encode_mechanic_token
+
+
+class TestInventorySearch(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app(testing=True)
+        self.client = self.app.test_client()
+
+        with self.app.app_context():
+            db.create_all()
+            db.session.add_all([
+                Inventory(name="Brake Pad", price=40.0),
+                Inventory(name="Front Brake Rotor", price=120.0),
+                Inventory(name="Oil Filter", price=9.5),
+                Inventory(name="Air Filter", price=14.0),
+                Inventory(name="100% Synthetic Oil", price=35.0),
+            ])
+            db.session.commit()
+
+    def tearDown(self):
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def search(self, query):
+        res = self.client.get(f"/inventory/search?{query}")
+        self.assertEqual(res.status_code, 200, res.get_data(as_text=True))
+        return [item["name"] for item in res.json]
+
+    def test_substring_is_case_insensitive(self):
+        self.assertEqual(self.search("q=BRAKE"), ["Brake Pad", "Front Brake Rotor"])
+        self.assertEqual(self.search("q=ilter"), ["Oil Filter", "Air Filter"])
+
+    def test_prefix(self):
+        self.assertEqual(self.search("q=brake&mode=prefix"), ["Brake Pad"])
+        self.assertEqual(self.search("q=ilter&mode=prefix"), [])
+
+    def test_price_range_and_limit(self):
+        self.assertEqual(self.search("q=filter&min_price=10"), ["Air Filter"])
+        self.assertEqual(self.search("q=brake&max_price=100"), ["Brake Pad"])
+        self.assertEqual(self.search("q=brake&limit=1"), ["Brake Pad"])
+
+    def test_wildcards_are_literal(self):
+        self.assertEqual(self.search("q=100%25"), ["100% Synthetic Oil"])
+        self.assertEqual(self.search("q=0%25 S"), ["100% Synthetic Oil"])
+        self.assertEqual(self.search('q=oil"'), [])
+
+    def test_index_follows_writes(self):
+        headers = {"Authorization": f"Bearer {encode_mechanic_token(1)}"}
+        self.client.post("/inventory/", json={"name": "Spark Plug", "price": 6.0}, headers=headers)
+        self.assertEqual(self.search("q=spark"), ["Spark Plug"])
+
+        self.client.put("/inventory/1", json={"name": "Brake Shoe"}, headers=headers)
+        self.assertEqual(self.search("q=brake p"), [])
+        self.assertEqual(self.search("q=shoe"), ["Brake Shoe"])
+
+        self.client.delete("/inventory/3", headers=headers)
+        self.assertEqual(self.search("q=filter"), ["Air Filter"])
+
+        self.client.post(
+            "/inventory/bulk",
+            data='{"name": "Cabin Filter", "price": 18}\n',
+            headers=dict(headers, **{"Content-Type": "application/x-ndjson"})
+        )
+        self.assertEqual(self.search("q=filter"), ["Air Filter", "Cabin Filter"])
+
+    def test_bad_requests(self):
+        for query in ["q=ab", "q=brake&mode=fuzzy", "q=brake&limit=0", "q=brake&limit=1000"]:
+            self.assertEqual(self.client.get(f"/inventory/search?{query}").status_code, 400, query)
+
+    def test_plan_uses_full_text_index(self):
+        with self.app.app_context():
+            compiled = search_statement("brake", min_price=1).compile(
+                db.engine, compile_kwargs={"literal_binds": True}
+            )
+            plan = [row[-1] for row in db.session.execute(db.text(f"EXPLAIN QUERY PLAN {compiled}"))]
+        self.assertTrue(any("inventory_fts VIRTUAL TABLE" in d for d in plan), plan)
+        self.assertFalse(any(d.startswith("SCAN inventory ") or d == "SCAN inventory" for d in plan), plan)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,224 @@
+import csv
+import io
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from app import create_app, db
+from app.extensions import job_runner
+from app.models import Customer, Inventory, Job, Mechanic, ServiceTicket, Vehicle, service_ticket_inventory
+from app.service_tickets.export import EXPORT_FORMATS
+from app.utils.jobs import FileResult, INTERRUPTED_ERROR
+from app.utils.util import encode_mechanic_token
+
+
+class JobsTestCase(unittest.TestCase):
+    config = {}
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.app = create_app(testing=True, config=dict(self.config, JOBS_RESULT_DIR=os.path.join(self.tmp, "results")))
+        self.client = self.app.test_client()
+        self.headers = {"Authorization": f"Bearer {encode_mechanic_token(1)}"}
+
+        with self.app.app_context():
+            db.create_all()
+            customer = Customer(name="Owner", email="owner@shop.com", password="x")
+            vehicle = Vehicle(make="Ford", model="F-150", year=2020, vin="VIN1", customer=customer)
+            db.session.add_all([
+                customer, vehicle,
+                Mechanic(id=1, name="Ann", email="ann@shop.com", password="x", salary=41600),
+                Inventory(id=1, name="Brake Pad", price=40.0),
+            ])
+            db.session.flush()
+            for ticket_id in (1, 2):
+                db.session.add(ServiceTicket(
+                    id=ticket_id, vehicle_id=vehicle.id,
+                    description=f"Ticket {ticket_id}", description_of_issue="Noise"
+                ))
+            db.session.flush()
+            db.session.execute(db.insert(service_ticket_inventory), [{"ticket_id": 1, "inventory_id": 1}])
+            db.session.commit()
+
+    def tearDown(self):
+        job_runner.shutdown()
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def job(self, url):
+        res = self.client.get(url, headers=self.headers)
+        self.assertEqual(res.status_code, 200)
+        return res.json
+
+
+class TestJobs(JobsTestCase):
+
+    def test_post_job_returns_202_and_result(self):
+        res = self.client.post("/jobs/", json={"type": "rebuild_leaderboard"}, headers=self.headers)
+        self.assertEqual(res.status_code, 202)
+        self.assertEqual(res.headers["Location"], res.json["status_url"])
+
+        job = self.job(res.json["status_url"])
+        self.assertEqual(job["status"], "succeeded")
+        self.assertEqual(job["progress"], 1.0)
+        self.assertEqual(job["created_by_mechanic_id"], 1)
+        self.assertEqual(self.job(job["result_url"]), {"mechanics": 1})
+
+    def test_cost_rollup_offload(self):
+        body = {"ticket_ids": [1, 2, 9]}
+        sync = self.client.post("/service_tickets/costs", json=body, headers=self.headers).json
+
+        res = self.client.post("/service_tickets/costs?async=1", json=body, headers=self.headers)
+        self.assertEqual(res.status_code, 202)
+        job = self.job(res.json["status_url"])
+        self.assertEqual(job["type"], "ticket_costs")
+        self.assertEqual(job["params"], body)
+        self.assertEqual(self.job(job["result_url"]), sync)
+
+    def test_export_offload(self):
+        res = self.client.get("/service_tickets/export?async=1&format=csv&status=Pending", headers=self.headers)
+        self.assertEqual(res.status_code, 202)
+        job = self.job(res.json["status_url"])
+
+        result = self.client.get(job["result_url"], headers=self.headers)
+        self.assertEqual(result.mimetype, "text/csv")
+        rows = list(csv.DictReader(io.StringIO(result.get_data(as_text=True))))
+        self.assertEqual([r["id"] for r in rows], ["1", "2"])
+        self.assertEqual(job["result_size"], len(result.get_data()))
+        result.close()
+
+    def test_export_uses_configured_batch_size(self):
+        # Writes each partition's size, one per line
+        EXPORT_FORMATS["sizes"] = (lambda partitions: (f"{len(rows)}\n" for rows in partitions), "text/csv")
+        self.addCleanup(EXPORT_FORMATS.pop, "sizes")
+        self.app.config["SERVICE_TICKET_EXPORT_BATCH_SIZE"] = 1
+
+        with self.app.app_context():
+            job = job_runner.submit("ticket_export", {"format": "sizes"}, mechanic_id=1)
+            self.assertEqual(job.status, "succeeded")
+            with open(job_runner.result_path(job)) as f:
+                self.assertEqual(f.read(), "1\n1\n")
+
+    def test_failed_job_records_error(self):
+        def chunks():
+            yield "id\n"
+            raise RuntimeError("boom")
+
+        @job_runner.task("explode")
+        def explode(params, ctx):
+            return FileResult(chunks(), "text/csv")
+        self.addCleanup(job_runner.tasks.pop, "explode")
+
+        res = self.client.post("/jobs/", json={"type": "explode"}, headers=self.headers)
+        job = self.job(res.json["status_url"])
+        self.assertEqual(job["status"], "failed")
+        self.assertEqual(job["error"], "boom")
+        self.assertEqual(self.client.get(f"/jobs/{job['id']}/result", headers=self.headers).status_code, 409)
+        self.assertEqual(os.listdir(os.path.join(self.tmp, "results")), [])
+
+    def test_jobs_are_private_to_their_mechanic(self):
+        res = self.client.post("/jobs/", json={"type": "rebuild_leaderboard"}, headers=self.headers)
+        other = {"Authorization": f"Bearer {encode_mechanic_token(2)}"}
+        self.assertEqual(self.client.get(res.json["status_url"], headers=other).status_code, 404)
+        self.assertEqual(self.client.get("/jobs/nope", headers=self.headers).status_code, 404)
+
+    def test_bad_requests(self):
+        for body in [{"type": "nope"}, {"type": "rebuild_leaderboard", "params": [1]}]:
+            self.assertEqual(self.client.post("/jobs/", json=body, headers=self.headers).status_code, 400)
+
+    def test_recover_interrupted_jobs(self):
+        exited = subprocess.Popen([sys.executable, "-c", "pass"])
+        exited.wait()
+        host = socket.gethostname()
+        runners = {
+            "exited": (f"{host}:{exited.pid}", "running"),
+            "untracked": (None, "queued"),
+            "alive": (f"{host}:{os.getppid()}", "running"),
+            "remote": ("elsewhere:1", "queued"),
+            "done": (f"{host}:{exited.pid}", "succeeded"),
+        }
+        with self.app.app_context():
+            db.session.add_all([
+                Job(id=job_id, type="rebuild_leaderboard", status=status, runner=runner)
+                for job_id, (runner, status) in runners.items()
+            ])
+            db.session.commit()
+
+            self.assertEqual(job_runner.recover_interrupted(), 2)
+            jobs = {job.id: (job.status, job.error) for job in Job.query.all()}
+
+        self.assertEqual(jobs, {
+            "exited": ("failed", INTERRUPTED_ERROR),
+            "untracked": ("failed", INTERRUPTED_ERROR),
+            "alive": ("running", None),
+            "remote": ("queued", None),
+            "done": ("succeeded", None),
+        })
+
+    def test_startup_recovery_tolerates_missing_table(self):
+        with self.assertLogs("app.jobs", "INFO") as logs:
+            create_app(testing=True, config={"JOBS_RECOVER_INTERRUPTED": True})
+        # One line, no traceback
+        self.assertEqual(len(logs.records), 1)
+        self.assertEqual(logs.records[0].levelname, "INFO")
+        self.assertIsNone(logs.records[0].exc_info)
+
+
+class TestThreadedJobs(JobsTestCase):
+    """
+    With worker threads the request returns before the job runs.
+    """
+
+    def setUp(self):
+        self.config = {
+            "JOBS_WORKERS": 2,
+            "SQLALCHEMY_DATABASE_URI": "sqlite:///" + os.path.join(tempfile.gettempdir(), f"jobs-{os.getpid()}.db"),
+        }
+        super().setUp()
+        self.release = threading.Event()
+
+        @job_runner.task("wait")
+        def wait(params, ctx):
+            ctx.progress(1, 2)
+            self.release.wait(5)
+            return {"waited": True}
+        self.addCleanup(job_runner.tasks.pop, "wait")
+
+    def tearDown(self):
+        self.release.set()
+        super().tearDown()
+        os.remove(self.config["SQLALCHEMY_DATABASE_URI"][len("sqlite:///"):])
+
+    def poll(self, url, done):
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            job = self.job(url)
+            if done(job):
+                return job
+            time.sleep(0.02)
+        self.fail(f"job did not reach the expected state: {job}")
+
+    def test_status_progress_and_completion(self):
+        res = self.client.post("/jobs/", json={"type": "wait"}, headers=self.headers)
+        self.assertEqual(res.status_code, 202)
+        self.assertIn(res.json["status"], ("queued", "running"))
+
+        job = self.poll(res.json["status_url"], lambda j: j["progress"] == 0.5)
+        self.assertEqual(job["status"], "running")
+        self.assertEqual(self.client.get(f"/jobs/{job['id']}/result", headers=self.headers).status_code, 409)
+
+        self.release.set()
+        job = self.poll(res.json["status_url"], lambda j: j["status"] == "succeeded")
+        self.assertIsNotNone(job["finished_at"])
+        self.assertEqual(self.job(job["result_url"]), {"waited": True})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import json
+import unittest
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+from flask import jsonify, request
+from flask.json.provider import DefaultJSONProvider
+from app import create_app
+from app.utils.json_provider import OrjsonProvider, orjson, select_json_provider
+
+PAYLOAD = {
+    "id": 7,
+    "price": 19.99,
+    "cost": Decimal("12.50"),
+    "created": datetime(2024, 1, 2, 3, 4, 5),
+    "due": date(2024, 6, 1),
+    "token": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+    "tags": ["b", "a"],
+    "mechanics": {2: "Lee", 1: "Kim"},
+    "notes": None,
+}
+
+
+@unittest.skipIf(orjson is None, "orjson is not installed")
+class TestOrjsonProvider(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app(testing=True, config={"JSON_PROVIDER": "orjson"})
+        self.stdlib = create_app(testing=True, config={"JSON_PROVIDER": "stdlib"})
+
+    def test_selected_in_create_app(self):
+        self.assertIsInstance(self.app.json, OrjsonProvider)
+        self.assertIs(type(self.stdlib.json), DefaultJSONProvider)
+
+    def test_matches_stdlib_output(self):
+        with self.app.app_context():
+            fast = self.app.json.response(PAYLOAD)
+        with self.stdlib.app_context():
+            slow = self.stdlib.json.response(PAYLOAD)
+
+        # Same keys, order and separators, so ASCII payloads are byte-identical
+        self.assertEqual(fast.get_data(), slow.get_data())
+        self.assertEqual(fast.mimetype, "application/json")
+        body = json.loads(fast.get_data())
+        self.assertEqual(body["created"], "Tue, 02 Jan 2024 03:04:05 GMT")
+        self.assertEqual(body["cost"], "12.50")
+
+    def test_huge_int_falls_back_to_stdlib(self):
+        with self.app.app_context():
+            self.assertEqual(self.app.json.dumps({"n": 2 ** 70}), '{"n":1180591620717411303424}')
+            self.assertEqual(self.app.json.loads('{"n": 1180591620717411303424}'), {"n": 2 ** 70})
+
+    def test_dumps_kwargs_use_stdlib(self):
+        with self.app.app_context():
+            self.assertEqual(self.app.json.dumps({"a": 1}, indent=2), '{\n  "a": 1\n}')
+
+    def test_request_json_round_trip(self):
+        @self.app.post("/echo")
+        def echo():
+            return jsonify(request.get_json())
+
+        res = self.app.test_client().post("/echo", json={"name": "Brake pad", "price": 12.5})
+        self.assertEqual(res.get_json(), {"name": "Brake pad", "price": 12.5})
+
+        res = self.app.test_client().post("/echo", data="{bad", content_type="application/json")
+        self.assertEqual(res.status_code, 400)
+
+
+class TestSelectJsonProvider(unittest.TestCase):
+
+    def test_auto_and_stdlib(self):
+        expected = OrjsonProvider if orjson is not None else DefaultJSONProvider
+        self.assertIs(select_json_provider("auto"), expected)
+        self.assertIs(select_json_provider("stdlib"), DefaultJSONProvider)
+
+    def test_unknown_provider(self):
+        with self.assertRaises(ValueError):
+            select_json_provider("simplejson")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,214 @@
+import unittest
+from datetime import date
+from sqlalchemy import event
+from app import create_app, db
+from app.models import Customer, Vehicle, ServiceTicket, Mechanic, MechanicHoursRollup
+from app.mechanics.hours import rebuild_hours_rollup, period_end, computed_hours, rollup_hours
+from app.utils.util import encode_token, encode_mechanic_token
+
+
+class TestMechanicHours(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app(testing=True)
+        self.client = self.app.test_client()
+
+        with self.app.app_context():
+            db.create_all()
+            customer = Customer(name="Owner", email="owner@shop.com", password="x")
+            vehicle = Vehicle(make="Ford", model="F-150", year=2020, vin="VIN1", customer=customer)
+            mechanics = [
+                Mechanic(name=f"Mech {i}", email=f"m{i}@shop.com", password="x")
+                for i in range(2)
+            ]
+            tickets = [
+                ServiceTicket(description=f"T{i}", description_of_issue="Noise", vehicle=vehicle)
+                for i in range(3)
+            ]
+            db.session.add_all([customer, *mechanics, *tickets])
+            db.session.commit()
+
+            self.customer_id = customer.id
+            self.ticket_ids = [t.id for t in tickets]
+            self.mechanic_ids = [m.id for m in mechanics]
+
+        self.headers = {"Authorization": f"Bearer {encode_mechanic_token(self.mechanic_ids[0])}"}
+
+    def tearDown(self):
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def log_hours(self, ticket_index, mechanic_index, hours, worked_on):
+        mechanic_id = self.mechanic_ids[mechanic_index]
+        res = self.client.post(
+            "/service_ticket_mechanics/",
+            json={
+                "service_ticket_id": self.ticket_ids[ticket_index],
+                "mechanic_id": mechanic_id,
+                "hours_worked": hours,
+                "worked_on": worked_on,
+            },
+            headers={"Authorization": f"Bearer {encode_mechanic_token(mechanic_id)}"}
+        )
+        self.assertEqual(res.status_code, 201)
+
+    def seed(self):
+        # 2026-03-04 and 2026-03-06 share a week; 2026-03-30 (a Monday)
+        # and 2026-04-02 share a week but not a month
+        self.log_hours(0, 0, 2.5, "2026-03-04")
+        self.log_hours(1, 0, 1.5, "2026-03-06")
+        self.log_hours(0, 1, 3, "2026-03-30")
+        self.log_hours(2, 1, 4, "2026-04-02")
+
+    def report(self, **params):
+        res = self.client.get("/mechanics/hours", query_string=params, headers=self.headers)
+        self.assertEqual(res.status_code, 200)
+        return [(r["mechanic_id"], r["period_start"], r["hours"], r["links"]) for r in res.get_json()["rows"]]
+
+    def enable_rollup(self):
+        self.app.config["MECHANIC_HOURS_ROLLUP_ENABLED"] = True
+        with self.app.app_context():
+            rebuild_hours_rollup()
+
+    # -----------------------------
+    # Tests
+    # -----------------------------
+    def test_report_from_links(self):
+        self.seed()
+        m0, m1 = self.mechanic_ids
+        self.assertEqual(self.report(period="month"), [
+            (m0, "2026-03-01", 4.0, 2),
+            (m1, "2026-03-01", 3.0, 1),
+            (m1, "2026-04-01", 4.0, 1),
+        ])
+        self.assertEqual(self.report(period="week", start="2026-03-05", end="2026-03-31"), [
+            (m0, "2026-03-02", 4.0, 2),
+            (m1, "2026-03-30", 7.0, 2),
+        ])
+        self.assertEqual(self.report(period="day", mechanic_id=m1, end="2026-03-31"), [
+            (m1, "2026-03-30", 3.0, 1),
+        ])
+
+    def test_rollup_matches_links(self):
+        self.seed()
+        queries = [
+            {"period": period, **bounds}
+            for period in ("day", "week", "month")
+            for bounds in ({}, {"start": "2026-03-05", "end": "2026-03-31"}, {"mechanic_id": self.mechanic_ids[1]})
+        ]
+        expected = [self.report(**q) for q in queries]
+        self.enable_rollup()
+        self.assertEqual([self.report(**q) for q in queries], expected)
+
+    def test_rollup_tracks_links_incrementally(self):
+        self.enable_rollup()
+        self.seed()
+        m0, m1 = self.mechanic_ids
+        with self.app.app_context():
+            self.assertEqual(db.session.query(MechanicHoursRollup).count(), 3 * 4 - 3)
+
+        # Removing m1 from ticket 0 undoes its 3 hours on 2026-03-30
+        res = self.client.put(
+            f"/service_tickets/{self.ticket_ids[0]}/remove-mechanic/{m1}",
+            headers={"Authorization": f"Bearer {encode_token(self.customer_id)}"}
+        )
+        self.assertEqual(res.status_code, 200)
+        # ...and m0 from ticket 1 (via edit) its 1.5 hours on 2026-03-06
+        res = self.client.put(
+            f"/service_tickets/{self.ticket_ids[1]}/edit",
+            json={"remove_mechanics": [m0]},
+            headers={"Authorization": f"Bearer {encode_token(self.customer_id)}"}
+        )
+        self.assertEqual(res.status_code, 200)
+
+        self.assertEqual(self.report(period="month"), [
+            (m0, "2026-03-01", 2.5, 1),
+            (m1, "2026-04-01", 4.0, 1),
+        ])
+        self.assertEqual(self.report(period="week"), [
+            (m0, "2026-03-02", 2.5, 1),
+            (m1, "2026-03-30", 4.0, 1),
+        ])
+
+        expected = self.report(period="day")
+        with self.app.app_context():
+            rebuild_hours_rollup()
+        self.assertEqual(self.report(period="day"), expected)
+
+    def test_rollup_tracks_vehicle_delete_cascade(self):
+        with self.app.app_context():
+            other = Vehicle(make="Honda", model="Civic", year=2018, vin="VIN2", customer_id=self.customer_id)
+            ticket = ServiceTicket(description="T3", description_of_issue="Brakes", vehicle=other)
+            db.session.add(ticket)
+            db.session.commit()
+            self.ticket_ids.append(ticket.id)
+            vehicle_id = db.session.get(ServiceTicket, self.ticket_ids[0]).vehicle_id
+
+        self.enable_rollup()
+        self.seed()
+        self.log_hours(3, 1, 2, "2026-03-30")
+
+        # Deleting the vehicle drops its tickets' links by ORM cascade
+        res = self.client.delete(
+            f"/vehicles/{vehicle_id}",
+            headers={"Authorization": f"Bearer {encode_token(self.customer_id)}"}
+        )
+        self.assertEqual(res.status_code, 200)
+
+        m1 = self.mechanic_ids[1]
+        with self.app.app_context():
+            for period in ("day", "week", "month"):
+                self.assertEqual(rollup_hours(period), computed_hours(period))
+            self.assertEqual(
+                [(r["mechanic_id"], r["hours"], r["links"]) for r in rollup_hours("month")],
+                [(m1, 2.0, 1)]
+            )
+
+    def test_rollup_seeds_missing_row(self):
+        self.seed()
+        self.app.config["MECHANIC_HOURS_ROLLUP_ENABLED"] = True
+        # Rollup never built: the first write to a period seeds it from links
+        self.log_hours(2, 0, 1, "2026-03-31")
+        m0 = self.mechanic_ids[0]
+        self.assertEqual(self.report(period="month", mechanic_id=m0), [(m0, "2026-03-01", 5.0, 3)])
+
+    def test_monthly_report_reads_rollup_rows_only(self):
+        self.seed()
+        self.enable_rollup()
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        with self.app.app_context():
+            engine = db.engine
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            self.report(period="month", start="2026-01-01", end="2026-12-31")
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        self.assertTrue(any("mechanic_hours_rollup" in s for s in statements))
+        self.assertFalse(any("service_ticket_mechanics" in s for s in statements))
+
+    def test_invalid_params(self):
+        for params in [{"period": "year"}, {"start": "March"}, {"end": "2026-13-01"}]:
+            res = self.client.get("/mechanics/hours", query_string=params, headers=self.headers)
+            self.assertEqual(res.status_code, 400)
+
+        res = self.client.post(
+            "/service_ticket_mechanics/",
+            json={"service_ticket_id": self.ticket_ids[0], "mechanic_id": self.mechanic_ids[0], "hours_worked": "2"},
+            headers=self.headers
+        )
+        self.assertEqual(res.status_code, 400)
+
+    def test_period_end(self):
+        self.assertEqual(period_end("month", date(2026, 12, 1)), date(2027, 1, 1))
+        self.assertEqual(period_end("week", date(2026, 3, 30)), date(2026, 4, 6))
+        self.assertEqual(period_end("day", date(2026, 2, 28)), date(2026, 3, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import unittest
+from werkzeug.security import generate_password_hash
+from app import create_app, db
+from app.extensions import password_hasher
+from app.models import Customer, Mechanic
+
+
+class TestPasswordHasher(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app(testing=True)
+        self.client = self.app.test_client()
+
+        with self.app.app_context():
+            db.create_all()
+
+    def tearDown(self):
+        password_hasher.shutdown()
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def test_hash_uses_configured_cost(self):
+        stored = password_hasher.hash("secret")
+        self.assertTrue(stored.startswith("pbkdf2:sha256:1000$"))
+        self.assertTrue(password_hasher.verify(stored, "secret"))
+        self.assertFalse(password_hasher.verify(stored, "wrong"))
+        self.assertFalse(password_hasher.needs_rehash(stored))
+
+    def test_method_without_cost_uses_werkzeug_defaults(self):
+        for method in ("pbkdf2:sha256", "pbkdf2", "scrypt"):
+            self.app.config["PASSWORD_HASH_METHOD"] = method
+            password_hasher.init_app(self.app)
+            stored = generate_password_hash("secret", method)
+            self.assertFalse(password_hasher.needs_rehash(stored), method)
+            self.assertTrue(password_hasher.needs_rehash(
+                generate_password_hash("secret", "pbkdf2:sha256:1000")
+            ), method)
+
+    def test_process_pool(self):
+        self.app.config["PASSWORD_HASH_WORKERS"] = 1
+        password_hasher.init_app(self.app)
+        stored = password_hasher.hash("secret")
+        self.assertTrue(password_hasher.verify(stored, "secret"))
+
+    def test_customer_login_upgrades_outdated_hash(self):
+        with self.app.app_context():
+            db.session.add(Customer(
+                name="Owner",
+                email="owner@shop.com",
+                password=generate_password_hash("secret", method="pbkdf2:sha256:500")
+            ))
+            db.session.commit()
+
+        res = self.client.post("/customers/login", json={"email": "owner@shop.com", "password": "secret"})
+        self.assertEqual(res.status_code, 200)
+
+        with self.app.app_context():
+            stored = Customer.query.first().password
+        self.assertTrue(stored.startswith("pbkdf2:sha256:1000$"))
+
+        res = self.client.post("/customers/login", json={"email": "owner@shop.com", "password": "secret"})
+        self.assertEqual(res.status_code, 200)
+
+    def test_mechanic_login_upgrades_outdated_hash(self):
+        with self.app.app_context():
+            db.session.add(Mechanic(
+                name="Mech",
+                email="mech@shop.com",
+                password=generate_password_hash("secret", method="pbkdf2:sha256:500")
+            ))
+            db.session.commit()
+
+        res = self.client.post("/mechanics/login", json={"email": "mech@shop.com", "password": "secret"})
+        self.assertEqual(res.status_code, 200)
+
+        with self.app.app_context():
+            stored = Mechanic.query.first().password
+        self.assertFalse(password_hasher.needs_rehash(stored))
+
+    def test_full_queue_returns_503(self):
+        self.app.config["PASSWORD_HASH_QUEUE_SIZE"] = 1
+        self.app.config["PASSWORD_HASH_TIMEOUT"] = 0.01
+        password_hasher.init_app(self.app)
+
+        # Hold the only slot so the request cannot get one
+        password_hasher._slots.acquire()
+        try:
+            res = self.client.post("/mechanics/", json={
+                "name": "Mech", "email": "mech@shop.com", "password": "secret"
+            })
+        finally:
+            password_hasher._slots.release()
+
+        self.assertEqual(res.status_code, 503)
+        self.assertEqual(res.headers["Retry-After"], "1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import os
+import tempfile
+import unittest
+from sqlalchemy import exc
+from app import create_app, db
+from app.utils.pool import InstrumentedQueuePool, engine_options_from_env
+from app.utils.util import encode_mechanic_token
+
+
+class TestConnectionPool(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.app = create_app(testing=True, config={
+            "SQLALCHEMY_DATABASE_URI": f"sqlite:///{os.path.join(self.tmpdir.name, 'pool.db')}",
+            "SQLALCHEMY_ENGINE_OPTIONS": {
+                "poolclass": InstrumentedQueuePool,
+                "pool_size": 1,
+                "max_overflow": 1,
+                "pool_timeout": 1,
+                "pool_pre_ping": True,
+            },
+        })
+        self.client = self.app.test_client()
+
+        with self.app.app_context():
+            db.create_all()
+            self.engine = db.engine
+            self.metrics = self.app.extensions["pool_metrics"][None]
+            self.metrics.reset()
+
+    def tearDown(self):
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+            db.engine.dispose()
+        self.tmpdir.cleanup()
+
+    def test_engine_options_from_env(self):
+        options = engine_options_from_env({"DB_POOL_SIZE": "3", "DB_POOL_PRE_PING": "false"})
+        self.assertEqual(options["pool_size"], 3)
+        self.assertEqual(options["max_overflow"], 20)
+        self.assertFalse(options["pool_pre_ping"])
+        self.assertIs(options["poolclass"], InstrumentedQueuePool)
+
+    def test_pool_exhaustion_times_out_and_is_reported(self):
+        first = self.engine.connect()
+        second = self.engine.connect()  # overflow connection
+        try:
+            with self.assertRaises(exc.TimeoutError):
+                self.engine.connect()
+
+            stats = self.metrics.snapshot(self.engine)
+            self.assertEqual(stats["checked_out"], 2)
+            self.assertEqual(stats["overflow"], 1)
+            self.assertEqual(stats["peak_overflow"], 1)
+            self.assertEqual(stats["timeouts"], 1)
+            self.assertGreaterEqual(stats["wait_max_ms"], 900)
+        finally:
+            first.close()
+            second.close()
+
+        stats = self.metrics.snapshot(self.engine)
+        self.assertEqual(stats["checked_out"], 0)
+        self.assertEqual(stats["checkouts"], 2)
+
+        # Released connections can be checked out again
+        with self.engine.connect():
+            pass
+
+    def test_pool_status_endpoint(self):
+        res = self.client.get(
+            "/diagnostics/pool",
+            headers={"Authorization": f"Bearer {encode_mechanic_token(1)}"}
+        )
+        self.assertEqual(res.status_code, 200)
+
+        stats = res.get_json()["default"]
+        self.assertEqual(stats["pool_class"], "InstrumentedQueuePool")
+        self.assertEqual(stats["size"], 1)
+
+        self.assertEqual(self.client.get("/diagnostics/pool").status_code, 401)
+
+
+if __name__ == "__main__":
+    unittest.main()
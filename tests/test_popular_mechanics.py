@@ -0,0 +1,159 @@
+import unittest
+from sqlalchemy.exc import IntegrityError
+from app import create_app, db
+from app.models import Customer, Vehicle, ServiceTicket, Mechanic, MechanicLeaderboard
+from app.mechanics import leaderboard
+from app.mechanics.leaderboard import rebuild_leaderboard, ranked_mechanics
+from app.utils.util import encode_token, encode_mechanic_token
+
+
+class TestPopularMechanics(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app(testing=True)
+        self.client = self.app.test_client()
+
+        with self.app.app_context():
+            db.create_all()
+            customer = Customer(name="Owner", email="owner@shop.com", password="x")
+            vehicle = Vehicle(make="Ford", model="F-150", year=2020, vin="VIN1", customer=customer)
+            self.mechanics = [
+                Mechanic(name=f"Mech {i}", email=f"m{i}@shop.com", password="x")
+                for i in range(3)
+            ]
+            db.session.add_all(self.mechanics)
+            db.session.flush()
+            tickets = [
+                ServiceTicket(description=f"T{i}", description_of_issue="Noise", vehicle=vehicle)
+                for i in range(3)
+            ]
+            # Mech 2 -> 3 tickets, Mech 0 -> 1 ticket, Mech 1 -> none
+            tickets[0].mechanics = [self.mechanics[0], self.mechanics[2]]
+            tickets[1].mechanics = [self.mechanics[2]]
+            tickets[2].mechanics = [self.mechanics[2]]
+            db.session.add(customer)
+            db.session.commit()
+
+            self.customer_id = customer.id
+            self.ticket_ids = [t.id for t in tickets]
+            self.mechanic_ids = [m.id for m in self.mechanics]
+
+    def tearDown(self):
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def popular(self, **params):
+        res = self.client.get("/mechanics/popular", query_string=params)
+        self.assertEqual(res.status_code, 200)
+        return [(m["id"], m["tickets_worked"]) for m in res.get_json()]
+
+    def enable_leaderboard(self):
+        self.app.config["MECHANIC_LEADERBOARD_ENABLED"] = True
+        with self.app.app_context():
+            rebuild_leaderboard()
+
+    # -----------------------------
+    # Tests
+    # -----------------------------
+    def test_ranking_from_sql(self):
+        m0, m1, m2 = self.mechanic_ids
+        self.assertEqual(self.popular(), [(m2, 3), (m0, 1), (m1, 0)])
+        self.assertEqual(self.popular(limit=1, offset=1), [(m0, 1)])
+
+    def test_leaderboard_matches_sql_ranking(self):
+        expected = self.popular()
+        self.enable_leaderboard()
+        self.assertEqual(self.popular(), expected)
+
+    def test_leaderboard_tracks_assign_and_remove(self):
+        self.enable_leaderboard()
+        m0, m1, m2 = self.mechanic_ids
+        headers = {"Authorization": f"Bearer {encode_token(self.customer_id)}"}
+
+        for ticket_id in self.ticket_ids[:2]:
+            res = self.client.put(
+                f"/service_tickets/{ticket_id}/assign-mechanic/{m1}", headers=headers
+            )
+            self.assertEqual(res.status_code, 200)
+
+        res = self.client.put(
+            f"/service_tickets/{self.ticket_ids[0]}/remove-mechanic/{m2}", headers=headers
+        )
+        self.assertEqual(res.status_code, 200)
+
+        self.assertEqual(self.popular(), [(m1, 2), (m2, 2), (m0, 1)])
+
+    def test_leaderboard_tracks_edit_ticket_and_create_link(self):
+        self.enable_leaderboard()
+        m0, m1, m2 = self.mechanic_ids
+
+        res = self.client.put(
+            f"/service_tickets/{self.ticket_ids[1]}/edit",
+            json={"add_mechanics": [m0, m1], "remove_mechanics": [m2]},
+            headers={"Authorization": f"Bearer {encode_token(self.customer_id)}"}
+        )
+        self.assertEqual(res.status_code, 200)
+
+        res = self.client.post(
+            "/service_ticket_mechanics/",
+            json={"service_ticket_id": self.ticket_ids[2], "mechanic_id": m0},
+            headers={"Authorization": f"Bearer {encode_mechanic_token(m0)}"}
+        )
+        self.assertEqual(res.status_code, 201)
+
+        self.assertEqual(self.popular(), [(m0, 3), (m2, 2), (m1, 1)])
+
+    def test_leaderboard_seeds_missing_row(self):
+        self.enable_leaderboard()
+        m0 = self.mechanic_ids[0]
+        with self.app.app_context():
+            db.session.execute(db.delete(MechanicLeaderboard).filter_by(mechanic_id=m0))
+            db.session.commit()
+
+        self.client.put(
+            f"/service_tickets/{self.ticket_ids[1]}/assign-mechanic/{m0}",
+            headers={"Authorization": f"Bearer {encode_token(self.customer_id)}"}
+        )
+        self.assertIn((m0, 2), self.popular())
+
+
+    def test_leaderboard_tracks_vehicle_delete_cascade(self):
+        self.enable_leaderboard()
+        with self.app.app_context():
+            other = Vehicle(make="Honda", model="Civic", year=2018, vin="VIN2", customer_id=self.customer_id)
+            ticket = ServiceTicket(description="T3", description_of_issue="Brakes", vehicle=other)
+            ticket.mechanics = [db.session.get(Mechanic, self.mechanic_ids[1])]
+            db.session.add(ticket)
+            db.session.commit()
+            vehicle_id = db.session.get(ServiceTicket, self.ticket_ids[0]).vehicle_id
+
+        res = self.client.delete(
+            f"/vehicles/{vehicle_id}",
+            headers={"Authorization": f"Bearer {encode_token(self.customer_id)}"}
+        )
+        self.assertEqual(res.status_code, 200)
+
+        m0, m1, m2 = self.mechanic_ids
+        self.assertEqual(self.popular(), [(m1, 1), (m0, 0), (m2, 0)])
+        with self.app.app_context():
+            expected = [(m_id, n) for m_id, _, _, _, n in ranked_mechanics(10, 0)]
+        self.assertEqual(self.popular(), expected)
+
+    def test_leaderboard_seed_conflict_keeps_transaction(self):
+        self.enable_leaderboard()
+        m0, m1, _ = self.mechanic_ids
+        with self.app.app_context():
+            # A row seeded by a concurrent request only rolls back the
+            # savepoint, not this transaction's other writes
+            db.session.execute(
+                db.update(MechanicLeaderboard).filter_by(mechanic_id=m1).values(tickets_worked=5)
+            )
+            with self.assertRaises(IntegrityError):
+                leaderboard._seed(m0)
+            db.session.commit()
+            self.assertEqual(db.session.get(MechanicLeaderboard, m0).tickets_worked, 1)
+            self.assertEqual(db.session.get(MechanicLeaderboard, m1).tickets_worked, 5)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+from app import create_app, db
+from app.models import Customer
+from app.utils.profiler import statement_shape
+
+
+class TestSQLProfiler(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app(testing=True, config={
+            "SQL_PROFILER_ENABLED": True,
+            "SQL_PROFILER_N_PLUS_ONE_THRESHOLD": 10,
+        })
+        self.client = self.app.test_client()
+
+        with self.app.app_context():
+            db.create_all()
+
+    def tearDown(self):
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def seed_customers(self, n):
+        with self.app.app_context():
+            db.session.add_all([
+                Customer(name=f"C{i}", email=f"c{i}@shop.com", password="x")
+                for i in range(n)
+            ])
+            db.session.commit()
+
+    def test_headers_report_query_count_and_time(self):
+        res = self.client.get("/mechanics/popular")
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.headers["X-DB-Query-Count"], "1")
+        self.assertIn("X-DB-Time-Ms", res.headers)
+        self.assertNotIn("X-DB-N-Plus-One", res.headers)
+
+    def test_flags_n_plus_one(self):
+        # Each customer lazily loads its vehicles when dumped
+        self.seed_customers(12)
+        with self.assertLogs("app.sql_profiler", level="WARNING") as logs:
+            res = self.client.get("/customers/")
+
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.headers["X-DB-N-Plus-One"], "12")
+        self.assertIn("Possible N+1 in GET /customers/", logs.output[0])
+
+    def test_disabled_by_default(self):
+        app = create_app(testing=True)
+        with app.app_context():
+            db.create_all()
+        res = app.test_client().get("/mechanics/popular")
+        self.assertNotIn("X-DB-Query-Count", res.headers)
+
+    def test_statement_shape_folds_in_lists(self):
+        self.assertEqual(
+            statement_shape("SELECT id FROM mechanic\n WHERE id IN (?, ?, ?)"),
+            statement_shape("SELECT id FROM mechanic WHERE id IN (?)")
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
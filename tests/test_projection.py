@@ -0,0 +1,64 @@
+import unittest
+from app import create_app, db
+from app.customers.schemas import CustomerSchema
+from app.inventory.schemas import InventorySchema
+from app.mechanics.schemas import MechanicSchema
+from app.models import Inventory, Mechanic, ServiceTicketMechanic, Vehicle
+from app.service_ticket_mechanics.schemas import STMechSchema
+from app.utils.projection import Projection
+from app.vehicles.schemas import VehicleSchema
+from benchmarks.seed import seed
+
+
+class TestProjection(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app(testing=True)
+
+        with self.app.app_context():
+            db.create_all()
+            seed({"customers": 5, "mechanics": 4, "parts": 10})
+            # Nulls and integral floats must dump the same way too
+            db.session.add(Mechanic(name="No salary", email="none@shop.com", password="x"))
+            db.session.add(ServiceTicketMechanic(ticket_id=1, mechanic_id=1, hours_worked=2))
+            db.session.commit()
+
+    def tearDown(self):
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def assert_same_output(self, schema_class, model):
+        with self.app.app_context():
+            expected = schema_class(many=True).dump(model.query.all())
+            actual = Projection(schema_class).all()
+            self.assertEqual(
+                self.app.json.response(actual).get_data(),
+                self.app.json.response(expected).get_data()
+            )
+
+    def test_inventory_matches_schema_dump(self):
+        self.assert_same_output(InventorySchema, Inventory)
+
+    def test_mechanics_match_schema_dump(self):
+        self.assert_same_output(MechanicSchema, Mechanic)
+
+    def test_vehicles_match_schema_dump(self):
+        self.assert_same_output(VehicleSchema, Vehicle)
+
+    def test_links_match_schema_dump(self):
+        self.assert_same_output(STMechSchema, ServiceTicketMechanic)
+
+    def test_filtered_rows(self):
+        with self.app.app_context():
+            rows = Projection(VehicleSchema).all(Vehicle.customer_id == 1)
+        self.assertEqual({r["customer_id"] for r in rows}, {1})
+        self.assertEqual(len(rows), 2)
+
+    def test_relationship_fields_are_rejected(self):
+        with self.assertRaises(TypeError):
+            Projection(CustomerSchema)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+from sqlalchemy import func
+from app import create_app, db
+from app.models import Customer, Inventory, Mechanic, ServiceTicket, ServiceTicketMechanic, Vehicle
+from app.service_tickets.costs import ticket_costs_statement
+from app.service_tickets.loaders import customer_tickets_query
+
+
+class TestQueryPlans(unittest.TestCase):
+    """
+    EXPLAIN QUERY PLAN for each hot lookup must search an index on the
+    filtered table instead of scanning it.
+    """
+
+    def setUp(self):
+        self.app = create_app(testing=True)
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def plan(self, statement):
+        compiled = statement.compile(db.engine, compile_kwargs={"literal_binds": True})
+        rows = db.session.execute(db.text(f"EXPLAIN QUERY PLAN {compiled}")).all()
+        return [row[-1] for row in rows]
+
+    def assert_uses_index(self, statement, table, index):
+        plan = self.plan(statement)
+        details = [d for d in plan if f" {table} " in f" {d} "]
+        self.assertTrue(details, f"{table} not in plan: {plan}")
+        for detail in details:
+            self.assertFalse(detail.startswith(f"SCAN {table}") and "INDEX" not in detail, plan)
+        self.assertTrue(any(index in d for d in details), f"{index} not used: {plan}")
+
+    def test_login_by_customer_email(self):
+        statement = db.select(Customer).filter_by(email="owner@shop.com")
+        self.assert_uses_index(statement, "customer", "ix_customer_email")
+
+    def test_vehicles_by_customer(self):
+        statement = db.select(Vehicle).filter_by(customer_id=1)
+        self.assert_uses_index(statement, "vehicle", "ix_vehicle_customer_id")
+
+    def test_customer_tickets_join(self):
+        statement = customer_tickets_query(1, with_links=False).statement
+        self.assert_uses_index(statement, "vehicle", "ix_vehicle_customer_id")
+        self.assert_uses_index(statement, "service_tickets", "ix_service_tickets_vehicle_id_status")
+
+    def test_tickets_by_vehicle_and_status(self):
+        statement = db.select(ServiceTicket).filter_by(vehicle_id=1, status="Pending")
+        self.assert_uses_index(statement, "service_tickets", "ix_service_tickets_vehicle_id_status")
+
+    def test_links_by_ticket(self):
+        statement = db.select(ServiceTicketMechanic.mechanic_id).where(ServiceTicketMechanic.ticket_id.in_([1, 2, 3]))
+        self.assert_uses_index(statement, "service_ticket_mechanics", "ix_service_ticket_mechanics_ticket_id_mechanic_id")
+
+    def test_links_by_mechanic(self):
+        statement = (
+            db.select(func.count(ServiceTicketMechanic.id))
+            .where(ServiceTicketMechanic.mechanic_id == 1)
+        )
+        self.assert_uses_index(statement, "service_ticket_mechanics", "ix_service_ticket_mechanics_mechanic_id")
+
+    def test_inventory_by_name(self):
+        statement = db.select(Inventory.name).where(Inventory.name.in_(["Brake Pad", "Oil Filter"]))
+        self.assert_uses_index(statement, "inventory", "ix_inventory_name")
+
+    def test_ticket_costs_aggregate(self):
+        statement = ticket_costs_statement([1, 2, 3], 2080)
+        self.assert_uses_index(statement, "service_ticket_mechanics", "ix_service_ticket_mechanics_ticket_id_mechanic_id")
+        self.assert_uses_index(statement, "service_ticket_inventory", "sqlite_autoindex_service_ticket_inventory_1")
+
+    def test_popular_mechanics_join(self):
+        # Same join as /mechanics/popular. Every mechanic is ranked, so
+        # mechanic is scanned; the join into the link table must still be
+        # an index search
+        plan = self.plan(
+            db.select(Mechanic.id, func.count(ServiceTicketMechanic.id))
+            .outerjoin(ServiceTicketMechanic, ServiceTicketMechanic.mechanic_id == Mechanic.id)
+            .group_by(Mechanic.id)
+        )
+        links = [d for d in plan if "service_ticket_mechanics" in d]
+        self.assertTrue(links and all(d.startswith("SEARCH") for d in links), plan)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+import unittest
+from multiprocessing import get_context
+from limits import parse
+from limits.storage import storage_from_string
+from limits.strategies import FixedWindowRateLimiter, MovingWindowRateLimiter
+from app import create_app, db
+from app.extensions import limiter
+from app.utils.ratelimit import SQLiteStorage
+
+
+def _hit_shared_limit(uri):
+    limiter = MovingWindowRateLimiter(storage_from_string(uri))
+    return sum(limiter.hit(parse("10 per minute"), "client") for _ in range(10))
+
+
+class TestSQLiteStorage(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.uri = f"sqlite:///{self.tmp}/limits.db"
+        self.storage = storage_from_string(self.uri)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_scheme_is_registered(self):
+        self.assertIsInstance(self.storage, SQLiteStorage)
+        self.assertEqual(self.storage.path, f"{self.tmp}/limits.db")
+        self.assertTrue(self.storage.check())
+
+    def test_moving_window(self):
+        limiter = MovingWindowRateLimiter(self.storage)
+        item = parse("3 per second")
+        self.assertEqual([limiter.hit(item, "a") for _ in range(4)], [True, True, True, False])
+        self.assertTrue(limiter.hit(item, "b"))
+
+        stats = limiter.get_window_stats(item, "a")
+        self.assertEqual(stats.remaining, 0)
+        time.sleep(1.05)
+        self.assertTrue(limiter.hit(item, "a"))
+        self.assertEqual(limiter.get_window_stats(item, "a").remaining, 2)
+
+    def test_fixed_window(self):
+        limiter = FixedWindowRateLimiter(self.storage)
+        item = parse("2 per second")
+        self.assertEqual([limiter.hit(item, "a") for _ in range(3)], [True, True, False])
+        self.assertEqual(self.storage.get(item.key_for("a")), 3)
+        time.sleep(1.05)
+        self.assertEqual(self.storage.get(item.key_for("a")), 0)
+        self.assertTrue(limiter.hit(item, "a"))
+
+    def test_clear_and_reset(self):
+        limiter = MovingWindowRateLimiter(self.storage)
+        item = parse("1 per minute")
+        limiter.hit(item, "a")
+        limiter.clear(item, "a")
+        self.assertTrue(limiter.hit(item, "a"))
+        self.storage.incr("counter", 60)
+        self.assertEqual(self.storage.reset(), 2)
+
+    def test_sweep_deletes_expired_rows(self):
+        self.storage.incr("stale", 0.05)
+        self.storage.incr("live", 60)
+        self.storage.acquire_entry("stale", 5, 0.05)
+        self.storage.acquire_entry("short", 5, 0.2)
+        time.sleep(0.3)
+        self.storage.acquire_entry("live", 5, 0.2)
+
+        self.assertEqual(self.storage.sweep(), 3)
+        conn = self.storage.connection
+        self.assertEqual([r[0] for r in conn.execute("SELECT key FROM counters")], ["live"])
+        self.assertEqual([r[0] for r in conn.execute("SELECT key FROM events")], ["live"])
+
+    def test_sweep_keeps_other_stores_longer_windows(self):
+        # A worker on a long window, then a fresh worker on a short one
+        self.storage.acquire_entry("per-day", 200, 60)
+        self.storage.acquire_entry("per-day", 200, 60)
+        fresh = storage_from_string(self.uri)
+        fresh.acquire_entry("per-second", 5, 0.05)
+        time.sleep(0.1)
+
+        self.assertEqual(fresh.sweep(), 1)
+        self.assertEqual(self.storage.get_moving_window("per-day", 200, 60)[1], 2)
+
+    def test_events_table_without_expiry_is_upgraded(self):
+        path = f"{self.tmp}/old.db"
+        conn = sqlite3.connect(path)
+        conn.execute("CREATE TABLE events (key TEXT NOT NULL, ts REAL NOT NULL)")
+        conn.execute("INSERT INTO events VALUES ('a', ?)", (time.time(),))
+        conn.commit()
+        conn.close()
+
+        storage = storage_from_string(f"sqlite:///{path}")
+        self.assertEqual(storage.sweep(), 0)
+        self.assertEqual(storage.get_moving_window("a", 5, 60)[1], 1)
+        self.assertTrue(storage.acquire_entry("a", 5, 60))
+
+    def test_hits_sweep_periodically(self):
+        storage = storage_from_string(self.uri, sweep_interval=0.1)
+        storage.incr("stale", 0.05)
+        time.sleep(0.15)
+        storage.incr("other", 60)
+        keys = [r[0] for r in storage.connection.execute("SELECT key FROM counters")]
+        self.assertEqual(keys, ["other"])
+
+    def test_counts_survive_a_new_storage_instance(self):
+        limiter = MovingWindowRateLimiter(self.storage)
+        item = parse("2 per minute")
+        limiter.hit(item, "a")
+        limiter.hit(item, "a")
+        restarted = MovingWindowRateLimiter(storage_from_string(self.uri))
+        self.assertFalse(restarted.hit(item, "a"))
+
+    def test_processes_share_one_budget(self):
+        with get_context("fork").Pool(3) as pool:
+            allowed = pool.map(_hit_shared_limit, [self.uri] * 3)
+        self.assertEqual(sum(allowed), 10)
+
+
+class TestLimiterConfig(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.app = create_app(testing=True, config={
+            "RATELIMIT_ENABLED": True,
+            "RATELIMIT_STORAGE_URI": f"sqlite:///{self.tmp}/limits.db",
+        })
+        self.client = self.app.test_client()
+        with self.app.app_context():
+            db.create_all()
+
+    def tearDown(self):
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_app_uses_configured_storage_and_strategy(self):
+        self.assertIsInstance(limiter.storage, SQLiteStorage)
+        self.assertEqual(self.app.config["RATELIMIT_STRATEGY"], "moving-window")
+
+        body = {"email": "nobody@shop.com", "password": "x"}
+        codes = [self.client.post("/customers/login", json=body).status_code for _ in range(6)]
+        self.assertEqual(codes[-1], 429)
+        self.assertNotIn(429, codes[:5])
+        self.assertTrue(os.path.exists(f"{self.tmp}/limits.db"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,186 @@
+import os
+import sqlite3
+import tempfile
+import time
+import unittest
+from flask import g
+from itsdangerous import URLSafeTimedSerializer
+from sqlalchemy import event
+from app import create_app, db
+from app.models import Customer, Inventory, ServiceTicket, Vehicle
+from app.utils.replicas import PIN_COOKIE
+from app.utils.util import encode_token, encode_mechanic_token
+
+
+class TestReadReplicas(unittest.TestCase):
+    """
+    Two SQLite files stand in for the MySQL primary and its replica;
+    replicate() copies the primary over the replica.
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.primary_path = os.path.join(self.tmp.name, "primary.db")
+        self.replica_path = os.path.join(self.tmp.name, "replica.db")
+        self.app = create_app(testing=True, config={
+            "SQLALCHEMY_DATABASE_URI": f"sqlite:///{self.primary_path}",
+            "SQLALCHEMY_BINDS": {"replica": f"sqlite:///{self.replica_path}"},
+            "DB_REPLICA_STICKY_SECONDS": 5,
+        })
+        self.client = self.app.test_client()
+
+        with self.app.app_context():
+            db.create_all()
+            customer = Customer(name="Owner", email="owner@shop.com", password="x")
+            vehicle = Vehicle(make="Ford", model="F-150", year=2020, vin="VIN1", customer=customer)
+            db.session.add_all([customer, vehicle, Inventory(name="Filter", price=5.0)])
+            db.session.commit()
+            self.customer_id = customer.id
+            self.vehicle_id = vehicle.id
+        self.replicate()
+
+        self.executed = []
+        with self.app.app_context():
+            for name, engine in (("primary", db.engines[None]), ("replica", db.engines["replica"])):
+                event.listen(engine, "before_cursor_execute", self._recorder(name))
+
+    def tearDown(self):
+        with self.app.app_context():
+            db.session.remove()
+            for engine in db.engines.values():
+                engine.dispose()
+        self.tmp.cleanup()
+
+    def _recorder(self, name):
+        def before_cursor_execute(conn, cursor, statement, *args):
+            self.executed.append(name)
+        return before_cursor_execute
+
+    def replicate(self):
+        with self.app.app_context():
+            for engine in db.engines.values():
+                engine.dispose()
+        src, dst = sqlite3.connect(self.primary_path), sqlite3.connect(self.replica_path)
+        src.backup(dst)
+        src.close()
+        dst.close()
+
+    def add_to_replica_only(self, name):
+        conn = sqlite3.connect(self.replica_path)
+        conn.execute("INSERT INTO inventory (name, price) VALUES (?, 1.0)", (name,))
+        conn.commit()
+        conn.close()
+
+    def auth(self, customer_id=None):
+        return {"Authorization": f"Bearer {encode_token(customer_id or self.customer_id)}"}
+
+    # -----------------------------
+    # Tests
+    # -----------------------------
+    def test_safe_get_reads_from_replica(self):
+        # setUp's writes would otherwise count as recent
+        self.app.config["DB_REPLICA_STICKY_SECONDS"] = 0
+        self.add_to_replica_only("Replica only")
+
+        names = [p["name"] for p in self.client.get("/inventory/").get_json()]
+        self.assertEqual(names, ["Filter", "Replica only"])
+        # Cache versions are read from the primary, the data from the replica
+        self.assertEqual(self.executed[0], "primary")
+        self.assertEqual(set(self.executed[1:]), {"replica"})
+
+        self.executed.clear()
+        self.client.get("/service_tickets/", headers=self.auth())
+        self.assertEqual(set(self.executed), {"replica"})
+
+    def test_other_endpoints_use_primary(self):
+        self.client.get("/inventory/search?q=Fil")
+        self.assertEqual(set(self.executed), {"primary"})
+
+    def test_request_reads_its_own_writes(self):
+        with self.app.test_request_context():
+            g.db_replica_reads = True
+            self.assertEqual(db.session.query(Inventory).count(), 1)
+            self.assertEqual(self.executed, ["replica"])
+
+            db.session.add(Inventory(name="Belt", price=9.0))
+            db.session.flush()
+            self.assertEqual(db.session.query(Inventory).count(), 2)
+            self.assertEqual(self.executed[-1], "primary")
+            db.session.rollback()
+
+    def test_client_sticks_to_primary_after_write(self):
+        res = self.client.post(
+            "/service_tickets/",
+            json={"description": "Brakes", "description_of_issue": "Noise", "vehicle_id": self.vehicle_id},
+            headers=self.auth()
+        )
+        self.assertEqual(res.status_code, 201)
+
+        # The replica has not caught up, but the writer reads the primary
+        self.executed.clear()
+        tickets = self.client.get("/service_tickets/", headers=self.auth()).get_json()
+        self.assertEqual([t["description"] for t in tickets], ["Brakes"])
+        self.assertEqual(set(self.executed), {"primary"})
+
+        # Another client is not pinned
+        self.executed.clear()
+        self.app.test_client().get("/service_tickets/", headers=self.auth())
+        self.assertEqual(set(self.executed), {"replica"})
+
+    def test_pin_cookie_is_honoured_by_other_workers(self):
+        self.client.post(
+            "/service_tickets/",
+            json={"description": "Brakes", "description_of_issue": "Noise", "vehicle_id": self.vehicle_id},
+            headers=self.auth()
+        )
+        pin = self.client.get_cookie(PIN_COOKIE)
+        self.assertLessEqual(int(pin.max_age), 5)
+
+        # A second app on the same databases stands in for another worker
+        worker = create_app(testing=True, config=dict(self.app.config))
+        client = worker.test_client()
+        client.set_cookie(PIN_COOKIE, pin.value)
+        tickets = client.get("/service_tickets/", headers=self.auth()).get_json()
+        self.assertEqual([t["description"] for t in tickets], ["Brakes"])
+
+    def test_batch_reads_after_write_use_primary(self):
+        res = self.client.post("/batch", headers=self.auth(), json={"requests": [
+            {"method": "POST", "path": "/service_tickets/",
+             "body": {"description": "Brakes", "description_of_issue": "Noise", "vehicle_id": self.vehicle_id}},
+            {"path": "/service_tickets/"},
+        ]})
+        responses = res.get_json()["responses"]
+        self.assertEqual([t["description"] for t in responses[1]["body"]], ["Brakes"])
+        self.assertNotIn("Set-Cookie", responses[0]["headers"])
+        self.assertIsNotNone(self.client.get_cookie(PIN_COOKIE))
+
+    def test_forged_or_expired_pin_is_ignored(self):
+        self.client.set_cookie(PIN_COOKIE, "forged")
+        self.client.get("/service_tickets/", headers=self.auth())
+        self.assertEqual(set(self.executed), {"replica"})
+
+        self.app.config["DB_REPLICA_STICKY_SECONDS"] = 1
+        with self.app.app_context():
+            expired = URLSafeTimedSerializer(self.app.secret_key, salt="db-primary-pin").dumps(1)
+        time.sleep(2.1)
+        self.executed.clear()
+        self.client.set_cookie(PIN_COOKIE, expired)
+        self.client.get("/service_tickets/", headers=self.auth())
+        self.assertEqual(set(self.executed), {"replica"})
+
+    def test_cache_fill_after_write_reads_primary(self):
+        self.client.get("/inventory/")
+        self.client.post(
+            "/inventory/",
+            json={"name": "Belt", "price": 9.0},
+            headers={"Authorization": f"Bearer {encode_mechanic_token(1)}"}
+        )
+
+        # A different (unpinned) client refills the cache; the replica
+        # lacks the new part, so the fill must come from the primary
+        names = [p["name"] for p in self.client.get("/inventory/").get_json()]
+        self.assertEqual(names, ["Filter", "Belt"])
+
+
+if __name__ == "__main__":
+    unittest.main()
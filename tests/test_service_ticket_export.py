@@ -0,0 +1,131 @@
+import csv
+import io
+import json
+import os
+import tracemalloc
+import unittest
+from datetime import datetime, timedelta
+from app import create_app, db
+from app.models import ServiceTicket
+from app.utils.util import encode_mechanic_token, encode_token
+
+START = datetime(2025, 1, 1)
+
+
+def insert_tickets(count, chunk=50000):
+    for first in range(0, count, chunk):
+        db.session.execute(db.insert(ServiceTicket.__table__), [
+            {"vehicle_id": 1, "description": f"Ticket {i}", "description_of_issue": "Noise",
+             "status": ("Pending", "Completed")[i % 2], "created_at": START + timedelta(days=i)}
+            for i in range(first, min(first + chunk, count))
+        ])
+    db.session.commit()
+
+
+class ExportTestCase(unittest.TestCase):
+    rows = 10
+
+    def setUp(self):
+        self.app = create_app(testing=True, config={"SERVICE_TICKET_EXPORT_BATCH_SIZE": 3})
+        self.client = self.app.test_client()
+        self.headers = {"Authorization": f"Bearer {encode_mechanic_token(1)}"}
+
+        with self.app.app_context():
+            db.create_all()
+            insert_tickets(self.rows)
+
+    def tearDown(self):
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def export(self, query=""):
+        return self.client.get(f"/service_tickets/export{query}", headers=self.headers)
+
+
+class TestServiceTicketExport(ExportTestCase):
+
+    def test_csv_export(self):
+        res = self.export()
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.mimetype, "text/csv")
+        self.assertTrue(res.is_streamed)
+        rows = list(csv.DictReader(io.StringIO(res.get_data(as_text=True))))
+        self.assertEqual([int(r["id"]) for r in rows], list(range(1, 11)))
+        self.assertEqual(rows[0]["created_at"], "2025-01-01T00:00:00")
+        self.assertEqual(rows[0]["final_cost"], "")
+
+    def test_ndjson_export(self):
+        res = self.export("?format=ndjson")
+        self.assertEqual(res.mimetype, "application/x-ndjson")
+        rows = [json.loads(line) for line in res.get_data(as_text=True).splitlines()]
+        self.assertEqual(len(rows), 10)
+        self.assertEqual(rows[1]["status"], "Completed")
+        self.assertEqual(rows[1]["created_at"], "2025-01-02T00:00:00")
+        self.assertIsNone(rows[1]["final_cost"])
+
+    def test_status_and_date_filters(self):
+        res = self.export("?format=ndjson&status=Pending&created_from=2025-01-03&created_to=2025-01-08")
+        ids = [json.loads(line)["id"] for line in res.get_data(as_text=True).splitlines()]
+        self.assertEqual(ids, [3, 5, 7])
+
+    def test_empty_csv_export_has_header(self):
+        res = self.export("?status=Cancelled")
+        self.assertEqual(res.get_data(as_text=True).strip().split(",")[0], "id")
+
+    def test_bad_requests(self):
+        self.assertEqual(self.export("?format=xml").status_code, 400)
+        self.assertEqual(self.export("?created_from=yesterday").status_code, 400)
+
+    def test_requires_mechanic_token(self):
+        res = self.client.get(
+            "/service_tickets/export",
+            headers={"Authorization": f"Bearer {encode_token(1)}"}
+        )
+        self.assertEqual(res.status_code, 403)
+
+
+class TestServiceTicketExportMemory(ExportTestCase):
+    """
+    Peak Python heap while streaming an export must stay flat: bounded by
+    one cursor batch, not by the number of tickets.
+    """
+    rows = 20000
+    peak_limit = 8 * 1024 * 1024
+
+    def setUp(self):
+        super().setUp()
+        self.app.config["SERVICE_TICKET_EXPORT_BATCH_SIZE"] = 1000
+
+    def measure_peak(self, fmt):
+        tracemalloc.start()
+        try:
+            res = self.client.get(
+                f"/service_tickets/export?format={fmt}",
+                headers=self.headers,
+                buffered=False
+            )
+            lines = sum(chunk.count(b"\n") for chunk in res.response)
+            res.close()
+            return lines, tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    def test_csv_peak_memory(self):
+        lines, peak = self.measure_peak("csv")
+        self.assertEqual(lines, self.rows + 1)
+        self.assertLess(peak, self.peak_limit)
+
+    def test_ndjson_peak_memory(self):
+        lines, peak = self.measure_peak("ndjson")
+        self.assertEqual(lines, self.rows)
+        self.assertLess(peak, self.peak_limit)
+
+
+@unittest.skipUnless(os.environ.get("RUN_SLOW_TESTS"), "set RUN_SLOW_TESTS=1 to export 1M rows")
+class TestServiceTicketExportMillionRows(TestServiceTicketExportMemory):
+    rows = 1_000_000
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,246 @@
+import unittest
+from sqlalchemy import event
+from app import create_app, db
+from app.models import Customer, Vehicle, ServiceTicket, Mechanic, Inventory
+from app.utils.util import encode_token
+
+
+class TestServiceTickets(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app(testing=True)
+        self.client = self.app.test_client()
+
+        with self.app.app_context():
+            db.create_all()
+
+    def tearDown(self):
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    # -----------------------------
+    # Helpers
+    # -----------------------------
+    def seed_customer(self, ticket_count, email="owner@shop.com"):
+        with self.app.app_context():
+            customer = Customer(name="Owner", email=email, password="x")
+            vehicle = Vehicle(
+                make="Ford", model="F-150", year=2020,
+                vin=f"VIN{email[:10]}", customer=customer
+            )
+            mechanics = [
+                Mechanic(name=f"Mech {i}", email=f"{email}.m{i}", password="x")
+                for i in range(2)
+            ]
+            parts = [Inventory(name=f"Part {i}", price=10.0 + i) for i in range(2)]
+            for i in range(ticket_count):
+                vehicle.service_tickets.append(ServiceTicket(
+                    description=f"Ticket {i}",
+                    description_of_issue="Noise",
+                    mechanics=list(mechanics),
+                    inventory=list(parts)
+                ))
+            db.session.add(customer)
+            db.session.commit()
+            return customer.id
+
+    def count_statements(self, fn):
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        with self.app.app_context():
+            engine = db.engine
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            result = fn()
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+        return result, len(statements)
+
+    def get_tickets(self, customer_id):
+        token = encode_token(customer_id)
+        return self.client.get(
+            "/service_tickets/",
+            headers={"Authorization": f"Bearer {token}"}
+        )
+
+    def get_my_tickets(self, customer_id, **params):
+        return self.client.get(
+            "/customers/my-tickets",
+            query_string=params,
+            headers={"Authorization": f"Bearer {encode_token(customer_id)}"}
+        )
+
+    # -----------------------------
+    # Tests
+    # -----------------------------
+    def test_get_tickets_includes_links(self):
+        customer_id = self.seed_customer(2)
+        res = self.get_tickets(customer_id)
+        self.assertEqual(res.status_code, 200)
+
+        tickets = res.get_json()
+        self.assertEqual(len(tickets), 2)
+        self.assertEqual(len(tickets[0]["mechanics"]), 2)
+        self.assertEqual(len(tickets[0]["inventory"]), 2)
+
+    def test_get_tickets_query_count_is_constant(self):
+        small_id = self.seed_customer(1, email="small@shop.com")
+        large_id = self.seed_customer(25, email="large@shop.com")
+
+        small_res, small_count = self.count_statements(lambda: self.get_tickets(small_id))
+        large_res, large_count = self.count_statements(lambda: self.get_tickets(large_id))
+
+        self.assertEqual(len(small_res.get_json()), 1)
+        self.assertEqual(len(large_res.get_json()), 25)
+        self.assertEqual(small_count, large_count)
+
+    def test_edit_ticket_returns_links(self):
+        customer_id = self.seed_customer(1)
+        with self.app.app_context():
+            ticket = ServiceTicket.query.first()
+            ticket_id = ticket.id
+            removed_mech, kept_mech = [m.id for m in ticket.mechanics]
+            new_part = Inventory(name="Filter", price=5.0)
+            db.session.add(new_part)
+            db.session.commit()
+            new_part_id = new_part.id
+
+        token = encode_token(customer_id)
+        res = self.client.put(
+            f"/service_tickets/{ticket_id}/edit",
+            json={"remove_mechanics": [removed_mech], "add_parts": [new_part_id]},
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        self.assertEqual(res.status_code, 200)
+
+        data = res.get_json()
+        self.assertEqual([m["id"] for m in data["mechanics"]], [kept_mech])
+        self.assertIn(new_part_id, [p["id"] for p in data["inventory"]])
+        self.assertEqual(len(data["inventory"]), 3)
+
+    def test_edit_ticket_query_count_is_constant(self):
+        customer_id = self.seed_customer(1)
+        with self.app.app_context():
+            ticket_id = ServiceTicket.query.first().id
+            mechanics = [
+                Mechanic(name=f"Extra {i}", email=f"extra{i}@shop.com", password="x")
+                for i in range(30)
+            ]
+            parts = [Inventory(name=f"Extra {i}", price=1.0) for i in range(30)]
+            db.session.add_all(mechanics + parts)
+            db.session.commit()
+            mechanic_ids = [m.id for m in mechanics]
+            part_ids = [p.id for p in parts]
+
+        token = encode_token(customer_id)
+
+        def edit(payload):
+            return self.client.put(
+                f"/service_tickets/{ticket_id}/edit",
+                json=payload,
+                headers={"Authorization": f"Bearer {token}"}
+            )
+
+        _, small_count = self.count_statements(lambda: edit({
+            "add_mechanics": mechanic_ids[:1],
+            "add_parts": part_ids[:1]
+        }))
+        res, large_count = self.count_statements(lambda: edit({
+            "add_mechanics": mechanic_ids[1:] + [9999],
+            "remove_mechanics": mechanic_ids[:1],
+            "add_parts": part_ids[1:],
+            "remove_parts": part_ids[:1]
+        }))
+
+        self.assertEqual(res.status_code, 200)
+        data = res.get_json()
+        self.assertEqual(len(data["mechanics"]), 2 + 29)
+        self.assertEqual(len(data["inventory"]), 2 + 29)
+        # The larger edit also removes, which adds one DELETE per link table
+        self.assertLessEqual(large_count, small_count + 2)
+
+    def test_my_tickets_query_count_is_constant(self):
+        small_id = self.seed_customer(1, email="small@shop.com")
+        large_id = self.seed_customer(25, email="large@shop.com")
+
+        def my_tickets(customer_id):
+            token = encode_token(customer_id)
+            return self.client.get(
+                "/customers/my-tickets",
+                headers={"Authorization": f"Bearer {token}"}
+            )
+
+        _, small_count = self.count_statements(lambda: my_tickets(small_id))
+        large_res, large_count = self.count_statements(lambda: my_tickets(large_id))
+
+        self.assertEqual(len(large_res.get_json()), 25)
+        self.assertEqual(small_count, large_count)
+        # Cache version lookup + the page
+        self.assertEqual(large_count, 2)
+
+    def test_my_tickets_cursor_pagination_and_status(self):
+        customer_id = self.seed_customer(5)
+        with self.app.app_context():
+            ticket_ids = db.session.scalars(db.select(ServiceTicket.id).order_by(ServiceTicket.id)).all()
+            for ticket_id in ticket_ids[1::2]:
+                db.session.get(ServiceTicket, ticket_id).status = "Completed"
+            db.session.commit()
+
+        pages, cursor = [], None
+        while True:
+            res = self.get_my_tickets(customer_id, limit=2, **({"cursor": cursor} if cursor else {}))
+            self.assertEqual(res.status_code, 200)
+            pages.append([t["id"] for t in res.get_json()])
+            cursor = res.headers.get("X-Next-Cursor")
+            if cursor is None:
+                break
+        self.assertEqual(pages, [ticket_ids[0:2], ticket_ids[2:4], ticket_ids[4:]])
+
+        res = self.get_my_tickets(customer_id, status="Completed")
+        self.assertEqual([t["id"] for t in res.get_json()], ticket_ids[1::2])
+        self.assertEqual({t["status"] for t in res.get_json()}, {"Completed"})
+
+        for params in [{"limit": 0}, {"limit": 201}, {"cursor": "abc"}]:
+            self.assertEqual(self.get_my_tickets(customer_id, **params).status_code, 400)
+
+    def test_my_tickets_cache_is_per_customer(self):
+        customer_id = self.seed_customer(2)
+        other_id = self.seed_customer(1, email="other@shop.com")
+        self.get_my_tickets(customer_id)
+
+        # Another customer's new ticket leaves this customer's entry cached
+        with self.app.app_context():
+            other_vehicle = db.session.scalar(db.select(Vehicle).filter_by(customer_id=other_id))
+            other_vehicle.service_tickets.append(ServiceTicket(description="Other", description_of_issue="Noise"))
+            db.session.commit()
+        res, count = self.count_statements(lambda: self.get_my_tickets(customer_id))
+        # Only the cache version lookup
+        self.assertEqual(count, 1)
+        self.assertEqual(len(res.get_json()), 2)
+
+        # Their own ticket changes invalidate it
+        with self.app.app_context():
+            vehicle = db.session.scalar(db.select(Vehicle).filter_by(customer_id=customer_id))
+            vehicle.service_tickets[0].status = "Completed"
+            db.session.add(ServiceTicket(description="New", description_of_issue="Leak", vehicle_id=vehicle.id))
+            db.session.commit()
+        res = self.get_my_tickets(customer_id)
+        self.assertEqual([t["status"] for t in res.get_json()], ["Completed", "Pending", "Pending"])
+
+        # ...as does moving a vehicle (and its tickets) to another customer
+        with self.app.app_context():
+            db.session.scalar(db.select(Vehicle).filter_by(customer_id=customer_id)).customer_id = other_id
+            db.session.commit()
+        self.assertEqual(self.get_my_tickets(customer_id).get_json(), [])
+        self.assertEqual(len(self.get_my_tickets(other_id).get_json()), 5)
+
+    def test_my_tickets_unknown_customer(self):
+        self.assertEqual(self.get_my_tickets(999).status_code, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import json
+import subprocess
+import sys
+import unittest
+from benchmarks.bench_startup import import_report, measure
+
+# Modules that must not be loaded just to build the app
+DEFERRED = [
+    "flask_migrate",
+    "alembic",
+    "jose.jwt",
+    "app.customers.schemas",
+    "app.inventory.schemas",
+    "app.inventory.importer",
+    "app.mechanics.schemas",
+    "app.vehicles.schemas",
+]
+
+PROBE = """
+import json, sys
+from app import create_app, db
+from app.utils.util import encode_token
+app = create_app(testing=True)
+loaded = {"create_app": [m for m in %(deferred)r if m in sys.modules]}
+with app.app_context():
+    db.create_all()
+client = app.test_client()
+client.get("/inventory/")
+client.get("/vehicles/", headers={"Authorization": "Bearer " + encode_token(1)})
+loaded["requests"] = [m for m in %(deferred)r if m in sys.modules]
+print(json.dumps(loaded))
+"""
+
+
+class TestLazyStartup(unittest.TestCase):
+
+    def test_schemas_and_cli_modules_load_on_first_use(self):
+        result = subprocess.run(
+            [sys.executable, "-c", PROBE % {"deferred": DEFERRED}],
+            capture_output=True, text=True, check=True
+        )
+        loaded = json.loads(result.stdout.strip().splitlines()[-1])
+
+        self.assertEqual(loaded["create_app"], [])
+        self.assertEqual(
+            loaded["requests"],
+            ["jose.jwt", "app.inventory.schemas", "app.vehicles.schemas"]
+        )
+
+    def test_startup_benchmark_reports(self):
+        (run,) = measure(1)
+        self.assertGreater(run["import_ms"], 0)
+        self.assertGreater(run["create_app_ms"], 0)
+
+        packages, app_modules = import_report(top=5)
+        self.assertIn("sqlalchemy", dict(packages))
+        self.assertTrue(all(name.startswith("app") for name, _ in app_modules))
+
+
+if __name__ == "__main__":
+    unittest.main()
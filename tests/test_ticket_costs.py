@@ -0,0 +1,171 @@
+import unittest
+from sqlalchemy import event
+from app import create_app, db
+from app.models import (
+    Customer,
+    Inventory,
+    Mechanic,
+    ServiceTicket,
+    ServiceTicketMechanic,
+    Vehicle,
+    service_ticket_inventory,
+)
+from app.utils.util import encode_mechanic_token, encode_token
+
+
+class TestTicketCosts(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app(testing=True)
+        self.client = self.app.test_client()
+        self.headers = {"Authorization": f"Bearer {encode_mechanic_token(1)}"}
+
+        with self.app.app_context():
+            db.create_all()
+            customer = Customer(name="Owner", email="owner@shop.com", password="x")
+            vehicle = Vehicle(make="Ford", model="F-150", year=2020, vin="VIN1", customer=customer)
+            db.session.add_all([customer, vehicle])
+            db.session.flush()
+            # 41,600 / 2,080 hours = 20.00 and 30.00 per hour
+            db.session.add_all([
+                Mechanic(id=1, name="Ann", email="ann@shop.com", password="x", salary=41600),
+                Mechanic(id=2, name="Bob", email="bob@shop.com", password="x", salary=62400),
+                Inventory(id=1, name="Brake Pad", price=40.0),
+                Inventory(id=2, name="Rotor", price=85.5),
+            ])
+            for ticket_id in (1, 2, 3):
+                db.session.add(ServiceTicket(
+                    id=ticket_id, vehicle_id=vehicle.id,
+                    description=f"Ticket {ticket_id}", description_of_issue="Noise"
+                ))
+            db.session.flush()
+            db.session.execute(db.insert(service_ticket_inventory), [
+                {"ticket_id": 1, "inventory_id": 1},
+                {"ticket_id": 1, "inventory_id": 2},
+                {"ticket_id": 2, "inventory_id": 1},
+            ])
+            db.session.add_all([
+                ServiceTicketMechanic(ticket_id=1, mechanic_id=1, hours_worked=2),
+                ServiceTicketMechanic(ticket_id=1, mechanic_id=2, hours_worked=1.5),
+                ServiceTicketMechanic(ticket_id=2, mechanic_id=2, hours_worked=None),
+            ])
+            db.session.commit()
+
+    def tearDown(self):
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def count_statements(self, fn):
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        with self.app.app_context():
+            engine = db.engine
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            result = fn()
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+        return result, len(statements)
+
+    def cost(self, ticket_id):
+        return self.client.get(f"/service_tickets/{ticket_id}/cost", headers=self.headers)
+
+    def bulk(self, ticket_ids):
+        return self.client.post("/service_tickets/costs", json={"ticket_ids": ticket_ids}, headers=self.headers)
+
+    # -----------------------------
+    # Tests
+    # -----------------------------
+    def test_single_ticket_breakdown(self):
+        res = self.cost(1)
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json, {
+            "ticket_id": 1,
+            "parts_cost": 125.5,
+            "parts_count": 2,
+            "labor_hours": 3.5,
+            "labor_cost": 85.0,
+            "total_cost": 210.5,
+        })
+
+    def test_ticket_without_links_costs_nothing(self):
+        self.assertEqual(self.cost(3).json["total_cost"], 0)
+        self.assertEqual(self.cost(99).status_code, 404)
+
+    def test_bulk_uses_one_aggregate_query(self):
+        res, count = self.count_statements(lambda: self.bulk([2, 1, 99, 3, 1]))
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual([c["ticket_id"] for c in res.json["costs"]], [2, 1, 3])
+        self.assertEqual(res.json["costs"][0]["total_cost"], 40.0)
+        self.assertEqual(res.json["missing"], [99])
+        # Cache version lookup + the aggregate
+        self.assertEqual(count, 2)
+
+    def test_cached_per_ticket(self):
+        self.cost(1)
+        res, count = self.count_statements(lambda: self.bulk([1, 2]))
+        self.assertEqual(count, 2)
+        res, count = self.count_statements(lambda: self.bulk([1, 2]))
+        self.assertEqual(count, 1)
+        self.assertEqual(res.json["costs"][1]["total_cost"], 40.0)
+
+    def test_part_price_change_invalidates(self):
+        self.cost(1)
+        self.client.put("/inventory/2", json={"price": 100.0}, headers=self.headers)
+        self.assertEqual(self.cost(1).json["parts_cost"], 140.0)
+
+    def test_link_change_invalidates(self):
+        self.cost(2)
+        res = self.client.put(
+            "/service_tickets/2/edit",
+            json={"add_parts": [2]},
+            headers={"Authorization": f"Bearer {encode_token(1)}"}
+        )
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(self.cost(2).json["parts_cost"], 125.5)
+
+    def test_salary_change_invalidates(self):
+        self.cost(1)
+        with self.app.app_context():
+            db.session.get(Mechanic, 1).salary = 83200
+            db.session.commit()
+        self.assertEqual(self.cost(1).json["labor_cost"], 125.0)
+
+    def test_unrelated_writes_keep_cached_costs(self):
+        self.bulk([1, 2])
+        with self.app.app_context():
+            db.session.get(Mechanic, 1).name = "Ann B"
+            db.session.get(Inventory, 1).name = "Brake Pads"
+            db.session.add(ServiceTicketMechanic(ticket_id=3, mechanic_id=1, hours_worked=1))
+            db.session.commit()
+        res, count = self.count_statements(lambda: self.bulk([1, 2]))
+        # Version lookup only; neither ticket's cost was touched
+        self.assertEqual(count, 1)
+        self.assertEqual(self.cost(3).json["labor_cost"], 20.0)
+
+    def test_link_change_invalidates_only_that_ticket(self):
+        self.bulk([1, 2])
+        res = self.client.post(
+            "/service_ticket_mechanics/",
+            json={"service_ticket_id": 2, "mechanic_id": 1, "hours_worked": 1},
+            headers=self.headers
+        )
+        self.assertEqual(res.status_code, 201)
+        res, count = self.count_statements(lambda: self.bulk([1, 2]))
+        # Version lookup + the aggregate for ticket 2 alone
+        self.assertEqual(count, 2)
+        self.assertEqual(res.json["costs"][1]["labor_cost"], 20.0)
+
+    def test_bad_requests(self):
+        self.assertEqual(self.bulk("1,2").status_code, 400)
+        self.assertEqual(self.bulk([1, "2"]).status_code, 400)
+        res = self.client.get("/service_tickets/1/cost", headers={"Authorization": f"Bearer {encode_token(1)}"})
+        self.assertEqual(res.status_code, 403)
+
+
+if __name__ == "__main__":
+    unittest.main()